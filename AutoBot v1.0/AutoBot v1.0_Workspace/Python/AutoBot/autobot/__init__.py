@@ -0,0 +1,15 @@
+# autobot/__init__.py
+"""
+AUTOBOT host software.
+
+  autobot.ingest  serial framing, decoding, IngestCore fan-out, SerialLink,
+                  shared-memory ring, asyncio engine
+  autobot.sinks   CSV logger (threaded) and asyncio sinks
+  autobot.cloud   CloudBackend (Firebase / in-memory), battery push, block listener
+  autobot.gui     CustomTkinter dashboard (python -m autobot.gui)
+
+Importing autobot or any subpackage has no side effects: no Tk root, no
+Firebase app and no threads until something is started explicitly.
+"""
+
+__version__ = "1.0"
@@ -0,0 +1,6 @@
+# autobot/cloud/__init__.py
+"""Cloud backends. firebase_admin is only imported by init_firebase()."""
+
+from autobot.cloud.backend import CloudBackend, ReferenceBackend, open_backend
+from autobot.cloud.firebase import BatteryPusher, BlockListener, FirebaseBackend, init_firebase
+from autobot.cloud.memory import MemoryBackend, MemoryDb, MemoryReference
@@ -0,0 +1,63 @@
+# autobot/cloud/backend.py
+"""
+The cloud interface BatteryPusher, BlockListener, the GUI and the daemon talk
+to. Paths are slash-separated Realtime Database paths.
+
+  - CloudBackend: get / set / update / listen(path, callback) / close
+  - ReferenceBackend: CloudBackend over anything with firebase_admin.db's
+    reference(path) API; FirebaseBackend (autobot.cloud.firebase) and
+    MemoryBackend (autobot.cloud.memory) are built on it
+  - open_backend(spec): "firebase" or "memory[:latency_s]"
+
+listen() callbacks get events with event_type ("put" / "patch"), path
+(relative to the listened node) and data, on a thread of the backend's.
+"""
+
+BACKENDS = ("firebase", "memory")
+
+
+class CloudBackend:
+    def get(self, path):
+        raise NotImplementedError
+
+    def set(self, path, value):
+        raise NotImplementedError
+
+    def update(self, path, values):
+        raise NotImplementedError
+
+    def listen(self, path, callback):
+        """Start streaming events below path; returns a registration with close()."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class ReferenceBackend(CloudBackend):
+    def __init__(self, db):
+        self.db = db
+
+    def get(self, path):
+        return self.db.reference(path).get()
+
+    def set(self, path, value):
+        self.db.reference(path).set(value)
+
+    def update(self, path, values):
+        self.db.reference(path).update(values)
+
+    def listen(self, path, callback):
+        return self.db.reference(path).listen(callback)
+
+
+def open_backend(spec="firebase", credentials=None):
+    """firebase_admin is only imported for "firebase"."""
+    name, _, arg = spec.partition(":")
+    if name == "firebase":
+        from autobot.cloud.firebase import FIREBASE_CREDENTIALS, FirebaseBackend
+        return FirebaseBackend(credentials or FIREBASE_CREDENTIALS)
+    if name == "memory":
+        from autobot.cloud.memory import MemoryBackend
+        return MemoryBackend(latency=float(arg or 0.0))
+    raise ValueError(f"cloud backend must be one of {BACKENDS}, got {spec!r}")
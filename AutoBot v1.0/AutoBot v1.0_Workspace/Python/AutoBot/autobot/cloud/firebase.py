@@ -0,0 +1,168 @@
+# autobot/cloud/firebase.py
+"""
+Firebase Realtime Database glue. firebase_admin is imported when init_firebase()
+runs, not at import time, so headless and benchmark runs never touch it.
+
+  - FirebaseBackend: CloudBackend on the firebase_admin db module
+  - BatteryPusher: IngestCore subscriber; its own worker writes the battery
+    percentage to /AUTOBOT/AUTOBOT/Battery when it changes, rate limited
+  - BlockListener: streams PickUpBlock / DropBlock deltas with ref.listen()
+    and reports changes
+
+Both take a CloudBackend (autobot.cloud.backend), e.g. MemoryBackend offline.
+"""
+
+import threading
+import time
+
+from autobot.cloud.backend import ReferenceBackend
+from autobot.ingest.buffers import LatestSlot
+
+FIREBASE_CREDENTIALS = "autobot-20dfa-firebase-adminsdk-fbsvc-6972378650.json"
+FIREBASE_URL = "https://autobot-20dfa-default-rtdb.firebaseio.com/"
+ROOT_PATH = "/AUTOBOT/AUTOBOT"
+BATTERY_PATH = ROOT_PATH + "/Battery"
+BLOCK_KEYS = ("PickUpBlock", "DropBlock")
+CLOUD_PUSH_INTERVAL = 0.5
+
+
+def init_firebase(cred_path=FIREBASE_CREDENTIALS, url=FIREBASE_URL):
+    """Initialize the default firebase_admin app once; returns the db module."""
+    import firebase_admin
+    from firebase_admin import credentials, db
+
+    if not firebase_admin._apps:
+        firebase_admin.initialize_app(credentials.Certificate(cred_path), {"databaseURL": url})
+    return db
+
+
+class FirebaseBackend(ReferenceBackend):
+    def __init__(self, cred_path=FIREBASE_CREDENTIALS, url=FIREBASE_URL):
+        super().__init__(init_firebase(cred_path, url))
+
+
+class BatteryPusher:
+    """
+    The reader thread only compares battery_pct with the last value it saw; on a
+    change it publishes it to a LatestSlot and wakes the worker. The worker writes
+    at most once per `interval`: changes arriving meanwhile are coalesced into the
+    newest one, and a value equal to what is already stored is not sent. A failed
+    write is retried after `interval`. Blocking network calls never run on the
+    reader or Tk thread.
+    """
+
+    def __init__(self, backend, path=BATTERY_PATH, interval=CLOUD_PUSH_INTERVAL):
+        self.backend = backend
+        self.path = path
+        self.interval = interval
+        self.slot = LatestSlot()
+        self.changes = 0        # percent changes seen by submit()
+        self.writes = 0
+        self.failures = 0
+        self._seen_pct = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # -------- IngestCore subscriber (reader thread) --------
+    def submit(self, rec, rx_ns):
+        pct = rec.battery_pct
+        if pct != self._seen_pct:
+            self._seen_pct = pct
+            self.changes += 1
+            self.slot.publish(pct)
+            self._wake.set()
+
+    # -------- worker --------
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="firebase-battery", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        self._wake.set()
+        if timeout is not None and self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        seen = 0
+        published = None
+        next_write = 0.0
+        while not self._stop.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            delay = next_write - time.monotonic()
+            if delay > 0 and self._stop.wait(delay):
+                break
+            newer = self.slot.get_if_newer(seen)
+            if not newer:
+                continue
+            seen, pct = newer
+            if pct == published:
+                continue
+            next_write = time.monotonic() + self.interval
+            try:
+                self.backend.set(self.path, f"{pct}%")
+                published = pct
+                self.writes += 1
+            except Exception as e:
+                self.failures += 1
+                print("Battery Firebase update failed:", e)
+                seen = 0            # retry the newest value on the next round
+                self._wake.set()
+
+
+class BlockListener:
+    """
+    Calls on_change(pickup, drop) whenever either value changes, from the
+    listener's thread: the GUI hands it to the Tk thread (AutobotGui.set_blocks).
+
+    listen() sends the node once, then only the writes below it ("put" /
+    "patch" with a path relative to the node), so a task reaches us one network
+    trip after it is written instead of on the next full-subtree poll.
+    Writes to other children (Battery, ...) are ignored.
+    """
+
+    def __init__(self, backend, on_change, path=ROOT_PATH, keys=BLOCK_KEYS):
+        self.backend = backend
+        self.on_change = on_change
+        self.path = path
+        self.keys = keys
+        self.events = 0
+        self._state = dict.fromkeys(keys)
+        self._prev = None
+        self._registration = None
+
+    def start(self):
+        self._registration = self.backend.listen(self.path, self._on_event)
+        return self
+
+    def stop(self):
+        if self._registration is not None:
+            self._registration.close()
+            self._registration = None
+
+    def _on_event(self, event):
+        self.events += 1
+        try:
+            parts = [p for p in (event.path or "/").split("/") if p]
+            if event.event_type == "patch":
+                for key, value in (event.data or {}).items():
+                    self._apply(parts + [p for p in key.split("/") if p], value)
+            else:
+                self._apply(parts, event.data)
+            blocks = tuple("-" if self._state[k] is None else self._state[k] for k in self.keys)
+            if blocks != self._prev:
+                self._prev = blocks
+                self.on_change(*blocks)
+        except Exception as e:
+            print("Firebase error:", e)
+
+    def _apply(self, parts, value):
+        if not parts:
+            data = value if isinstance(value, dict) else {}
+            self._state = {k: data.get(k) for k in self.keys}
+        elif parts[0] in self._state and len(parts) == 1:
+            self._state[parts[0]] = value
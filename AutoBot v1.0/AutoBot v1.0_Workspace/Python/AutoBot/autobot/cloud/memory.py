@@ -0,0 +1,180 @@
+# autobot/cloud/memory.py
+"""
+In-memory stand-in for the firebase_admin.db module, for benchmarks and runs
+without credentials or network:
+
+    db = MemoryDb({"AUTOBOT": {"AUTOBOT": {"PickUpBlock": 3}}}, latency=0.2)
+    db.reference("/AUTOBOT/AUTOBOT/Battery").set("87%")
+
+MemoryBackend is the CloudBackend on top of it (open_backend("memory:0.2")).
+
+reference(path) supports get / set / update / delete / child / listen on a
+nested-dict tree, like the Realtime Database. `latency` seconds are slept on
+every call (outside the lock) to model a slow link; `log` records
+(op, path, value).
+
+listen(callback) follows firebase_admin: callback(event) runs on a thread of
+its own, first with a "put" of the whole node at path "/", then with one
+"put" / "patch" per write below it (path relative to the node). Events are
+delivered `latency` seconds after the write. Returns a registration with close().
+"""
+
+import copy
+import queue
+import threading
+import time
+from collections import namedtuple
+
+from autobot.cloud.backend import ReferenceBackend
+
+MemoryEvent = namedtuple("MemoryEvent", "event_type path data")
+
+
+def _parts(path):
+    return [p for p in path.split("/") if p]
+
+
+class MemoryDb:
+    def __init__(self, data=None, latency=0.0):
+        self.root = copy.deepcopy(data) if data is not None else {}
+        self.latency = latency
+        self.log = []
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def reference(self, path="/"):
+        return MemoryReference(self, path)
+
+    def _call(self, op, path, value=None):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.log.append((op, path, value))
+            parts = _parts(path)
+            result = getattr(self, "_" + op)(parts, value)
+            if op != "get":
+                self._notify(op, parts, value)
+            return result
+
+    # ---------------- streaming ----------------
+    def _listen(self, path, callback):
+        with self._lock:
+            registration = MemoryListener(self, _parts(path), callback)
+            self._listeners.append(registration)
+            registration.push(MemoryEvent("put", "/", self._get(registration.parts, None)))
+        return registration
+
+    def _notify(self, op, parts, value):
+        for registration in self._listeners:
+            base = registration.parts
+            if parts[:len(base)] == base:
+                rel = "/" + "/".join(parts[len(base):])
+                if op == "update":
+                    event = MemoryEvent("patch", rel, copy.deepcopy(value))
+                else:
+                    event = MemoryEvent("put", rel, copy.deepcopy(value) if op == "set" else None)
+            elif base[:len(parts)] == parts:
+                event = MemoryEvent("put", "/", self._get(base, None))
+            else:
+                continue
+            registration.push(event)
+
+    def _get(self, parts, _):
+        node = self.root
+        for p in parts:
+            if not isinstance(node, dict) or p not in node:
+                return None
+            node = node[p]
+        return copy.deepcopy(node)
+
+    def _set(self, parts, value):
+        if not parts:
+            self.root = copy.deepcopy(value) if isinstance(value, dict) else {}
+            return
+        node = self.root
+        for p in parts[:-1]:
+            if not isinstance(node.get(p), dict):
+                node[p] = {}
+            node = node[p]
+        if value is None:
+            node.pop(parts[-1], None)
+        else:
+            node[parts[-1]] = copy.deepcopy(value)
+
+    def _update(self, parts, values):
+        for key, value in values.items():
+            self._set(parts + _parts(key), value)
+
+    def _delete(self, parts, _):
+        self._set(parts, None)
+
+
+class MemoryBackend(ReferenceBackend):
+    def __init__(self, data=None, latency=0.0):
+        super().__init__(MemoryDb(data, latency))
+
+    @property
+    def latency(self):
+        return self.db.latency
+
+    @latency.setter
+    def latency(self, seconds):
+        self.db.latency = seconds
+
+
+class MemoryReference:
+    def __init__(self, db, path):
+        self._db = db
+        self.path = "/" + "/".join(_parts(path))
+        self.key = _parts(path)[-1] if _parts(path) else None
+
+    def child(self, path):
+        return MemoryReference(self._db, self.path + "/" + path)
+
+    def get(self):
+        return self._db._call("get", self.path)
+
+    def set(self, value):
+        self._db._call("set", self.path, value)
+
+    def update(self, values):
+        self._db._call("update", self.path, values)
+
+    def delete(self):
+        self._db._call("delete", self.path)
+
+    def listen(self, callback):
+        return self._db._listen(self.path, callback)
+
+
+class MemoryListener:
+    def __init__(self, db, parts, callback):
+        self._db = db
+        self.parts = parts
+        self.callback = callback
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="memorydb-listen", daemon=True)
+        self._thread.start()
+
+    def push(self, event):
+        self._queue.put((time.monotonic() + self._db.latency, event))
+
+    def close(self):
+        with self._db._lock:
+            if self in self._db._listeners:
+                self._db._listeners.remove(self)
+        self._queue.put(None)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            due, event = item
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                self.callback(event)
+            except Exception as e:
+                print("[MemoryDb] listener error:", e)
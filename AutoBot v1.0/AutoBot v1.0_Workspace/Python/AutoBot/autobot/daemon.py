@@ -0,0 +1,181 @@
+# autobot/daemon.py
+"""
+Headless AUTOBOT daemon for display-less dock computers: serial ingest, CSV
+logging and the Firebase battery / task bridge, without importing Tk,
+customtkinter or matplotlib.
+
+    autobot-daemon --port /dev/ttyACM0 --csv /var/log/autobot/Autobot_Log.csv
+    autobot-daemon --port /dev/ttyACM0 --csv '' --columnar /var/log/autobot/session.acol
+    autobot-daemon --port /dev/ttyACM0 --records /var/log/autobot/session.rlog
+    autobot-daemon --port /dev/ttyACM0 --rotate-interval 3600 --rotate-mb 64 --codec gzip
+    python -m autobot.daemon --port /dev/pts/3 --raw --no-cloud
+    python -m autobot.daemon --port /dev/pts/3 --raw --cloud memory:0.1
+
+Serial ingest runs on the asyncio IngestEngine (autobot/ingest/engine.py) and
+starts first; the loggers are its sinks (LoggerSink), started and closed with
+it. firebase_admin (slow to import) is initialized on
+a background thread so it never delays the first frame. The event loop sleeps
+until the port is readable and the other threads wake a few times per second,
+so an idle daemon uses next to no CPU. If the port drops, the engine reopens
+it every --reconnect seconds until stopped (SIGINT / SIGTERM).
+"""
+
+import argparse
+import signal
+import threading
+import time
+
+from autobot.ingest.engine import IngestEngine
+from autobot.ingest.link import open_raw, open_serial
+from autobot.ingest.reader import READ_TIMEOUT
+from autobot.sinks.aio import LoggerSink
+from autobot.sinks.csv_log import CsvLogger
+from autobot.sinks.index import INDEX_BLOCK_ROWS
+
+DEFAULT_PORT = "/dev/ttyACM0"
+DEFAULT_BAUD = 115200
+DEFAULT_CSV = "Autobot_Log.csv"
+RECONNECT_INTERVAL = 2.0
+STATUS_INTERVAL = 60.0
+SIGNAL_CHECK_S = 0.5
+
+
+def start_cloud_bridge(source, spec="firebase", credentials=None):
+    """Battery push + block listener on open_backend(spec), initialized off the startup path.
+    source: anything with subscribe(fn), the daemon's IngestEngine or an IngestCore."""
+
+    def on_blocks(pickup, drop):
+        print(f"[Firebase] PickUpBlock={pickup} DropBlock={drop}")
+
+    def init():
+        try:
+            from autobot.cloud.backend import open_backend
+            from autobot.cloud.firebase import BatteryPusher, BlockListener
+            backend = open_backend(spec, credentials)
+            source.subscribe(BatteryPusher(backend).start().submit)
+            BlockListener(backend, on_blocks).start()
+            print(f"[Firebase] Bridge running ({spec})")
+        except Exception as e:
+            print("[Firebase] Disabled:", e)
+
+    threading.Thread(target=init, name="firebase-init", daemon=True).start()
+
+
+class Daemon:
+    def __init__(self, port, baud, csv_path, raw=False, reconnect=RECONNECT_INTERVAL, columnar_path=None,
+                 rotate_bytes=None, rotate_interval=None, codec="gzip", records_path=None,
+                 index_rows=INDEX_BLOCK_ROWS):
+        self.port = port
+        self.baud = baud
+        self.opener = open_raw if raw else open_serial
+        self.stop_event = threading.Event()
+        self.engine = IngestEngine(reconnect)
+        self.csv_logger = None
+        self.column_logger = None
+        self.record_logger = None
+        if csv_path:
+            self.csv_logger = CsvLogger(csv_path, max_bytes=rotate_bytes, rotate_interval=rotate_interval, codec=codec,
+                                       index_rows=index_rows)
+        if columnar_path:
+            from autobot.sinks.columnar import ColumnLogger     # numpy only when asked for
+            self.column_logger = ColumnLogger(columnar_path)
+        if records_path:
+            from autobot.sinks.recordlog import RecordLogger
+            self.record_logger = RecordLogger(records_path)
+        self.sinks = []
+        for logger in self.loggers():
+            logger.enabled.set()
+            self.sinks.append(self.engine.add_sink(LoggerSink(logger)))
+
+    def loggers(self):
+        return [logger for logger in (self.csv_logger, self.column_logger, self.record_logger) if logger is not None]
+
+    def start(self):
+        self.engine.add_port(self.port, self.opener, self.port, self.baud, READ_TIMEOUT)
+        self.engine.start_in_thread()
+        return self
+
+    def stop(self, *_):
+        self.stop_event.set()
+
+    def status(self):
+        engine = self.engine
+        rows = self.csv_logger.rows if self.csv_logger is not None else 0
+        state = "connected" if self.port in engine.sources else "disconnected"
+        status = f"[Daemon] {state}, {engine.frames} frames, {engine.errors} errors, {rows} rows logged"
+        if self.column_logger is not None:
+            status += f", {self.column_logger.rows} columnar"
+        if self.record_logger is not None:
+            status += f", {self.record_logger.rows} records"
+        return status
+
+    def run(self, seconds=0.0, status_interval=STATUS_INTERVAL):
+        """Print status lines until stop() (or for `seconds`); the engine reopens the port itself."""
+        t0 = time.monotonic()
+        end = t0 + seconds if seconds else None
+        next_status = t0 + status_interval
+        while True:
+            now = time.monotonic()
+            if end is not None and now >= end:
+                break
+            if now >= next_status:
+                print(self.status(), flush=True)
+                next_status = now + status_interval
+            # a signal that lands on another thread does not interrupt this wait, and Python only
+            # runs the handler on the main thread: wake every SIGNAL_CHECK_S to let it run
+            wake = min(next_status if end is None else min(next_status, end), now + SIGNAL_CHECK_S)
+            if self.stop_event.wait(wake - now):
+                break
+        self.close()
+
+    def close(self):
+        # the engine closes its sinks on the way out; each logger.close() waits up to 2 s
+        self.engine.stop()
+        self.engine.join(1.0 + 2.0 * len(self.sinks))
+        for sink in self.sinks:
+            logger = sink.logger
+            if not sink.complete:
+                print(f"[Daemon] {logger.label} log incomplete: {logger.failed} row(s) lost to write errors"
+                      f" ({logger.error}), {logger.ring.written - logger.committed - logger.failed} unwritten",
+                      flush=True)
+        print(self.status(), flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="autobot-daemon", description="AUTOBOT headless ingest / logging / cloud bridge")
+    parser.add_argument("--port", default=DEFAULT_PORT)
+    parser.add_argument("--baud", type=int, default=DEFAULT_BAUD)
+    parser.add_argument("--raw", action="store_true", help="open --port as a plain file (pty / FIFO), no pyserial")
+    parser.add_argument("--csv", default=DEFAULT_CSV, help="CSV log path ('' disables logging)")
+    parser.add_argument("--rotate-mb", type=float, default=0.0, help="rotate the CSV log at this size (0 = never)")
+    parser.add_argument("--rotate-interval", type=float, default=0.0,
+                        help="rotate the CSV log every this many wall-clock seconds (0 = never)")
+    parser.add_argument("--codec", choices=("gzip", "zstd"), default="gzip", help="compression for rotated segments")
+    parser.add_argument("--index-rows", type=int, default=INDEX_BLOCK_ROWS,
+                        help="rows per block of the CSV log's query index (0 = no index)")
+    parser.add_argument("--columnar", default="", help="columnar session log directory ('' disables it)")
+    parser.add_argument("--records", default="", help="fixed-record binary log for replay ('' disables it)")
+    parser.add_argument("--no-cloud", action="store_true", help="do not start the Firebase bridge")
+    parser.add_argument("--cloud", default="firebase", help="cloud backend: firebase or memory[:latency_s]")
+    parser.add_argument("--credentials", default=None, help="Firebase service account JSON")
+    parser.add_argument("--reconnect", type=float, default=RECONNECT_INTERVAL, help="seconds between reopen attempts")
+    parser.add_argument("--status", type=float, default=STATUS_INTERVAL, help="seconds between status lines")
+    parser.add_argument("--seconds", type=float, default=0.0, help="exit after this long (0 = run until stopped)")
+    args = parser.parse_args(argv)
+
+    daemon = Daemon(args.port, args.baud, args.csv, args.raw, args.reconnect, args.columnar,
+                    int(args.rotate_mb * 1e6) or None, args.rotate_interval or None, args.codec, args.records,
+                    args.index_rows).start()
+    signal.signal(signal.SIGTERM, daemon.stop)
+    if not args.no_cloud:
+        start_cloud_bridge(daemon.engine, args.cloud, args.credentials)
+    print(f"[Daemon] Ready (port {args.port}, csv {args.csv or 'off'}, cloud {'off' if args.no_cloud else 'starting'})", flush=True)
+
+    try:
+        daemon.run(args.seconds, args.status)
+    except KeyboardInterrupt:
+        daemon.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+# autobot/gui/__init__.py
+"""CustomTkinter dashboard. customtkinter / matplotlib load when main() runs."""
+
+
+def main(**kwargs):
+    from autobot.gui.app import main as run
+    run(**kwargs)
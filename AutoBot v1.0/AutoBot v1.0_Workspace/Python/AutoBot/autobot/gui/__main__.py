@@ -0,0 +1,6 @@
+# autobot/gui/__main__.py
+from autobot.gui import main
+
+# guarded: the ingest child process may import the main module again (spawn / forkserver)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,775 @@
+# autobot/gui/app.py
+"""
+AUTOBOT GUI with scalable font system (single FONT_SCALE knob).
+Border-only controls for Connect/Disconnect and Start/Stop. Nothing happens at
+import: main() creates the Tk root, wires the link's IngestCore -> GUI / CSV /
+Firebase subscribers and runs the mainloop. The port is read by an IngestEngine
+in a child process (autobot/ingest/shm.py ProcessLink) unless
+ingest_process=False, which runs the engine on a thread of the GUI process
+(autobot/ingest/engine.py EngineLink).
+"""
+
+import os
+import threading
+import time
+from tkinter import BOTH, LEFT, RIGHT, X, Y, Canvas, filedialog
+
+import customtkinter as ctk
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+from autobot.gui.channels import CHANNEL_GROUPS, ChannelHistory
+from autobot.gui.governor import FrameGovernor
+from autobot.gui.plot import BlitPlot, MultiChannelPlot, SessionPlot, autoscale_limits
+from autobot.gui.pyramid import load_csv_session
+from autobot.gui.series import SeriesRing
+from autobot.gui.viewmodel import LabelViewModel, text_setter
+from autobot.ingest.buffers import LatestSlot
+from autobot.ingest.engine import EngineLink
+from autobot.ingest.link import list_serial_ports
+from autobot.ingest.shm import ProcessLink
+from autobot.sinks.csv_log import CsvLogger
+
+# ---------------- CONFIG ----------------
+DEFAULT_COM = "COM16"
+DEFAULT_BAUD = 115200
+CSV_LOG_PATH = r"C:\Users\kaver\OneDrive\Desktop\C_files\Python\AutoBot\Autobot_Log.csv"
+BANNER_PATH = r"C:\Users\kaver\OneDrive\Desktop\C_files\Python\AutoBot\AUTOBOT_GUI_BANNER.jpg"
+GUI_MAX_FPS = 20.0
+BLOCKS_POLL_MS = 50
+SERIAL_READ_TIMEOUT = 0.1
+
+# ---------------- FONT CONFIG (CONTROLLED GLOBAL SCALING) ----------------
+FONT_SCALE = 1.2
+def fs(px):
+    return max(1, int(px * FONT_SCALE))
+
+FONT_HEADER = ("Ethnocentric", fs(50), "bold", "italic")
+FONT_SUBHEADER = ("Orbitron", fs(16))
+
+FONT_TITLE = ("Segoe UI", fs(14), "bold")
+FONT_SUBTITLE = ("Segoe UI", fs(12), "bold")
+FONT_TILE_TITLE = ("Segoe UI", fs(12), "bold")
+FONT_TILE_VALUE_LARGE = ("Consolas", fs(36), "bold")
+FONT_VALUE_MED_SMALL = ("Consolas", fs(22), "bold")
+FONT_VALUE_SMALL = ("Consolas", fs(20), "bold")
+FONT_SMALL = ("Consolas", fs(16))
+FONT_BUTTON = ("Segoe UI", fs(12), "bold")
+FONT_TAG_TITLE = ("Segoe UI", fs(20), "bold")
+FONT_TAG_VALUE = ("Consolas", fs(50), "bold")
+
+# Panel colors (used to fake transparency where CustomTkinter forbids it)
+PANEL_BG = "#121212"
+PANEL_INNER = "#101010"
+TILE_BG = "#1a1a1a"
+GRAPH_BG = "#111111"
+
+YAW_SCALE_PRESETS = ["-180 to +180", "-90 to +90", "-360 to +360", "Auto"]
+YAW_SCALE_MARGIN = 10.0
+MAX_POINTS = 90
+CHANNEL_WINDOW_S = 30.0
+DEFAULT_CHANNEL_GROUPS = ("Euler (°)",)
+SESSION_REFRESH_S = 1.0
+SESSION_LOAD_POLL_MS = 100
+HEADER_H = 110
+
+IMU_TILES = [
+    "Accel X (g)", "Accel Y (g)", "Accel Z (g)",
+    "Gyro X (°/s)", "Gyro Y (°/s)", "Gyro Z (°/s)",
+    "Pitch", "Roll", "Yaw"
+]
+
+
+def battery_color(pct):
+    if pct >= 75:
+        return "#22c55e"
+    if pct >= 50:
+        return "#eab308"
+    if pct >= 25:
+        return "#f97316"
+    return "#ef4444"
+
+
+def style_graph_axes(ax):
+    ax.set_facecolor("black")
+    ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.4)
+    ax.tick_params(colors="white")
+    ax.yaxis.label.set_color("white")
+
+
+class AutobotGui:
+    def __init__(self, app, link, csv_logger, banner_path=BANNER_PATH, max_fps=GUI_MAX_FPS):
+        self.app = app
+        self.link = link
+        self.csv_logger = csv_logger
+        self.governor = FrameGovernor(max_fps)
+        self.gui_slot = LatestSlot()          # newest record, written by the reader thread
+        self.blocks_slot = LatestSlot()       # (pickup, drop) from the Firebase listener
+        self.status_slot = LatestSlot()       # "Connected" / "Disconnected" from the link's thread
+        self.gui_seen_version = 0
+        self.blocks_seen_version = 0
+        self.status_seen_version = 0
+        self.logging_on = False
+
+        self.yaw_auto_scale = False
+        self.yaw_manual_min = -180.0
+        self.yaw_manual_max = 180.0
+        self.yaw_history = SeriesRing(MAX_POINTS)
+        self.channel_history = ChannelHistory()
+        self.channel_window = None
+        self.channel_plot = None
+        self.channel_vars = {}
+        self.session_window = None
+        self.session_plot = None
+        self.session_live = True
+        self.session_drawn_at = 0.0
+        self.session_loading = None           # LatestSlot of the CSV load in progress
+        self.latest_batt_voltage = 0.0
+
+        link.core.subscribe(self.publish)
+        link.core.subscribe(csv_logger.submit)
+        link.core.subscribe(self.channel_history.submit)
+        link.on_status = self.set_status
+
+        self._build_header(banner_path)
+        self._build_layout()
+        self._build_graph()
+        self._build_imu_grid()
+        self._build_encoders()
+        self._build_connection()
+        self._build_battery()
+        self._build_april()
+        self._build_bottom_controls()
+        self._bind_labels()
+
+        app.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+    # -------- subscribers (called off the Tk thread) --------
+    def publish(self, rec, rx_ns):
+        self.gui_slot.publish(rec)
+
+    def set_blocks(self, pickup, drop):
+        self.blocks_slot.publish((pickup, drop))
+
+    def set_status(self, text):
+        self.status_slot.publish(text)
+
+    # ---------------- HEADER ----------------
+    def _build_header(self, banner_path):
+        header_canvas = Canvas(self.app, width=1280, height=HEADER_H, highlightthickness=0, bg="black")
+        header_canvas.pack(fill=X, padx=8, pady=(8, 6))
+
+        try:
+            from PIL import Image, ImageEnhance, ImageTk
+            raw = Image.open(banner_path)
+            resized = raw.resize((1280, HEADER_H), Image.LANCZOS)
+            enhancer = ImageEnhance.Brightness(resized)
+            dark = enhancer.enhance(0.5)
+            tk_header = ImageTk.PhotoImage(dark)
+            header_bg_id = header_canvas.create_image(0, 0, anchor="nw", image=tk_header)
+            header_canvas.image = tk_header
+
+            def center_header_image(event=None):
+                canvas_w = header_canvas.winfo_width()
+                header_canvas.coords(header_bg_id, canvas_w // 2, HEADER_H // 2)
+                header_canvas.itemconfig(header_bg_id, anchor="center")
+
+            center_header_image()
+            header_canvas.bind("<Configure>", center_header_image)
+        except Exception as e:
+            print("HEADER IMAGE ERROR:", e)
+
+        header_canvas.create_text(925, 38, text="AUTOBOT", fill="white", font=FONT_HEADER)
+        header_canvas.create_text(925, 90, text="AUTOMATING YOUR EVERYDAY TASK", fill="#cccccc", font=FONT_SUBHEADER)
+
+    # ---------------- LAYOUT ----------------
+    def _build_layout(self):
+        main = ctk.CTkFrame(self.app)
+        main.pack(fill=BOTH, expand=True, padx=12, pady=8)
+
+        # LEFT panel
+        self.left_panel = ctk.CTkFrame(main)
+        self.left_panel.pack(side=LEFT, fill=BOTH, expand=True, padx=(0, 8))
+
+        # RIGHT panel
+        self.right_panel = ctk.CTkFrame(main, width=380)
+        self.right_panel.pack(side=RIGHT, fill=Y, padx=(8, 0))
+
+    # ---------------- GRAPH ----------------
+    def _build_graph(self):
+        graph_frame = ctk.CTkFrame(self.left_panel, fg_color=GRAPH_BG, corner_radius=8)
+        graph_frame.pack(fill=X, padx=6, pady=(6, 10))
+        graph_frame.configure(height=360)
+        title_row = ctk.CTkFrame(graph_frame, fg_color=GRAPH_BG)
+        title_row.pack(fill=X, padx=10, pady=(8, 0))
+        ctk.CTkLabel(title_row, text="YAW LIVE GRAPH", font=FONT_TITLE).pack(side=LEFT)
+        ctk.CTkButton(title_row, text="All Channels", width=120, font=FONT_BUTTON,
+                      fg_color=GRAPH_BG, hover_color="gray25", border_color="#3b82f6", border_width=2,
+                      command=self.open_channels_window).pack(side=RIGHT)
+        ctk.CTkButton(title_row, text="Session", width=100, font=FONT_BUTTON,
+                      fg_color=GRAPH_BG, hover_color="gray25", border_color="#3b82f6", border_width=2,
+                      command=self.open_session_window).pack(side=RIGHT, padx=(0, 6))
+
+        fig = Figure(figsize=(4, 4), dpi=100)
+        fig.patch.set_facecolor(GRAPH_BG)
+        ax = fig.add_subplot(111)
+        style_graph_axes(ax)
+        ax.set_title("Yaw (recent)", color="white", fontsize=fs(10))
+        ax.set_ylim(self.yaw_manual_min, self.yaw_manual_max)
+        fig.subplots_adjust(left=0.08, right=0.98, top=0.92, bottom=0.12)
+
+        self.ax = ax
+        self.yaw_canvas = FigureCanvasTkAgg(fig, master=graph_frame)
+        self.yaw_canvas.get_tk_widget().pack(fill=BOTH, expand=True, padx=8, pady=(6, 10))
+        self.yaw_plot = BlitPlot(self.yaw_canvas, ax, MAX_POINTS, linewidth=2)
+
+    # ---------------- CHANNEL PLOT WINDOW ----------------
+    def open_channels_window(self):
+        if self.channel_window is not None:
+            self.channel_window.focus()
+            return
+        win = ctk.CTkToplevel(self.app)
+        win.title("AUTOBOT - Live Channels")
+        win.geometry("1000x720")
+
+        pick_row = ctk.CTkFrame(win, fg_color=PANEL_INNER)
+        pick_row.pack(fill=X, padx=8, pady=(8, 0))
+        self.channel_vars = {}
+        for label, _ in CHANNEL_GROUPS:
+            var = ctk.IntVar(value=1 if label in DEFAULT_CHANNEL_GROUPS else 0)
+            ctk.CTkCheckBox(pick_row, text=label, variable=var, font=FONT_SMALL,
+                            fg_color=PANEL_INNER, border_color="#3b82f6", border_width=2,
+                            hover_color="gray25", checkmark_color="#3b82f6",
+                            command=self._select_channels).pack(side=LEFT, padx=6, pady=8)
+            self.channel_vars[label] = var
+
+        fig = Figure(figsize=(10, 6), dpi=100)
+        fig.patch.set_facecolor(GRAPH_BG)
+        fig.subplots_adjust(left=0.08, right=0.98, top=0.97, bottom=0.06, hspace=0.15)
+        canvas = FigureCanvasTkAgg(fig, master=win)
+        canvas.get_tk_widget().pack(fill=BOTH, expand=True, padx=8, pady=8)
+        self.channel_plot = MultiChannelPlot(canvas, self.channel_history, CHANNEL_WINDOW_S, style_graph_axes)
+        self._select_channels()
+
+        win.protocol("WM_DELETE_WINDOW", self._close_channels_window)
+        self.channel_window = win
+
+    def _select_channels(self):
+        self.channel_plot.set_groups([g for g in CHANNEL_GROUPS if self.channel_vars[g[0]].get() == 1])
+        self.channel_plot.update()
+
+    def _close_channels_window(self):
+        self.channel_window.destroy()
+        self.channel_window = None
+        self.channel_plot = None
+
+    # ---------------- YAW SESSION WINDOW ----------------
+    def open_session_window(self):
+        if self.session_window is not None:
+            self.session_window.focus()
+            return
+        win = ctk.CTkToplevel(self.app)
+        win.title("AUTOBOT - Yaw Session")
+        win.geometry("1000x520")
+
+        button_row = ctk.CTkFrame(win, fg_color=PANEL_INNER)
+        button_row.pack(fill=X, padx=8, pady=(8, 0))
+        for text, command in (("Live", self._show_live_session), ("Open CSV...", self._open_session_csv),
+                              ("Fit", lambda: self.session_plot.fit())):
+            ctk.CTkButton(button_row, text=text, width=100, font=FONT_BUTTON,
+                          fg_color=PANEL_INNER, hover_color="gray25", border_color="#3b82f6", border_width=2,
+                          command=command).pack(side=LEFT, padx=6, pady=8)
+        self.session_src_lbl = ctk.CTkLabel(button_row, text="", font=FONT_SMALL)
+        self.session_src_lbl.pack(side=LEFT, padx=10)
+        ctk.CTkLabel(button_row, text="wheel: zoom   drag: pan", font=FONT_SMALL, text_color="gray60").pack(side=RIGHT, padx=10)
+
+        fig = Figure(figsize=(10, 4.5), dpi=100)
+        fig.patch.set_facecolor(GRAPH_BG)
+        fig.subplots_adjust(left=0.07, right=0.98, top=0.95, bottom=0.12)
+        ax = fig.add_subplot(111)
+        style_graph_axes(ax)
+        ax.set_xlabel("seconds", color="white")
+        ax.set_ylabel("Yaw (°)")
+        canvas = FigureCanvasTkAgg(fig, master=win)
+        canvas.get_tk_widget().pack(fill=BOTH, expand=True, padx=8, pady=8)
+        self.session_plot = SessionPlot(canvas, ax, self.channel_history.session, "yaw", linewidth=1)
+        self.session_window = win
+        self._show_live_session()
+
+        win.protocol("WM_DELETE_WINDOW", self._close_session_window)
+
+    def _show_live_session(self):
+        self.session_loading = None     # a load still running is dropped when it finishes
+        self.session_live = True
+        self.session_plot.set_session(self.channel_history.session)
+        self.session_src_lbl.configure(text="Live session")
+
+    def _open_session_csv(self):
+        path = filedialog.askopenfilename(parent=self.session_window, title="Open AUTOBOT CSV log",
+                                          initialdir=os.path.dirname(self.csv_logger.path) or ".",
+                                          filetypes=[("CSV logs", "*.csv"), ("All files", "*.*")])
+        if not path:
+            return
+        # a 2 h log takes seconds to parse: load on a worker thread, pick the result up from after()
+        result = LatestSlot()
+
+        def load():
+            try:
+                result.publish(load_csv_session(path))
+            except Exception as e:
+                result.publish(e)
+
+        threading.Thread(target=load, name="session-load", daemon=True).start()
+        self.session_loading = result
+        self.session_src_lbl.configure(text=f"Loading {os.path.basename(path)}...")
+        self.app.after(SESSION_LOAD_POLL_MS, self._poll_session_load, path, result)
+
+    def _poll_session_load(self, path, result):
+        if self.session_loading is not result or self.session_plot is None:
+            return              # replaced by Live / another file, or the window was closed
+        newer = result.get_if_newer(0)
+        if newer is None:
+            self.app.after(SESSION_LOAD_POLL_MS, self._poll_session_load, path, result)
+            return
+        self.session_loading = None
+        session = newer[1]
+        if isinstance(session, Exception):
+            self.session_src_lbl.configure(text=f"Cannot load: {session}")
+            return
+        self.session_live = False
+        self.session_plot.set_session(session)
+        self.session_src_lbl.configure(text=f"{os.path.basename(path)} ({len(session)} rows)")
+
+    def _close_session_window(self):
+        self.session_loading = None
+        self.session_window.destroy()
+        self.session_window = None
+        self.session_plot = None
+
+    def _refresh_live_session(self):
+        # a full redraw, so at most once per SESSION_REFRESH_S
+        now = time.monotonic()
+        if now - self.session_drawn_at < SESSION_REFRESH_S:
+            return
+        self.session_drawn_at = now
+        if self.session_plot.session is not self.channel_history.session:
+            self.session_plot.set_session(self.channel_history.session)     # SESSION_MAX_POINTS rollover
+        else:
+            self.session_plot.on_new_data()
+
+    # ---------------- IMU GRID ----------------
+    def _build_imu_grid(self):
+        imu_grid = ctk.CTkFrame(self.left_panel)
+        imu_grid.pack(fill=BOTH, expand=False, padx=6, pady=(0, 8))
+        imu_grid.configure(height=360)
+
+        self.imu_tiles = {}
+        for i, title in enumerate(IMU_TILES):
+            r = i // 3
+            c = i % 3
+            tile = ctk.CTkFrame(imu_grid, fg_color=TILE_BG, corner_radius=6)
+            tile.grid(row=r, column=c, sticky="nsew", padx=6, pady=6)
+            tile.grid_propagate(False)
+
+            ctk.CTkLabel(tile, text=title, font=FONT_TILE_TITLE).pack(pady=(8, 4))
+            value_frame = ctk.CTkFrame(tile, fg_color=TILE_BG)  # use same bg; fixed size frame
+            value_frame.pack(pady=(4, 10), fill="x")
+            value_frame.configure(width=fs(120), height=fs(40))
+            value_frame.pack_propagate(False)
+
+            val = ctk.CTkLabel(value_frame, text="0.00", font=FONT_TILE_VALUE_LARGE, text_color="#ffcc00", anchor="center")
+            val.pack(expand=True)
+            self.imu_tiles[title] = val
+
+        for c in range(3):
+            imu_grid.columnconfigure(c, weight=1)
+        for r in range(3):
+            imu_grid.rowconfigure(r, weight=1)
+
+    # ---------------- ENCODERS ----------------
+    def _build_encoders(self):
+        enc_row = ctk.CTkFrame(self.left_panel)
+        enc_row.pack(fill=X, padx=6, pady=(0, 8))
+
+        enc_left = ctk.CTkFrame(enc_row, fg_color=TILE_BG, corner_radius=6)
+        enc_left.pack(side=LEFT, fill=BOTH, expand=True, padx=(0, 6))
+        ctk.CTkLabel(enc_left, text="Left Encoder", font=FONT_SUBTITLE).pack(pady=(8, 4))
+        self.left_enc_lbl = ctk.CTkLabel(enc_left, text="0", font=FONT_VALUE_MED_SMALL, width=fs(110), anchor="center")
+        self.left_enc_lbl.pack(pady=(4, 6))
+        self.left_deg_lbl = ctk.CTkLabel(enc_left, text="[0.00°]", font=FONT_SMALL, width=fs(110), anchor="center")
+        self.left_deg_lbl.pack(pady=(0, 12))
+        enc_left.grid_propagate(False)
+
+        enc_right = ctk.CTkFrame(enc_row, fg_color=TILE_BG, corner_radius=6)
+        enc_right.pack(side=RIGHT, fill=BOTH, expand=True, padx=(6, 0))
+        ctk.CTkLabel(enc_right, text="Right Encoder", font=FONT_SUBTITLE).pack(pady=(8, 4))
+        self.right_enc_lbl = ctk.CTkLabel(enc_right, text="0", font=FONT_VALUE_MED_SMALL, width=fs(110), anchor="center")
+        self.right_enc_lbl.pack(pady=(4, 6))
+        self.right_deg_lbl = ctk.CTkLabel(enc_right, text="[0.00°]", font=FONT_SMALL, width=fs(110), anchor="center")
+        self.right_deg_lbl.pack(pady=(0, 12))
+        enc_right.grid_propagate(False)
+
+    # ---------------- RIGHT PANEL - COM & BATTERY ----------------
+    def _build_connection(self):
+        com_frame = ctk.CTkFrame(self.right_panel, fg_color=PANEL_BG, corner_radius=8)
+        com_frame.pack(fill=X, padx=8, pady=(6, 8))
+        ctk.CTkLabel(com_frame, text="COM / CONNECTION", font=FONT_SUBTITLE).pack(anchor="w", padx=10, pady=(8, 4))
+
+        try:
+            ports = list_serial_ports()
+        except Exception:
+            ports = []
+        if not ports:
+            ports = [DEFAULT_COM]
+
+        self.com_var = ctk.StringVar(value=ports[0])
+        self.baud_var = ctk.IntVar(value=DEFAULT_BAUD)
+
+        # OptionMenu inside a blue bordered frame; same bg as parent to appear "transparent".
+        com_border = ctk.CTkFrame(com_frame, fg_color=PANEL_BG, border_color="#3b82f6", border_width=2, corner_radius=6)
+        com_border.pack(side=LEFT, padx=(10, 6))
+        com_opt = ctk.CTkOptionMenu(com_border, values=ports, variable=self.com_var, width=120,
+                                    fg_color=PANEL_BG, button_color=PANEL_BG, button_hover_color=TILE_BG,
+                                    dropdown_fg_color=GRAPH_BG, dropdown_hover_color=TILE_BG, font=FONT_SMALL)
+        com_opt.pack(fill="both", expand=True)
+
+        ctk.CTkEntry(com_frame, textvariable=self.baud_var, width=90).pack(side=LEFT, padx=(0, 6))
+
+        # Connect/Disconnect as border-only buttons (fg matches panel bg, border shows color)
+        self.connect_btn = ctk.CTkButton(com_frame, text="Connect", width=90, font=FONT_BUTTON,
+                                         fg_color=PANEL_BG, hover_color="gray25",
+                                         border_color="#22c55e", border_width=2,
+                                         command=self.connect_action)
+        self.disconnect_btn = ctk.CTkButton(com_frame, text="Disconnect", width=90, font=FONT_BUTTON,
+                                            fg_color=PANEL_BG, hover_color="gray25",
+                                            border_color="#ef4444", border_width=2, state="disabled",
+                                            command=self.disconnect_action)
+        self.connect_btn.pack(side=LEFT, padx=6)
+        self.disconnect_btn.pack(side=LEFT, padx=(6, 10))
+
+        self.status_var = ctk.StringVar(value="Disconnected")
+        self.status_lbl = ctk.CTkLabel(com_frame, textvariable=self.status_var, text_color="gray70", font=FONT_SMALL)
+        self.status_lbl.pack(side=LEFT, padx=(6, 10), pady=(0, 8))
+
+    # ---------------- BATTERY / ACTIONS ----------------
+    def _build_battery(self):
+        battery_group = ctk.CTkFrame(self.right_panel, fg_color=PANEL_BG, corner_radius=8)
+        battery_group.pack(fill=X, padx=8, pady=(0, 8))
+        ctk.CTkLabel(battery_group, text="BATTERY / ACTIONS", font=FONT_TITLE).pack(anchor="w", padx=10, pady=(8, 4))
+
+        battery_inner = ctk.CTkFrame(battery_group, fg_color=PANEL_BG)
+        battery_inner.pack(fill=X, padx=10, pady=(0, 12))
+        battery_inner.columnconfigure(0, weight=2)
+        battery_inner.columnconfigure(1, weight=1)
+        battery_inner.columnconfigure(2, weight=1)
+
+        battery_tile = ctk.CTkFrame(battery_inner, fg_color=TILE_BG, corner_radius=10)
+        battery_tile.grid(row=0, column=0, rowspan=2, sticky="nsew", padx=(0, 12), pady=6)
+        ctk.CTkLabel(battery_tile, text="BATTERY", font=FONT_SUBTITLE).pack(pady=(18, 4))
+        self.batt_pct_var = ctk.StringVar(value="-%")
+        self.batt_volt_var = ctk.StringVar(value="Voltage: - V")
+        self.batt_pct_lbl = ctk.CTkLabel(battery_tile, textvariable=self.batt_pct_var, font=FONT_TILE_VALUE_LARGE, text_color="gray70")
+        self.batt_pct_lbl.pack(pady=(10, 4))
+        ctk.CTkLabel(battery_tile, textvariable=self.batt_volt_var, font=FONT_SMALL).pack(pady=(0, 12))
+
+        left_deg_box = ctk.CTkFrame(battery_inner, fg_color=TILE_BG, corner_radius=8)
+        left_deg_box.grid(row=0, column=1, sticky="nsew", padx=6, pady=6)
+        ctk.CTkLabel(left_deg_box, text="ENC LEFT DEG", font=FONT_TILE_TITLE).pack(pady=(8, 2))
+        self.left_deg_small_lbl = ctk.CTkLabel(left_deg_box, text="0.00°", font=FONT_VALUE_SMALL, text_color="#ffcc00", width=fs(110), anchor="center")
+        self.left_deg_small_lbl.pack(pady=(0, 8))
+
+        pickup_tile = ctk.CTkFrame(battery_inner, fg_color=TILE_BG, corner_radius=8)
+        pickup_tile.grid(row=0, column=2, sticky="nsew", padx=6, pady=6)
+        ctk.CTkLabel(pickup_tile, text="PICK UP BLOCK", font=FONT_TILE_TITLE).pack(pady=(8, 2))
+        self.pickup_val = ctk.CTkLabel(pickup_tile, text="-", font=FONT_VALUE_MED_SMALL, text_color="#ffcc00", width=fs(110), anchor="center")
+        self.pickup_val.pack(pady=(0, 8))
+
+        right_deg_box = ctk.CTkFrame(battery_inner, fg_color=TILE_BG, corner_radius=8)
+        right_deg_box.grid(row=1, column=1, sticky="nsew", padx=6, pady=6)
+        ctk.CTkLabel(right_deg_box, text="ENC RIGHT DEG", font=FONT_TILE_TITLE).pack(pady=(8, 2))
+        self.right_deg_small_lbl = ctk.CTkLabel(right_deg_box, text="0.00°", font=FONT_VALUE_SMALL, text_color="#ffcc00", width=fs(110), anchor="center")
+        self.right_deg_small_lbl.pack(pady=(0, 8))
+
+        drop_tile = ctk.CTkFrame(battery_inner, fg_color=TILE_BG, corner_radius=8)
+        drop_tile.grid(row=1, column=2, sticky="nsew", padx=6, pady=6)
+        ctk.CTkLabel(drop_tile, text="DROP BLOCK", font=FONT_TILE_TITLE).pack(pady=(8, 2))
+        self.drop_val = ctk.CTkLabel(drop_tile, text="-", font=FONT_VALUE_MED_SMALL, text_color="#ffcc00", width=fs(110), anchor="center")
+        self.drop_val.pack(pady=(0, 8))
+
+    # ---------------- APRILTAG / ESP ----------------
+    def _build_april(self):
+        april_big = ctk.CTkFrame(self.right_panel, fg_color=PANEL_BG, corner_radius=8)
+        april_big.pack(fill=BOTH, expand=True, padx=14, pady=(0, 8))
+        ctk.CTkLabel(april_big, text="APRIL TAG / ESP DATA", font=FONT_TITLE).pack(padx=10, pady=(10, 6))
+        april_inner = ctk.CTkFrame(april_big, fg_color=PANEL_BG)
+        april_inner.pack(fill=BOTH, expand=True, padx=10, pady=(0, 10))
+
+        tag_frame = ctk.CTkFrame(april_inner, fg_color=TILE_BG, corner_radius=10)
+        tag_frame.grid(row=0, column=0, rowspan=3, sticky="nsew", padx=(0, 12), pady=6)
+        ctk.CTkLabel(tag_frame, text="TAG ID", font=FONT_TAG_TITLE).pack(pady=(20, 10))
+        self.tag_var = ctk.StringVar(value="0")
+        tag_lbl = ctk.CTkLabel(tag_frame, textvariable=self.tag_var, font=FONT_TAG_VALUE, text_color="#ffcc00", width=fs(180), anchor="center")
+        tag_lbl.pack(pady=(20, 20))
+
+        april_inner.columnconfigure(0, weight=2)
+        april_inner.columnconfigure(1, weight=1)
+        april_inner.columnconfigure(2, weight=1)
+
+        def make_esp_tile(parent, title, var):
+            f = ctk.CTkFrame(parent, fg_color=TILE_BG, corner_radius=8)
+            ctk.CTkLabel(f, text=title, font=FONT_TILE_TITLE).pack(pady=(8, 2))
+            val = ctk.CTkLabel(f, textvariable=var, font=FONT_VALUE_SMALL, text_color="#ffcc00", width=fs(110), anchor="center")
+            val.pack(pady=(0, 8))
+            return f
+
+        self.pos_x_var = ctk.StringVar(value="0.00")
+        self.pos_y_var = ctk.StringVar(value="0.00")
+        self.pos_z_var = ctk.StringVar(value="0.00")
+        self.yaw_val_var = ctk.StringVar(value="0.00")
+        self.roll_val_var = ctk.StringVar(value="0.00")
+        self.pitch_val_var = ctk.StringVar(value="0.00")
+
+        make_esp_tile(april_inner, "X AXIS", self.pos_x_var).grid(row=0, column=1, padx=6, pady=6, sticky="nsew")
+        make_esp_tile(april_inner, "YAW", self.yaw_val_var).grid(row=0, column=2, padx=6, pady=6, sticky="nsew")
+        make_esp_tile(april_inner, "Y AXIS", self.pos_y_var).grid(row=1, column=1, padx=6, pady=6, sticky="nsew")
+        make_esp_tile(april_inner, "ROLL", self.roll_val_var).grid(row=1, column=2, padx=6, pady=6, sticky="nsew")
+        make_esp_tile(april_inner, "Z AXIS", self.pos_z_var).grid(row=2, column=1, padx=6, pady=6, sticky="nsew")
+        make_esp_tile(april_inner, "PITCH", self.pitch_val_var).grid(row=2, column=2, padx=6, pady=6, sticky="nsew")
+
+        for i in range(3):
+            april_inner.rowconfigure(i, weight=1)
+
+    # ------------- Bottom Controls (border-only Start/Stop, blue outlined OptionMenus) ----------------
+    def _build_bottom_controls(self):
+        bottom_row = ctk.CTkFrame(self.right_panel, fg_color=PANEL_INNER)
+        bottom_row.pack(fill=X, padx=8, pady=(0, 10))
+
+        self.start_btn = ctk.CTkButton(bottom_row, text="Start Logging", width=120, font=FONT_BUTTON,
+                                       fg_color=PANEL_INNER, hover_color="gray25",
+                                       border_color="#22c55e", border_width=2,
+                                       command=self.start_logging_action)
+        self.stop_btn = ctk.CTkButton(bottom_row, text="Stop Logging", width=120, font=FONT_BUTTON,
+                                      fg_color=PANEL_INNER, hover_color="gray25",
+                                      border_color="#ef4444", border_width=2, state="disabled",
+                                      command=self.stop_logging_action)
+        self.start_btn.pack(side=LEFT, padx=6, pady=10)
+        self.stop_btn.pack(side=LEFT, padx=6, pady=10)
+
+        # CSV checkbox (use default checkbox but adjust checkmark color)
+        self.csv_chk = ctk.CTkCheckBox(
+            bottom_row,
+            text="Log to CSV",
+            font=FONT_SMALL,
+            fg_color=bottom_row.cget("fg_color"),   # same background (no box fill)
+            border_color="#3b82f6",
+            border_width=2,
+            hover_color="gray25",
+            checkmark_color="#3b82f6",
+            command=self._sync_logging,
+        )
+        self.csv_chk.select()
+        self.csv_chk.pack(side=LEFT, padx=6, pady=10)
+
+        # Yaw scale bordered option (blue border)
+        self.yaw_scale_var = ctk.StringVar(value=YAW_SCALE_PRESETS[0])
+        scale_border = ctk.CTkFrame(bottom_row, fg_color=PANEL_INNER, border_color="#3b82f6", border_width=2, corner_radius=6)
+        scale_border.pack(side=RIGHT, padx=8, pady=10)
+        yaw_scale_menu = ctk.CTkOptionMenu(scale_border, values=YAW_SCALE_PRESETS, variable=self.yaw_scale_var,
+                                           command=self.on_scale_preset_changed, width=150,
+                                           fg_color=PANEL_INNER, button_color=PANEL_INNER, button_hover_color=TILE_BG,
+                                           dropdown_fg_color=GRAPH_BG, dropdown_hover_color=TILE_BG, font=FONT_SMALL)
+        yaw_scale_menu.pack(fill="both", expand=True)
+
+    # ---------------- Label view-model ----------------
+    def _bind_labels(self):
+        # formatted once per record; a widget is only touched when its text changes
+        labels = self.labels = LabelViewModel()
+        labels.bind(text_setter(self.left_enc_lbl), lambda r: str(r.left))
+        labels.bind(text_setter(self.right_enc_lbl), lambda r: str(r.right))
+        labels.bind(text_setter(self.left_deg_lbl), lambda r: f"[{r.left_deg:.2f}°]")
+        labels.bind(text_setter(self.right_deg_lbl), lambda r: f"[{r.right_deg:.2f}°]")
+        labels.bind(text_setter(self.left_deg_small_lbl), lambda r: f"{r.left_deg:.2f}°")
+        labels.bind(text_setter(self.right_deg_small_lbl), lambda r: f"{r.right_deg:.2f}°")
+
+        imu_tiles = self.imu_tiles
+        for title, field in zip(IMU_TILES, ("accel_x", "accel_y", "accel_z", "gyro_x", "gyro_y", "gyro_z",
+                                            "pitch", "roll", "yaw")):
+            labels.bind(text_setter(imu_tiles[title]), lambda r, field=field: f"{getattr(r, field):.2f}")
+
+        labels.bind(self.tag_var.set, lambda r: str(r.esp_tag))
+        labels.bind(self.pos_x_var.set, lambda r: f"{r.esp_x:.2f}")
+        labels.bind(self.pos_y_var.set, lambda r: f"{r.esp_y:.2f}")
+        labels.bind(self.pos_z_var.set, lambda r: f"{r.esp_z:.2f}")
+        labels.bind(self.yaw_val_var.set, lambda r: f"{r.esp_yaw:.2f}")
+        labels.bind(self.pitch_val_var.set, lambda r: f"{r.esp_pitch:.2f}")
+        labels.bind(self.roll_val_var.set, lambda r: f"{r.esp_roll:.2f}")
+
+        labels.bind(self.batt_pct_var.set, lambda r: f"{r.battery_pct}%")
+        labels.bind(lambda color: self.batt_pct_lbl.configure(text_color=color), lambda r: battery_color(r.battery_pct))
+        labels.bind(self.batt_volt_var.set, lambda r: f"Voltage: {r.battery_v:.2f} V")
+
+        # the only writer of status_var: link status from update_blocks(), "Connecting" on connect
+        self.status_view = LabelViewModel()
+        self.status_view.bind(self.status_var.set, str)
+        self.widget_updates = 0     # labels touched in the last tick
+
+    # ---------------- Actions ----------------
+    def on_scale_preset_changed(self, choice):
+        if choice == "Auto":
+            self.yaw_auto_scale = True
+        else:
+            self.yaw_auto_scale = False
+            parts = choice.replace("+", "").split("to")
+            try:
+                self.yaw_manual_min = float(parts[0].strip())
+                self.yaw_manual_max = float(parts[1].strip())
+            except Exception:
+                self.yaw_manual_min, self.yaw_manual_max = -180, 180
+        self._update_yaw_limits()
+
+    def _update_yaw_limits(self):
+        if self.yaw_auto_scale:
+            history = self.yaw_history
+            if history:
+                self.yaw_plot.set_ylim(*autoscale_limits(history.min(), history.max(), YAW_SCALE_MARGIN))
+        else:
+            self.yaw_plot.set_ylim(self.yaw_manual_min, self.yaw_manual_max)
+
+    def _sync_logging(self):
+        # rows are queued only while logging is started and "Log to CSV" is ticked
+        if self.logging_on and self.csv_chk.get() == 1:
+            self.csv_logger.enabled.set()
+        else:
+            self.csv_logger.enabled.clear()
+            self.csv_logger.flush(timeout=0)    # commit what is queued now, without blocking Tk
+
+    def connect_action(self):
+        port = self.com_var.get()
+        try:
+            baud = int(self.baud_var.get())
+        except Exception:
+            baud = DEFAULT_BAUD
+        # before start(): whatever the link reports from now on replaces it
+        self.status_view.render(f"Connecting {port}...")
+        self.link.start(port, baud)
+        self.connect_btn.configure(state="disabled")
+        self.disconnect_btn.configure(state="normal")
+        self.csv_logger.start()
+
+    def disconnect_action(self):
+        self.link.stop(timeout=0.15)
+        self.connect_btn.configure(state="normal")
+        self.disconnect_btn.configure(state="disabled")
+
+    def start_logging_action(self):
+        self.logging_on = True
+        self._sync_logging()
+        self.start_btn.configure(state="disabled")
+        self.stop_btn.configure(state="normal")
+
+    def stop_logging_action(self):
+        self.logging_on = False
+        self._sync_logging()
+        self.start_btn.configure(state="normal")
+        self.stop_btn.configure(state="disabled")
+
+    def on_closing(self):
+        self.link.stop(timeout=0.2)
+        self.csv_logger.enabled.clear()
+        self.csv_logger.close()
+        print(f"[GUI] {self.labels.frames} records shown, "
+              f"{self.labels.mean_updates():.1f} of {len(self.labels)} labels updated per record")
+        print("[GUI]", self.governor.stats())
+        self.app.destroy()
+
+    # ---------------- GUI Update Loop ----------------
+    def start(self):
+        self.app.after(100, self.update_gui)
+        self.app.after(BLOCKS_POLL_MS, self.update_blocks)
+        return self
+
+    def update_blocks(self):
+        # Firebase tasks and link status on their own short timer: the telemetry loop may be
+        # backed off to idle_interval (nothing arrives once the port drops), and a version
+        # compare costs nothing
+        newer = self.blocks_slot.get_if_newer(self.blocks_seen_version)
+        if newer:
+            self.blocks_seen_version, (pickup, drop) = newer
+            self.pickup_val.configure(text=str(pickup))
+            self.drop_val.configure(text=str(drop))
+        newer = self.status_slot.get_if_newer(self.status_seen_version)
+        if newer:
+            self.status_seen_version, text = newer
+            self.status_view.render(text)
+        self.app.after(BLOCKS_POLL_MS, self.update_blocks)
+
+    def update_gui(self):
+        t0 = time.perf_counter()
+        # every frame since the last tick goes into the channel history, drained even while
+        # minimized so its ring never overflows
+        frames = self.channel_history.pull()
+        visible = self.app.state() != "iconic"
+        rendered = False
+        self.widget_updates = 0
+        if visible:
+            newer = self.gui_slot.get_if_newer(self.gui_seen_version)
+            if newer:
+                self.gui_seen_version, latest = newer
+                self.show_record(latest)
+                self.widget_updates = self.labels.updates
+                rendered = True
+            if frames:
+                if self.channel_plot is not None:
+                    self.channel_plot.update()
+                if self.session_plot is not None and self.session_live:
+                    self._refresh_live_session()
+
+        # next tick: capped at max_fps, stretched by slow renders, backed off when idle or hidden
+        tick_s = time.perf_counter() - t0
+        self.governor.frame_done(tick_s, frames, rendered, visible)
+        self.app.after(self.governor.delay_ms(tick_s), self.update_gui)
+
+    def show_record(self, latest):
+        # encoders, imu tiles, april tag / ESP pose, battery: only labels whose text changed
+        self.labels.render(latest)
+        self.latest_batt_voltage = latest.battery_v
+
+        # yaw graph
+        yaw_val = latest.yaw
+        if yaw_val > 180:
+            yaw_val -= 360
+        elif yaw_val < -180:
+            yaw_val += 360
+
+        self.yaw_history.append(yaw_val)
+        if self.yaw_auto_scale:
+            self._update_yaw_limits()
+        # axes are only redrawn when the limits changed; otherwise just the line is blitted
+        self.yaw_plot.update(self.yaw_history.values())
+
+
+def main(csv_log_path=CSV_LOG_PATH, banner_path=BANNER_PATH, cloud="firebase", title="AUTOBOT - Live GUI (Final)",
+         max_fps=GUI_MAX_FPS, ingest_process=True):
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    app = ctk.CTk()
+    app.title(title)
+    app.geometry("1280x760")
+
+    # a slow redraw holds the GIL; in its own process the reader never waits for it
+    link = ProcessLink() if ingest_process else EngineLink(read_timeout=SERIAL_READ_TIMEOUT)
+    gui = AutobotGui(app, link, CsvLogger(csv_log_path), banner_path, max_fps)
+
+    if cloud:
+        try:
+            from autobot.cloud.backend import open_backend
+            from autobot.cloud.firebase import BatteryPusher, BlockListener
+            backend = open_backend(cloud) if isinstance(cloud, str) else cloud
+            link.core.subscribe(BatteryPusher(backend).start().submit)
+            BlockListener(backend, gui.set_blocks).start()
+        except Exception as e:
+            print("[Firebase] Disabled:", e)
+
+    gui.start()
+    app.mainloop()
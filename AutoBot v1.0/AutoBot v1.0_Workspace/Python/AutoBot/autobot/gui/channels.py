@@ -0,0 +1,88 @@
+# autobot/gui/channels.py
+"""
+Full-rate history of every plottable telemetry channel for the live channel plot.
+
+submit() is an IngestCore subscriber: the reader thread only puts
+(rx_ns, record) into a RecordRing. The Tk thread calls pull() once per tick to
+move everything that arrived into one SeriesRing per channel plus a shared
+rx_ns time ring, so all channels share one time axis and no frame is skipped
+(the GUI tile labels still only show the newest record). The same batches are
+appended to `session`, a SessionSeries min/max pyramid of SESSION_CHANNELS that
+keeps the whole run for the zoomable session graph.
+"""
+
+from operator import attrgetter
+
+import numpy as np
+
+from autobot.gui.pyramid import SessionSeries
+from autobot.gui.series import SeriesRing
+from autobot.ingest.buffers import RecordRing
+
+HISTORY_POINTS = 20000      # ~3 min at 100 Hz
+PENDING_POINTS = 5000       # frames buffered between two GUI ticks
+SESSION_CHANNELS = ("yaw",)
+SESSION_MAX_POINTS = 1_440_000  # 4 h at 100 Hz; a longer run starts a new session
+
+# (group label, channels); encoder deltas are computed, the rest are record fields
+CHANNEL_GROUPS = (
+    ("Accel (g)", ("accel_x", "accel_y", "accel_z")),
+    ("Gyro (°/s)", ("gyro_x", "gyro_y", "gyro_z")),
+    ("Euler (°)", ("pitch", "roll", "yaw")),
+    ("Encoder Δ (counts)", ("left_delta", "right_delta")),
+    ("Battery (V)", ("battery_v",)),
+    ("ESP pos", ("esp_x", "esp_y", "esp_z")),
+    ("ESP yaw (°)", ("esp_yaw",)),
+)
+RECORD_CHANNELS = tuple(c for _, chans in CHANNEL_GROUPS for c in chans if not c.endswith("_delta"))
+CHANNELS = tuple(c for _, chans in CHANNEL_GROUPS for c in chans)
+
+_record_values = attrgetter(*RECORD_CHANNELS)
+
+
+class ChannelHistory:
+    def __init__(self, capacity=HISTORY_POINTS, pending=PENDING_POINTS, session_channels=SESSION_CHANNELS):
+        self.pending = RecordRing(pending)
+        self.session_channels = session_channels
+        self.session = SessionSeries(session_channels)
+        self.time = SeriesRing(capacity, np.int64)      # rx_ns
+        self.series = {name: SeriesRing(capacity) for name in CHANNELS}
+        self._appenders = [self.series[name].append for name in RECORD_CHANNELS]
+        self._prev_enc = None
+
+    def __len__(self):
+        return len(self.time)
+
+    # -------- IngestCore subscriber (reader thread) --------
+    def submit(self, rec, rx_ns):
+        self.pending.put((rx_ns, rec))
+
+    # -------- Tk thread --------
+    def pull(self):
+        """Append everything submitted since the last call; returns the number of frames."""
+        items = self.pending.drain()
+        series = self.series
+        left_delta, right_delta = series["left_delta"].append, series["right_delta"].append
+        appenders = self._appenders
+        for rx_ns, rec in items:
+            self.time.append(rx_ns)
+            for append, value in zip(appenders, _record_values(rec)):
+                append(value)
+            prev = self._prev_enc
+            left_delta(rec.left - prev[0] if prev else 0)
+            right_delta(rec.right - prev[1] if prev else 0)
+            self._prev_enc = (rec.left, rec.right)
+        if items:
+            if len(self.session) >= SESSION_MAX_POINTS:
+                self.session = SessionSeries(self.session_channels)
+            self.session.extend([rx_ns for rx_ns, _ in items],
+                                {name: [getattr(rec, name) for _, rec in items] for name in self.session_channels})
+        return len(items)
+
+    def window(self, seconds):
+        """(start, newest_ns): index into values() of the first sample within `seconds` of the newest."""
+        t = self.time.values()
+        if not len(t):
+            return 0, 0
+        newest = int(t[-1])
+        return int(np.searchsorted(t, newest - int(seconds * 1e9))), newest
@@ -0,0 +1,74 @@
+# autobot/gui/governor.py
+"""
+Adaptive frame scheduler for the GUI's after() loop.
+
+frame_done() is called at the end of every tick with what the tick cost and how
+many telemetry frames arrived since the previous one; it returns the seconds to
+wait before the next tick:
+
+  - never faster than max_fps, nor faster than the data actually arrives
+  - render cost (EWMA) may use at most busy_fraction of the Tk thread, so a slow
+    render stretches the interval instead of ticks piling up back to back
+  - no new data: the interval doubles per empty tick up to idle_interval
+  - window minimized: hidden_interval, and the caller skips rendering
+
+The GUI reads the newest record from a LatestSlot, so a stretched interval
+skips intermediate records instead of queueing them; `skipped` counts them.
+"""
+
+import time
+
+MAX_FPS = 20.0
+IDLE_INTERVAL = 0.5
+HIDDEN_INTERVAL = 1.0
+BUSY_FRACTION = 0.25
+EWMA_ALPHA = 0.2
+
+
+class FrameGovernor:
+    def __init__(self, max_fps=MAX_FPS, idle_interval=IDLE_INTERVAL, hidden_interval=HIDDEN_INTERVAL,
+                 busy_fraction=BUSY_FRACTION):
+        self.min_interval = 1.0 / max_fps
+        self.idle_interval = idle_interval
+        self.hidden_interval = hidden_interval
+        self.busy_fraction = busy_fraction
+        self.interval = self.min_interval
+        self.render_s = 0.0         # EWMA of the cost of ticks that rendered
+        self.data_rate = 0.0        # EWMA of telemetry frames per second
+        self.rendered = 0           # ticks that drew something
+        self.skipped = 0            # telemetry frames never shown
+        self._last = None
+
+    def frame_done(self, tick_s, new_frames, rendered, visible=True, now=None):
+        """Record one tick; returns the seconds until the next one should start."""
+        now = time.monotonic() if now is None else now
+        dt = now - self._last if self._last is not None else self.interval
+        self._last = now
+        a = EWMA_ALPHA
+        if dt > 0:
+            self.data_rate += a * (new_frames / dt - self.data_rate)
+        if rendered:
+            self.render_s += a * (tick_s - self.render_s)
+            self.rendered += 1
+            self.skipped += max(0, new_frames - 1)
+        else:
+            self.skipped += new_frames
+
+        if not visible:
+            interval = self.hidden_interval
+        elif new_frames == 0:
+            interval = min(max(2 * self.interval, self.min_interval), self.idle_interval)
+        else:
+            interval = max(self.min_interval, self.render_s / self.busy_fraction)
+            if self.data_rate > 0:
+                interval = max(interval, 1.0 / self.data_rate)
+        self.interval = interval
+        return interval
+
+    def delay_ms(self, tick_s):
+        """after() delay for the next tick, net of what this tick already took."""
+        return max(1, int((self.interval - tick_s) * 1000))
+
+    def stats(self):
+        return (f"{1.0 / self.interval:.1f} fps target, render {self.render_s * 1e3:.1f} ms, "
+                f"data {self.data_rate:.0f} frames/s, {self.rendered} drawn, {self.skipped} skipped")
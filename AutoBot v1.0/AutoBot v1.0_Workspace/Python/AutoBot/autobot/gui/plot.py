@@ -0,0 +1,302 @@
+# autobot/gui/plot.py
+"""
+Blitted line plot for the live yaw graph.
+The Line2D is created once and marked animated, so a full canvas.draw() renders
+only the axes (grid, ticks, title); that image is cached as the background.
+Each tick restores the background, draws the line and blits the axes box.
+A full redraw happens only when the y-limits change (scale preset, autoscale
+stepping to a new range) or the canvas is resized.
+MultiChannelPlot does the same for a stack of channel groups drawn from a
+ChannelHistory, decimated to the pixel width by ColumnMinMax.
+SessionPlot shows a whole session from a SessionSeries min/max pyramid, with
+wheel zoom and drag pan.
+Works with any Agg canvas (FigureCanvasTkAgg in the GUI, FigureCanvasAgg offscreen).
+"""
+
+import math
+
+import numpy as np
+
+AUTOSCALE_STEP = 10.0
+
+
+def autoscale_limits(lo, hi, margin, step=AUTOSCALE_STEP):
+    """(ymin, ymax) around the data range lo..hi plus margin, rounded outward to
+    multiples of step. Rounding keeps the limits (and so the cached background)
+    stable while the data wanders inside the current range."""
+    return math.floor((lo - margin) / step) * step, math.ceil((hi + margin) / step) * step
+
+
+class BlitPlot:
+    def __init__(self, canvas, ax, max_points, **line_kwargs):
+        self.canvas = canvas
+        self.ax = ax
+        self.max_points = max_points
+        self.x = np.arange(max_points)
+        (self.line,) = ax.plot([], [], animated=True, **line_kwargs)
+        ax.set_xlim(0, max_points)
+        self.full_draws = 0
+        self._background = None
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        # any full draw (first show, resize, new limits) refreshes the cached axes image
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
+        self.full_draws += 1
+
+    def set_ylim(self, ymin, ymax):
+        """Change the y-limits; triggers a full redraw only if they actually changed."""
+        if self.ax.get_ylim() != (ymin, ymax):
+            self.ax.set_ylim(ymin, ymax)
+            self._background = None
+
+    def update(self, values):
+        n = len(values)
+        self.line.set_data(self.x[:n], values)
+        if self._background is None:
+            self.canvas.draw()      # fires draw_event; TkAgg pushes the image itself
+            return
+        self.canvas.restore_region(self._background)
+        self.ax.draw_artist(self.line)
+        self.canvas.blit(self.ax.bbox)
+
+
+# ---------------- Multi-channel plot ----------------
+class ColumnMinMax:
+    """
+    Min/max decimation of one SeriesRing's window, kept up to date across ticks.
+    Columns are `per` samples wide (a power of two, so at most `bins` columns over
+    the window) and aligned to the ring's absolute sample index: a column that is
+    complete never changes, so each tick only reduces the samples appended since the
+    last one and drops the columns that scrolled out. `per` is only recomputed (and
+    every column with it) when the window no longer fits into bins / 4 .. bins columns.
+    """
+
+    def __init__(self):
+        self.per = 0
+        self.first = 0              # column number of mins[0]
+        self.done = 0               # leading columns of mins / maxs that are complete
+        self.mins = self.maxs = np.empty(0)
+
+    def update(self, ring, i0, bins):
+        """Columns of ring samples i0 .. ring.count (absolute indices) that lie wholly after
+        i0: (first sample, last sample, min, max) arrays."""
+        i1 = ring.count
+        n = i1 - i0
+        values = ring.values()
+        per = self.per
+        if not (per and per * bins < 4 * n and n <= per * bins):
+            per = 1 << (-(-n // bins) - 1).bit_length()     # smallest power of two with n / per <= bins
+            self.per, self.first, self.done = per, 0, 0
+        c0, c1 = -(-i0 // per), -(-i1 // per)
+        # complete columns already reduced that are still in view; the newest, partial one is redone
+        keep = max(0, min(self.first + self.done, c1) - c0) if self.first <= c0 else 0
+        skip = c0 - self.first
+        new = values[(c0 + keep) * per - (i1 - len(values)):]
+        edges = np.arange(0, len(new), per)
+        mins, maxs = self.mins[skip:skip + keep], self.maxs[skip:skip + keep]
+        if len(new):
+            mins = np.concatenate((mins, np.minimum.reduceat(new, edges)))
+            maxs = np.concatenate((maxs, np.maximum.reduceat(new, edges)))
+        self.mins, self.maxs = mins, maxs
+        self.first, self.done = c0, i1 // per - c0
+        starts = np.arange(c0, c1) * per
+        return starts, np.minimum(starts + per, i1) - 1, mins, maxs
+
+
+def nice_limits(lo, hi):
+    """lo..hi rounded outward to the power of ten below the span, so small changes in the
+    data keep the same limits (battery volts and encoder counts alike)."""
+    span = max(hi - lo, abs(hi) * 1e-3, 1e-6)
+    step = 10.0 ** math.floor(math.log10(span))
+    lo, hi = math.floor(lo / step) * step, math.ceil(hi / step) * step
+    return (lo, hi) if hi > lo else (lo, lo + step)
+
+
+class MultiChannelPlot:
+    """
+    One stacked axes per channel group, sharing a "seconds ago" x axis, fed from a
+    ChannelHistory. Every tick all lines are drawn over the cached figure background
+    and blitted in one pass. Each line carries at most two points per pixel column
+    from a ColumnMinMax, so both the decimation and the drawing cost follow the
+    plot width and the new samples, not the history length.
+    """
+
+    def __init__(self, canvas, history, window_s, style_axes=None):
+        self.canvas = canvas
+        self.history = history
+        self.window_s = window_s
+        self.style_axes = style_axes    # fn(ax), applied to each new axes
+        self.axes = []                  # [(ax, [(channel, line), ...]), ...]
+        self.columns = {}               # channel -> ColumnMinMax
+        self.full_draws = 0
+        self._background = None
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    def set_groups(self, groups):
+        """Rebuild the axes for [(label, channels), ...]; the next update() does a full draw."""
+        fig = self.canvas.figure
+        fig.clear()
+        self.axes = []
+        self.columns = {}
+        if groups:
+            for ax, (label, channels) in zip(fig.subplots(len(groups), 1, sharex=True, squeeze=False)[:, 0], groups):
+                if self.style_axes is not None:
+                    self.style_axes(ax)
+                ax.set_xlim(-self.window_s, 0)
+                ax.set_ylabel(label)
+                lines = [(name, ax.plot([], [], animated=True, linewidth=1, label=name)[0]) for name in channels]
+                ax.legend(loc="upper left", fontsize="x-small", ncol=len(lines))
+                self.axes.append((ax, lines))
+        self._background = None
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_lines()
+        self.full_draws += 1
+
+    def _draw_lines(self):
+        for ax, lines in self.axes:
+            for _, line in lines:
+                ax.draw_artist(line)
+
+    def update(self):
+        history = self.history
+        if not self.axes or not len(history):
+            if self._background is None:
+                self.canvas.draw()
+            return
+        start, newest = history.window(self.window_s)
+        bins = max(1, int(self.axes[0][0].bbox.width))
+        redraw = self._background is None
+        for ax, lines in self.axes:
+            lo, hi = math.inf, -math.inf
+            for name, line in lines:
+                xd, yd = self._line_data(name, start, bins)
+                line.set_data((xd - newest) / 1e9, yd)
+                lo, hi = min(lo, yd.min()), max(hi, yd.max())
+            limits = nice_limits(float(lo), float(hi))
+            if ax.get_ylim() != limits:
+                ax.set_ylim(limits)
+                redraw = True
+        if redraw:
+            self.canvas.draw()      # fires draw_event: new background + lines
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_lines()
+        self.canvas.blit(self.canvas.figure.bbox)
+
+    def _line_data(self, name, start, bins):
+        # (rx_ns, values) of channel `name` from window index `start`: raw while the window
+        # is at most two points per column, else first/last time and min/max per column
+        history = self.history
+        t = history.time.values()
+        series = history.series[name]
+        if len(t) - start <= 2 * bins:
+            return t[start:], series.values()[start:]
+        base = history.time.count - len(t)         # absolute index of t[0]
+        columns = self.columns.get(name)
+        if columns is None:
+            columns = self.columns[name] = ColumnMinMax()
+        first, last, mins, maxs = columns.update(series, base + start, bins)
+        x = np.empty(2 * len(mins), dtype=t.dtype)
+        y = np.empty(2 * len(mins), dtype=mins.dtype)
+        x[0::2] = t[first - base]
+        x[1::2] = t[last - base]
+        y[0::2] = mins
+        y[1::2] = maxs
+        return x, y
+
+
+# ---------------- Session plot ----------------
+class SessionPlot:
+    """
+    Whole-session graph of one SessionSeries channel (x = seconds since its first
+    sample). Mouse wheel zooms around the cursor, left-drag pans; every view change
+    re-queries the min/max pyramid for about two points per pixel column, so a
+    2 h, 720k-sample session redraws as fast as a 30 s one.
+    """
+
+    ZOOM_STEP = 1.25
+
+    def __init__(self, canvas, ax, session, channel, **line_kwargs):
+        self.canvas = canvas
+        self.ax = ax
+        self.channel = channel
+        self.follow = True      # keep the view's right edge on the newest sample
+        (self.line,) = ax.plot([], [], **line_kwargs)
+        self._drag = None       # (press x in pixels, xlim at press)
+        canvas.mpl_connect("scroll_event", self._on_scroll)
+        canvas.mpl_connect("button_press_event", self._on_press)
+        canvas.mpl_connect("motion_notify_event", self._on_motion)
+        canvas.mpl_connect("button_release_event", self._on_release)
+        self.set_session(session)
+
+    def set_session(self, session):
+        self.session = session
+        self.fit()
+
+    def _end_s(self):
+        t0, t1 = self.session.span_ns()
+        return (t1 - t0) / 1e9
+
+    def fit(self):
+        self.follow = True
+        self.set_view(0.0, max(self._end_s(), 1.0))
+
+    def set_view(self, x0, x1):
+        self.ax.set_xlim(x0, x1)
+        self.refresh()
+
+    def refresh(self):
+        session = self.session
+        if len(session):
+            origin = session.span_ns()[0]
+            x0, x1 = self.ax.get_xlim()
+            bins = max(1, int(self.ax.bbox.width))
+            t, y = session.query(self.channel, origin + int(x0 * 1e9), origin + int(x1 * 1e9), bins)
+            self.line.set_data((t - origin) / 1e9, y)
+            if len(y):
+                limits = nice_limits(float(y.min()), float(y.max()))
+                if self.ax.get_ylim() != limits:
+                    self.ax.set_ylim(limits)
+        else:
+            self.line.set_data([], [])
+        self.canvas.draw_idle()
+
+    def on_new_data(self):
+        """The live session grew: slide (or, when showing it all, widen) a following view."""
+        if not self.follow:
+            return
+        x0, x1 = self.ax.get_xlim()
+        end = max(self._end_s(), 1.0)
+        self.set_view(0.0 if x0 <= 0 else end - (x1 - x0), end)
+
+    # -------- mouse --------
+    def _on_scroll(self, event):
+        if event.inaxes is not self.ax or event.xdata is None:
+            return
+        scale = self.ZOOM_STEP if event.button == "down" else 1 / self.ZOOM_STEP
+        x0, x1 = self.ax.get_xlim()
+        c = event.xdata
+        x0, x1 = c - (c - x0) * scale, c + (x1 - c) * scale
+        self.follow = x1 >= self._end_s()
+        self.set_view(x0, x1)
+
+    def _on_press(self, event):
+        if event.inaxes is self.ax and event.button == 1:
+            self._drag = (event.x, self.ax.get_xlim())
+
+    def _on_motion(self, event):
+        if self._drag is None or event.x is None:
+            return
+        press_x, (x0, x1) = self._drag
+        shift = (event.x - press_x) * (x1 - x0) / self.ax.bbox.width
+        self.follow = False
+        self.set_view(x0 - shift, x1 - shift)
+
+    def _on_release(self, event):
+        if self._drag is not None:
+            self._drag = None
+            self.follow = self.ax.get_xlim()[1] >= self._end_s()
@@ -0,0 +1,178 @@
+# autobot/gui/pyramid.py
+"""
+Multi-resolution min/max pyramid for whole-session graphs (a 2 h run at 100 Hz
+is 720k samples per channel).
+
+MinMaxPyramid keeps the raw samples (level 0) plus, per level k, the min and
+max of every block of FANOUT**k samples. query(i0, i1, bins) picks the coarsest
+level that still has at least `bins` blocks in the range and folds those into
+`bins` (min, max) pairs, so the work and the points returned follow the pixel
+width of the view, not the number of samples in it. extend() appends in place
+and only recomputes the blocks the new samples touch.
+
+SessionSeries holds one shared rx_ns time axis plus a pyramid per channel. It is
+filled either live, from ChannelHistory.pull() batches, or from a CSV log
+written by CsvLogger (load_csv_session), across its rotated segments.
+load_csv_session streams the log into the column arrays LOAD_BATCH_ROWS rows at
+a time; it takes seconds for a long run, so the GUI calls it off the Tk thread.
+"""
+
+import itertools
+
+import numpy as np
+
+from autobot.ingest.clock import parse_wall_text
+from autobot.ingest.schema import CSV_HEADER, TELEMETRY_FIELDS
+from autobot.sinks.rotation import iter_log_rows
+
+FANOUT = 8
+INITIAL_CAPACITY = 4096
+LOAD_BATCH_ROWS = 65536
+
+
+class _Growable:
+    """numpy array with amortized O(1) append (capacity doubling)."""
+
+    def __init__(self, dtype, capacity=INITIAL_CAPACITY):
+        self.data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def resize(self, size):
+        if size > len(self.data):
+            data = np.empty(max(size, 2 * len(self.data)), dtype=self.data.dtype)
+            data[:self.size] = self.data[:self.size]
+            self.data = data
+        self.size = size
+
+    def view(self):
+        return self.data[:self.size]
+
+
+class MinMaxPyramid:
+    def __init__(self, dtype=np.float32, fanout=FANOUT):
+        self.fanout = fanout
+        self.raw = _Growable(dtype)
+        self.levels = []        # [(mins, maxs), ...] for block sizes fanout**1, fanout**2, ...
+
+    def __len__(self):
+        return self.raw.size
+
+    def extend(self, values):
+        values = np.asarray(values)
+        n0 = self.raw.size
+        n1 = n0 + len(values)
+        if n1 == n0:
+            return
+        self.raw.resize(n1)
+        self.raw.data[n0:n1] = values
+
+        # rebuild only the blocks from the one holding sample n0 onwards, level by level
+        src_min = src_max = self.raw.data
+        src_n0, src_n1 = n0, n1
+        k = 0
+        while src_n1 > 1:
+            if k == len(self.levels):
+                self.levels.append((_Growable(self.raw.data.dtype), _Growable(self.raw.data.dtype)))
+            mins, maxs = self.levels[k]
+            f = self.fanout
+            b0, b1 = src_n0 // f, -(-src_n1 // f)
+            mins.resize(b1)
+            maxs.resize(b1)
+            start = b0 * f
+            edges = np.arange(start, src_n1, f) - start
+            mins.data[b0:b1] = np.minimum.reduceat(src_min[start:src_n1], edges)
+            maxs.data[b0:b1] = np.maximum.reduceat(src_max[start:src_n1], edges)
+            src_min, src_max = mins.data, maxs.data
+            src_n0, src_n1 = b0, b1
+            k += 1
+
+    def min(self):
+        return self.levels[-1][0].data[0] if self.levels else self.raw.data[0]
+
+    def max(self):
+        return self.levels[-1][1].data[0] if self.levels else self.raw.data[0]
+
+    def query(self, i0, i1, bins):
+        """Samples i0..i1 as at most 2 * bins points: (sample_index, value) arrays, each
+        group contributing its (first index, min) and (last index, max)."""
+        i0, i1 = max(0, i0), min(self.raw.size, i1)
+        n = i1 - i0
+        if n <= 2 * bins:
+            return np.arange(i0, i1), self.raw.data[i0:i1]
+
+        k, size = 0, 1                          # level 0 is the raw samples
+        while k < len(self.levels) and size * self.fanout * bins <= n:
+            k += 1
+            size *= self.fanout
+        if k == 0:
+            mins = maxs = self.raw.data
+        else:
+            mins, maxs = (g.data for g in self.levels[k - 1])
+        j0, j1 = i0 // size, -(-i1 // size)
+        blocks = j1 - j0
+        groups = min(bins, blocks)
+        edges = (np.arange(groups) * blocks) // groups
+        starts = (j0 + edges) * size
+        ends = np.minimum(np.append(starts[1:], j1 * size), self.raw.size) - 1
+
+        index = np.empty(2 * groups, dtype=np.int64)
+        value = np.empty(2 * groups, dtype=self.raw.data.dtype)
+        index[0::2] = starts
+        index[1::2] = ends
+        value[0::2] = np.minimum.reduceat(mins[j0:j1], edges)
+        value[1::2] = np.maximum.reduceat(maxs[j0:j1], edges)
+        return index, value
+
+
+class SessionSeries:
+    def __init__(self, channels):
+        self.channels = tuple(channels)
+        self.time = _Growable(np.int64)     # rx_ns live, wall clock ns from a CSV log
+        self.series = {name: MinMaxPyramid() for name in self.channels}
+
+    def __len__(self):
+        return self.time.size
+
+    def extend(self, time_ns, columns):
+        """Append a batch: time_ns sequence plus {channel: values} of the same length."""
+        n0 = self.time.size
+        self.time.resize(n0 + len(time_ns))
+        self.time.data[n0:self.time.size] = time_ns
+        for name in self.channels:
+            self.series[name].extend(columns[name])
+
+    def span_ns(self):
+        t = self.time.view()
+        return (int(t[0]), int(t[-1])) if len(t) else (0, 0)
+
+    def query(self, name, t0_ns, t1_ns, bins):
+        """(time_ns, values) of channel `name` between t0_ns and t1_ns, about 2 * bins points."""
+        t = self.time.view()
+        i0 = int(np.searchsorted(t, t0_ns, "left"))
+        i1 = int(np.searchsorted(t, t1_ns, "right"))
+        # one sample either side so lines run to the edges of the view
+        index, values = self.series[name].query(max(0, i0 - 1), min(len(t), i1 + 1), bins)
+        return t[index], values
+
+
+def load_csv_session(path, channels=("yaw",), batch_rows=LOAD_BATCH_ROWS):
+    """SessionSeries from a CsvLogger file and its segments. The time axis is the local wall
+    clock text read back as int64 ns with parse_wall_text, as the log index does; graphs
+    only use it relative to the first row."""
+    columns = {f[0]: CSV_HEADER.index(f[1]) for f in TELEMETRY_FIELDS}
+    rows = (row for row in iter_log_rows(path) if len(row) == len(CSV_HEADER))
+
+    session = SessionSeries(channels)
+    latest = None
+    while True:
+        batch = list(itertools.islice(rows, batch_rows))
+        if not batch:
+            return session
+        wall_ns = np.fromiter((parse_wall_text(row[0]) for row in batch), dtype=np.int64, count=len(batch))
+        values = {name: np.array([row[columns[name]] for row in batch], dtype=np.float32) for name in channels}
+        # several runs appended to one file: keep time non-decreasing so searchsorted holds
+        if latest is not None:
+            wall_ns[0] = max(wall_ns[0], latest)
+        np.maximum.accumulate(wall_ns, out=wall_ns)
+        latest = wall_ns[-1]
+        session.extend(wall_ns, values)
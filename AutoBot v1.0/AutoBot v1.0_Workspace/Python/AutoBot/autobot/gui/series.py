@@ -0,0 +1,74 @@
+# autobot/gui/series.py
+"""
+SeriesRing: fixed-capacity NumPy ring for a live plot series (yaw history etc.).
+
+  - append() is O(1): every sample is written twice, at i and i + capacity, so
+    the newest `len` samples are always one contiguous slice and values() is a
+    zero-copy view that can go straight into Line2D.set_data().
+  - min() / max() are O(1): two monotonic deques of (sample index, value) track
+    the running extremes of the window (amortized O(1) per append), so autoscale
+    no longer scans the whole history every frame.
+
+Single-threaded (Tk thread only).
+"""
+
+from collections import deque
+
+import numpy as np
+
+
+class SeriesRing:
+    def __init__(self, capacity, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.count = 0                          # total samples ever appended
+        self._buf = np.zeros(2 * capacity, dtype=dtype)
+        self._min = deque()                     # (index, value), values increasing
+        self._max = deque()                     # (index, value), values decreasing
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, value):
+        i = self.count
+        cap = self.capacity
+        pos = i % cap
+        buf = self._buf
+        buf[pos] = value
+        buf[pos + cap] = value
+
+        oldest = i - cap + 1    # first index still inside the window after this append
+        lows, highs = self._min, self._max
+        while lows and lows[-1][1] >= value:
+            lows.pop()
+        lows.append((i, value))
+        if lows[0][0] < oldest:
+            lows.popleft()
+        while highs and highs[-1][1] <= value:
+            highs.pop()
+        highs.append((i, value))
+        if highs[0][0] < oldest:
+            highs.popleft()
+        self.count = i + 1
+
+    def extend(self, values):
+        for v in values:
+            self.append(v)
+
+    def values(self):
+        """Oldest-to-newest view of the window. Valid until the next append()."""
+        n = len(self)
+        start = self.count % self.capacity if self.count >= self.capacity else 0
+        return self._buf[start:start + n]
+
+    def min(self):
+        return self._min[0][1]
+
+    def max(self):
+        return self._max[0][1]
+
+    def clear(self):
+        self.count = 0
+        self._min.clear()
+        self._max.clear()
@@ -0,0 +1,49 @@
+# autobot/gui/viewmodel.py
+"""
+Dirty-checked label updates for the dashboard.
+
+Each binding pairs a setter (label.configure, StringVar.set, ...) with a
+formatter fn(record) -> str. render() formats every binding once, compares the
+text with what that widget last showed and calls the setter only when it
+differs: an unchanged value costs a string compare instead of a Tcl round trip
+and a re-layout. `updates` is the number of setter calls in the last render.
+"""
+
+
+def text_setter(widget):
+    return lambda text: widget.configure(text=text)
+
+
+class LabelViewModel:
+    def __init__(self):
+        self._bindings = []     # [setter, fmt, last text]
+        self.updates = 0        # widget updates in the last render()
+        self.frames = 0
+        self.total_updates = 0
+
+    def __len__(self):
+        return len(self._bindings)
+
+    def bind(self, setter, fmt):
+        self._bindings.append([setter, fmt, None])
+
+    def render(self, record):
+        updates = 0
+        for binding in self._bindings:
+            text = binding[1](record)
+            if text != binding[2]:
+                binding[0](text)
+                binding[2] = text
+                updates += 1
+        self.updates = updates
+        self.frames += 1
+        self.total_updates += updates
+        return updates
+
+    def invalidate(self):
+        """Forget what is on screen so the next render() sets every widget."""
+        for binding in self._bindings:
+            binding[2] = None
+
+    def mean_updates(self):
+        return self.total_updates / self.frames if self.frames else 0.0
@@ -0,0 +1,11 @@
+# autobot/ingest/__init__.py
+"""Telemetry ingest: bytes from the port -> TelemetryRecord, decoded once, fanned out."""
+
+from autobot.ingest.binary import decode_frame, encode_binary
+from autobot.ingest.buffers import LatestSlot, RecordRing
+from autobot.ingest.clock import ANCHOR, WallAnchor, format_wall_ns, now_ns
+from autobot.ingest.core import IngestCore
+from autobot.ingest.framing import MAX_FRAME_BYTES, TelemetryFramer
+from autobot.ingest.link import SerialLink, list_serial_ports, open_raw, open_serial
+from autobot.ingest.reader import ChunkReader
+from autobot.ingest.schema import CSV_HEADER, EMPTY_RECORD, TELEMETRY_FIELDS, TelemetryRecord, decode_packet
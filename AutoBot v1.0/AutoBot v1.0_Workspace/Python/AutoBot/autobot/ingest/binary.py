@@ -0,0 +1,134 @@
+# autobot/ingest/binary.py
+"""
+Compact binary telemetry frames, accepted alongside the JSON lines.
+
+Wire format (all little-endian), sent as  00 <COBS(payload)> 00 :
+  payload = version:u8 | 22 x int32 | crc16:u16
+  - fields follow TELEMETRY_FIELDS order
+  - float fields are fixed-point, value * 100 (the firmware prints %.2f)
+  - crc16 is CRC-16/CCITT-FALSE (poly 0x1021, init 0xFFFF) over version + values
+
+91 payload bytes -> 94 bytes on the wire, vs ~270 bytes for the JSON line.
+decode_frame() picks the decoder per frame: JSON frames start with '{'.
+"""
+
+import struct
+from binascii import crc_hqx
+
+from autobot.ingest.schema import TELEMETRY_FIELDS, TelemetryRecord, decode_packet
+
+BINARY_VERSION = 1
+FIXED_POINT_SCALE = 100
+
+_BODY = struct.Struct("<B" + "i" * len(TELEMETRY_FIELDS))
+_CRC = struct.Struct("<H")
+PAYLOAD_SIZE = _BODY.size + _CRC.size
+
+
+# ---------------- COBS ----------------
+def cobs_encode(data):
+    out = bytearray()
+    for chunk in bytes(data).split(b"\x00"):
+        while len(chunk) >= 254:
+            out.append(0xFF)
+            out += chunk[:254]
+            chunk = chunk[254:]
+        out.append(len(chunk) + 1)
+        out += chunk
+    return bytes(out)
+
+
+def cobs_decode(data):
+    # every code byte except the leading one stands for a zero in the output, so
+    # decoding is "zero each code position, drop byte 0" until a 0xFF block shows up
+    out = bytearray(data)
+    i = 0
+    n = len(out)
+    while i < n:
+        code = out[i]
+        if code == 0:
+            raise ValueError("COBS: zero byte inside frame")
+        if code == 0xFF:
+            return _cobs_decode_blocks(data)
+        out[i] = 0
+        i += code
+    if i != n:
+        raise ValueError("COBS: truncated block")
+    del out[0]
+    return out
+
+
+def _cobs_decode_blocks(data):
+    out = bytearray()
+    i = 0
+    n = len(data)
+    while i < n:
+        code = data[i]
+        if code == 0:
+            raise ValueError("COBS: zero byte inside frame")
+        end = i + code
+        if end > n:
+            raise ValueError("COBS: truncated block")
+        out += data[i + 1:end]
+        i = end
+        if code != 0xFF and i < n:
+            out.append(0)
+    return out
+
+
+# ---------------- Encode / decode ----------------
+def _compile_codec(fields=TELEMETRY_FIELDS):
+    scale = FIXED_POINT_SCALE
+    to_wire = ", ".join(
+        f"int(v[{i}])" if kind is int else f"round(v[{i}] * {scale})"
+        for i, (_, _, _, kind) in enumerate(fields)
+    )
+    from_wire = ", ".join(
+        f"v[{i + 1}]" if kind is int else f"v[{i + 1}] / {scale}"
+        for i, (_, _, _, kind) in enumerate(fields)
+    )
+    src = (
+        "def pack_values(v):\n"
+        f"    return pack(version, {to_wire})\n"
+        "def unpack_values(v):\n"
+        f"    return ({from_wire},)\n"
+    )
+    namespace = {"pack": _BODY.pack, "version": BINARY_VERSION}
+    exec(src, namespace)
+    return namespace["pack_values"], namespace["unpack_values"]
+
+
+_pack_values, _unpack_values = _compile_codec()
+
+
+def encode_binary(values):
+    """Return the on-wire bytes (delimiters included) for one record / value sequence."""
+    body = _pack_values(values)
+    return b"\x00" + cobs_encode(body + _CRC.pack(crc_hqx(body, 0xFFFF))) + b"\x00"
+
+
+def decode_binary_values(frame):
+    """
+    Decode one COBS frame (delimiters stripped) into a tuple of field values.
+    Raises ValueError on bad COBS, length, CRC or version.
+    """
+    raw = cobs_decode(frame)
+    if len(raw) != PAYLOAD_SIZE:
+        raise ValueError(f"binary frame: {len(raw)} bytes, expected {PAYLOAD_SIZE}")
+    crc, = _CRC.unpack_from(raw, _BODY.size)
+    if crc_hqx(memoryview(raw)[:_BODY.size], 0xFFFF) != crc:
+        raise ValueError("binary frame: CRC mismatch")
+    if raw[0] != BINARY_VERSION:
+        raise ValueError(f"binary frame: unsupported version {raw[0]}")
+    return _unpack_values(_BODY.unpack_from(raw))
+
+
+def decode_binary(frame, _new=tuple.__new__, _rec=TelemetryRecord):
+    return _new(_rec, decode_binary_values(frame))
+
+
+def decode_frame(frame):
+    """Decode a JSON line or a binary frame into a TelemetryRecord."""
+    if frame[0] == 0x7B:  # '{'
+        return decode_packet(frame)
+    return decode_binary(frame)
@@ -0,0 +1,87 @@
+# autobot/ingest/buffers.py
+"""
+Hand-off primitives between the serial reader thread and its consumers.
+
+  - LatestSlot: single-writer latest-value cell with a version counter. The GUI
+    only ever wants the newest record, so it reads in O(1) instead of draining
+    a queue every tick.
+  - RecordRing: bounded single-producer / single-consumer ring for the CSV
+    logger. When full, put() refuses the new row and counts it in .overflows,
+    so lost rows are reported instead of silently evicting older ones.
+
+Both rely on CPython attribute stores being atomic: the writer publishes a
+value before advancing the counter the reader looks at. No locks are taken.
+"""
+
+
+class LatestSlot:
+    def __init__(self):
+        self._cell = (0, None)   # (version, value), replaced as one object
+
+    def publish(self, value):
+        self._cell = (self._cell[0] + 1, value)
+
+    @property
+    def version(self):
+        return self._cell[0]
+
+    def get(self):
+        """Return (version, value); version 0 means nothing published yet."""
+        return self._cell
+
+    def get_if_newer(self, seen_version):
+        """Return (version, value) if something newer than seen_version was published, else None."""
+        cell = self._cell
+        return cell if cell[0] != seen_version else None
+
+
+class RecordRing:
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.overflows = 0
+        self._slots = [None] * capacity
+        self._head = 0    # total items written (writer only)
+        self._tail = 0    # total items consumed (reader only)
+
+    def __len__(self):
+        return self._head - self._tail
+
+    @property
+    def written(self):
+        """Items accepted by put() so far (overflows not included)."""
+        return self._head
+
+    # -------- producer --------
+    def put(self, item):
+        """Append item; returns False (and counts an overflow) if the ring is full."""
+        head = self._head
+        if head - self._tail >= self.capacity:
+            self.overflows += 1
+            return False
+        self._slots[head % self.capacity] = item
+        self._head = head + 1
+        return True
+
+    # -------- consumer --------
+    def drain(self, max_items=None):
+        """Remove and return up to max_items items, oldest first."""
+        tail = self._tail
+        head = self._head
+        if max_items is not None:
+            head = min(head, tail + max_items)
+        if head == tail:
+            return []
+        slots = self._slots
+        cap = self.capacity
+        start, end = tail % cap, head % cap
+        if start < end:
+            items = slots[start:end]
+            slots[start:end] = [None] * (end - start)
+        else:
+            items = slots[start:] + slots[:end]
+            slots[start:] = [None] * (cap - start)
+            slots[:end] = [None] * end
+        self._tail = head
+        return items
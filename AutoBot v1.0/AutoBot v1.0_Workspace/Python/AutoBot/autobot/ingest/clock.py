@@ -0,0 +1,63 @@
+# autobot/ingest/clock.py
+"""
+Host receive timestamps.
+Every frame is stamped once, when the reader gets its bytes, with
+time.monotonic_ns(): int64 nanoseconds that never jump with NTP or DST. A wall
+clock anchor taken at startup maps them to epoch time. The pipeline carries the
+int64 value; text is only produced at export (CSV rows, reports).
+"""
+
+import time
+
+now_ns = time.monotonic_ns
+NS_PER_S = 1_000_000_000
+
+
+class WallAnchor:
+    """Pairs one monotonic_ns reading with the wall clock (time.time_ns) at the same instant."""
+
+    def __init__(self, wall_ns=None, mono_ns=None):
+        if wall_ns is None or mono_ns is None:
+            m0 = time.monotonic_ns()
+            wall_ns = time.time_ns()
+            m1 = time.monotonic_ns()
+            mono_ns = (m0 + m1) // 2
+        self.wall_ns = wall_ns
+        self.mono_ns = mono_ns
+
+    def to_wall_ns(self, mono_ns):
+        return mono_ns - self.mono_ns + self.wall_ns
+
+    def format(self, mono_ns):
+        return format_wall_ns(self.to_wall_ns(mono_ns))
+
+
+ANCHOR = WallAnchor()
+
+_second_cache = (None, "")    # (epoch second, formatted prefix), replaced as one object
+
+
+def format_wall_ns(wall_ns):
+    """Local time 'YYYY-mm-dd HH:MM:SS.ffffff' (strftime runs once per second, not per row)."""
+    global _second_cache
+    sec, ns = divmod(wall_ns, NS_PER_S)
+    cached_sec, prefix = _second_cache
+    if cached_sec != sec:
+        prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _second_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}"
+
+
+_parse_cache = (None, 0)      # ('YYYY-mm-dd HH:MM:SS', epoch second)
+
+
+def parse_wall_text(text):
+    """Inverse of format_wall_ns: local 'YYYY-mm-dd HH:MM:SS[.ffffff]' -> epoch ns (mktime once per second)."""
+    global _parse_cache
+    prefix = text[:19]
+    cached, sec = _parse_cache
+    if cached != prefix:
+        sec = int(time.mktime(time.strptime(prefix, "%Y-%m-%d %H:%M:%S")))
+        _parse_cache = (prefix, sec)
+    frac = text[20:26]
+    return sec * NS_PER_S + (int(frac.ljust(6, "0")) * 1000 if frac else 0)
@@ -0,0 +1,80 @@
+# autobot/ingest/core.py
+"""
+Shared ingest core: frame -> decode once -> fan out.
+One IngestCore per serial port. Every complete frame is decoded exactly once
+and the resulting TelemetryRecord is handed to each subscriber as
+fn(record, rx_ns), where rx_ns is the monotonic receive time of the chunk that
+completed the frame. Subscribers run on the reader thread and must not block:
+publish to a LatestSlot, put into a RecordRing, or wake a worker.
+
+    core = IngestCore()
+    core.subscribe(lambda rec, rx_ns: gui_slot.publish(rec))
+    core.subscribe(lambda rec, rx_ns: log_ring.put((rx_ns, rec)))
+    core.run(ser, stop_event)
+"""
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.clock import now_ns
+from autobot.ingest.framing import MAX_FRAME_BYTES, TelemetryFramer
+from autobot.ingest.reader import READ_TIMEOUT, ChunkReader, PortClosed
+
+
+class IngestCore:
+    def __init__(self, max_frame=MAX_FRAME_BYTES, decode=decode_frame):
+        self.framer = TelemetryFramer(max_frame)
+        self.decode = decode
+        self.subscribers = []
+        self.frames = 0         # complete frames seen
+        self.decodes = 0        # decode calls (== frames; checked by benchmarks/bench_fanout.py)
+        self.errors = 0
+        self._rx_ns = 0
+
+    def subscribe(self, fn):
+        self.subscribers.append(fn)
+        return fn
+
+    def unsubscribe(self, fn):
+        try:
+            self.subscribers.remove(fn)
+        except ValueError:
+            pass
+
+    def feed(self, chunk, rx_ns=None):
+        self._rx_ns = now_ns() if rx_ns is None else rx_ns
+        self.framer.feed(chunk, self._on_frame)
+
+    def _on_frame(self, frame):
+        self.frames += 1
+        self.decodes += 1
+        try:
+            record = self.decode(frame)
+        except Exception as e:
+            self.errors += 1
+            print("Frame decode error:", e, "| FRAME:", frame.tobytes()[:120])
+            return
+        rx_ns = self._rx_ns
+        for fn in self.subscribers:
+            try:
+                fn(record, rx_ns)
+            except Exception as e:
+                print("[Ingest] Subscriber failed:", e)
+
+    def run(self, port, stop_event, timeout=READ_TIMEOUT):
+        """Read port until stop_event is set, the port closes or the read fails. Blocks; run it on a thread."""
+        reader = ChunkReader(port, timeout)
+        try:
+            while not stop_event.is_set():
+                try:
+                    chunk = reader.read()
+                except PortClosed:
+                    print("[Serial] Port closed")
+                    break
+                except Exception as e:
+                    print("[Serial] Read error:", e)
+                    break
+                if chunk:
+                    self.feed(chunk)
+        finally:
+            reader.close()
+        if self.framer.overflows:
+            print(f"[Serial] Dropped {self.framer.overflows} oversized frame(s)")
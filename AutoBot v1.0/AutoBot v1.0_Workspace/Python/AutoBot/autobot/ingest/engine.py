@@ -0,0 +1,394 @@
+# autobot/ingest/engine.py
+"""
+asyncio ingest engine: one event loop hosts every serial source and sink.
+Every runtime reads its ports through it: autobot-daemon, the GUI's ingest
+child process (autobot/ingest/shm.py) and the GUI's in-process mode
+(EngineLink below).
+
+  - sources: serial fds registered with loop.add_reader (POSIX); ports without a
+    usable fd (Windows COM) fall back to a ChunkReader on an executor thread.
+    Each source has its own IngestCore (framer, decode once, fan-out), fed
+    from the loop thread. add_port() sources are opened on a thread of their own
+    and reopened every `reconnect` seconds after they close or fail to open;
+    on_status(name, "Connected" / "Disconnected") follows them.
+  - consumers: IngestCore-style subscribers fn(record, rx_ns) via subscribe(),
+    run on the loop thread for every source; sinks (autobot.sinks.aio:
+    LoggerSink, LatestSink) get the source name too, own a task and are closed
+    when the engine stops.
+  - the Tk side: subscribers publish to a LatestSlot that the GUI's `after`
+    tick polls (AutobotGui.update_gui), so the loop never waits for Tk.
+
+Runs headless:
+    python -m autobot.ingest.engine --simulate 4 --seconds 10 --csv /tmp/autobot.csv
+    python -m autobot.ingest.engine --port /dev/ttyACM0 --baud 115200
+"""
+
+import argparse
+import asyncio
+import os
+import threading
+import time
+
+from autobot.ingest.clock import now_ns
+from autobot.ingest.core import IngestCore
+from autobot.ingest.link import open_serial
+from autobot.ingest.reader import READ_CHUNK, READ_TIMEOUT, ChunkReader, PortClosed
+from autobot.sinks.aio import LatestSink, LoggerSink
+
+
+# ---------------- Engine ----------------
+class IngestEngine:
+    def __init__(self, reconnect=None, on_status=None):
+        self.reconnect = reconnect      # s between reopen attempts of add_port() sources (None = never)
+        self.on_status = on_status      # fn(name, text) for add_port() sources, on the loop thread
+        self.sinks = []
+        self.subscribers = []
+        self.cores = {}                 # source name -> IngestCore
+        self.sources = {}               # source name -> (port, fd) while open
+        self.loop = None
+        self._stopped = None
+        self._stop_requested = False    # stop() before run() got going
+        self._thread = None
+        self._pending = []              # sources added before the loop runs
+        self._closed = {}               # source name -> future set when the source closes
+        self._supervisors = {}          # add_port() name -> task keeping it open
+
+    # -------- consumers --------
+    def add_sink(self, sink):
+        """Sinks are added before run(); their tasks start with the loop."""
+        self.sinks.append(sink)
+        return sink
+
+    def subscribe(self, fn):
+        """fn(record, rx_ns) for every record of every source, on the loop thread; any thread may call this."""
+        self._when_running(self._subscribe, fn)
+        return fn
+
+    def _subscribe(self, fn):
+        self.subscribers.append(fn)
+        for core in self.cores.values():
+            core.subscribe(fn)
+
+    @staticmethod
+    def _connect_sink(name, core, sink):
+        core.subscribe(lambda record, rx_ns: sink.submit(name, record, rx_ns))
+
+    def _core(self, name):
+        core = self.cores.get(name)
+        if core is None:
+            core = self.cores[name] = IngestCore()
+            for sink in self.sinks:
+                self._connect_sink(name, core, sink)
+            for fn in self.subscribers:
+                core.subscribe(fn)
+        return core
+
+    @property
+    def frames(self):
+        return sum(core.frames for core in self.cores.values())
+
+    @property
+    def errors(self):
+        return sum(core.errors for core in self.cores.values())
+
+    # -------- sources --------
+    def add_source(self, name, port):
+        """port: pyserial Serial, a file object or anything with fileno()/read(); the caller closes it."""
+        self._when_running(self._attach, name, port)
+
+    def add_port(self, name, opener, *args):
+        """Open opener(*args) on a thread of its own and keep it open: the engine closes it,
+        and reopens it every `reconnect` seconds when it closes or cannot be opened."""
+        self._when_running(self._supervise, name, opener, args)
+
+    def remove_port(self, name):
+        """Stop reading an add_port() source and close it (or give up opening it)."""
+        self._when_running(self._unsupervise, name)
+
+    def _when_running(self, fn, *args):
+        if self.loop is None:
+            self._pending.append((fn, args))
+        else:
+            self.loop.call_soon_threadsafe(fn, *args)
+
+    def _supervise(self, name, opener, args):
+        self._unsupervise(name)
+        self._supervisors[name] = asyncio.ensure_future(self._keep_open(name, opener, args))
+
+    def _unsupervise(self, name):
+        task = self._supervisors.pop(name, None)
+        if task is not None:
+            task.cancel()
+
+    def _status(self, name, text):
+        if self.on_status is not None:
+            try:
+                self.on_status(name, text)
+            except Exception as e:
+                print(f"[{name}] Status callback failed:", e)
+
+    async def _keep_open(self, name, opener, args):
+        while True:
+            try:
+                port = await self._open(opener, args)
+            except Exception as e:
+                print(f"[{name}] Open failed:", e)
+                self._status(name, "Disconnected")
+            else:
+                print(f"[{name}] Opened")
+                self._status(name, "Connected")
+                try:
+                    await self._attach(name, port)
+                finally:
+                    self._detach(name)
+                    port.close()
+                    self._status(name, "Disconnected")
+            if not self.reconnect:
+                return
+            await asyncio.sleep(self.reconnect)
+
+    def _open(self, opener, args):
+        # a daemon thread rather than the executor: an open that never returns (a FIFO without
+        # a writer) must not hold up the loop's shutdown; a port it opens after stop() is closed
+        loop = self.loop
+        opened = loop.create_future()
+
+        def done(port, error):
+            if opened.cancelled():
+                if port is not None:
+                    port.close()
+            elif error is not None:
+                opened.set_exception(error)
+            else:
+                opened.set_result(port)
+
+        def target():
+            port = error = None
+            try:
+                port = opener(*args)
+            except Exception as e:
+                error = e
+            try:
+                loop.call_soon_threadsafe(done, port, error)
+            except RuntimeError:        # loop already closed
+                if port is not None:
+                    port.close()
+
+        threading.Thread(target=target, name="port-open", daemon=True).start()
+        return opened
+
+    def _attach(self, name, port):
+        """Start reading port; returns a future that is done once the source has closed."""
+        core = self._core(name)
+        core.framer.reset()
+        closed = self._closed[name] = self.loop.create_future()
+        try:
+            fd = port.fileno()
+            self.loop.add_reader(fd, self._on_readable, name, fd, core)
+        except (AttributeError, OSError, NotImplementedError):
+            fd = None
+        self.sources[name] = (port, fd)
+        if fd is None:
+            # no pollable fd (Windows COM port, regular file): blocking reads on a worker thread,
+            # which runs while the source is listed
+            self.loop.run_in_executor(None, self._blocking_source, name, port, core)
+        return closed
+
+    def _detach(self, name):
+        port, fd = self.sources.pop(name, (None, None))
+        if fd is not None:
+            self.loop.remove_reader(fd)
+        closed = self._closed.pop(name, None)
+        if closed is not None and not closed.done():
+            closed.set_result(None)
+
+    def _on_readable(self, name, fd, core):
+        try:
+            data = os.read(fd, READ_CHUNK)
+        except OSError as e:
+            data = b""
+            print(f"[{name}] Read error:", e)
+        if not data:
+            print(f"[{name}] Source closed")
+            self._detach(name)
+            return
+        core.feed(data, now_ns())
+
+    def _blocking_source(self, name, port, core):
+        reader = ChunkReader(port)
+        try:
+            while not self._stopped.is_set() and name in self.sources:
+                try:
+                    chunk = reader.read()
+                except PortClosed:
+                    print(f"[{name}] Source closed")
+                    break
+                except Exception as e:
+                    print(f"[{name}] Read error:", e)
+                    break
+                if chunk:
+                    self.loop.call_soon_threadsafe(core.feed, chunk, now_ns())
+        finally:
+            reader.close()
+            if not self.loop.is_closed():
+                self.loop.call_soon_threadsafe(self._detach, name)
+
+    # -------- running --------
+    async def run(self):
+        self.loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        if self._stop_requested:
+            self._stopped.set()
+        for fn, args in self._pending:
+            fn(*args)
+        self._pending = []
+        tasks = [asyncio.ensure_future(sink.run()) for sink in self.sinks]
+        try:
+            await self._stopped.wait()
+        finally:
+            supervisors = list(self._supervisors.values())
+            self._supervisors = {}
+            for name in list(self.sources):
+                self._detach(name)
+            for t in supervisors + tasks:
+                t.cancel()
+            await asyncio.gather(*supervisors, *tasks, return_exceptions=True)
+            for sink in self.sinks:
+                await sink.close()
+            self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+        if self.loop is not None and self._stopped is not None:
+            try:
+                self.loop.call_soon_threadsafe(self._stopped.set)
+            except RuntimeError:        # loop already closed
+                pass
+
+    # -------- hosting the loop next to a GUI or daemon --------
+    def start_in_thread(self):
+        ready = threading.Event()
+
+        def target():
+            async def main():
+                ready.set()
+                await self.run()
+            asyncio.run(main())
+
+        self._thread = threading.Thread(target=target, name="ingest-engine", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+class EngineLink:
+    """
+    SerialLink's interface (core.subscribe, connected, start, stop, on_status)
+    over an IngestEngine on a thread of its own, reading one port at a time:
+    the GUI's in-process ingest. core is the engine itself; its subscribe()
+    reaches every port's IngestCore.
+    """
+
+    def __init__(self, opener=open_serial, read_timeout=READ_TIMEOUT, on_status=None):
+        self.engine = IngestEngine(on_status=self._on_status)
+        self.core = self.engine
+        self.opener = opener            # fn(port_name, baud, timeout) -> port
+        self.read_timeout = read_timeout
+        self.on_status = on_status      # fn(text), called from the engine thread
+        self.connected = threading.Event()
+        self.port_name = None
+        self._idle = threading.Event()  # no port open
+        self._idle.set()
+
+    def start(self, port_name, baud):
+        self.stop()
+        if not self.engine.running:
+            self.engine.start_in_thread()
+        self.port_name = port_name
+        self.engine.add_port(port_name, self.opener, port_name, baud, self.read_timeout)
+        return self
+
+    def stop(self, timeout=None):
+        """Close the port on the engine thread. Waits for it if timeout is given."""
+        if self.port_name is not None:
+            self.engine.remove_port(self.port_name)
+            self.port_name = None
+            if timeout is not None:
+                self._idle.wait(timeout)
+
+    def close(self, timeout=1.0):
+        """Stop the engine thread as well."""
+        self.stop()
+        self.engine.stop()
+        self.engine.join(timeout)
+
+    def _on_status(self, name, text):
+        if text == "Connected":
+            self._idle.clear()
+            self.connected.set()
+        else:
+            self.connected.clear()
+            self._idle.set()
+        if self.on_status is not None:
+            self.on_status(text)
+
+
+# ---------------- Headless entry ----------------
+def main():
+    parser = argparse.ArgumentParser(description="AUTOBOT asyncio ingest engine (headless)")
+    parser.add_argument("--port", action="append", default=[], help="serial port (repeatable)")
+    parser.add_argument("--baud", type=int, default=115200)
+    parser.add_argument("--simulate", type=int, default=0, help="number of pty robot simulators to host")
+    parser.add_argument("--rate", type=float, default=50.0, help="simulator packets per second")
+    parser.add_argument("--seconds", type=float, default=0.0, help="stop after this long (0 = run until Ctrl+C)")
+    parser.add_argument("--csv", default=None, help="append decoded rows to this CSV file")
+    parser.add_argument("--reconnect", type=float, default=2.0, help="seconds between reopen attempts of --port")
+    args = parser.parse_args()
+
+    engine = IngestEngine(args.reconnect)
+    latest = engine.add_sink(LatestSink())
+    if args.csv:
+        from autobot.sinks.csv_log import CsvLogger
+        logger = CsvLogger(args.csv)
+        logger.enabled.set()
+        engine.add_sink(LoggerSink(logger))
+
+    sims = []
+    if args.simulate:
+        from autobot.simulator import RobotSimulator
+        for i in range(args.simulate):
+            sim = RobotSimulator("json", rate_hz=args.rate).start()
+            sims.append(sim)
+            engine.add_source(f"sim{i}", open(sim.slave_fd, "rb", buffering=0, closefd=False))
+    for port in args.port:
+        engine.add_port(port, open_serial, port, args.baud, READ_TIMEOUT)
+
+    t0 = time.perf_counter()
+    cpu0 = time.process_time()
+    engine.start_in_thread()
+    try:
+        while not args.seconds or time.perf_counter() - t0 < args.seconds:
+            time.sleep(min(1.0, args.seconds or 1.0))
+            print(f"[Engine] {engine.frames} frames, {engine.errors} errors, {len(latest.latest)} sources")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.stop()
+        engine.join(2.0)
+        for sim in sims:
+            sim.close()
+    elapsed = time.perf_counter() - t0
+    cpu = time.process_time() - cpu0
+    print(f"[Engine] {engine.frames / elapsed:.0f} frames/s, CPU {cpu / elapsed * 100:.1f}% of a core")
+
+
+if __name__ == "__main__":
+    main()
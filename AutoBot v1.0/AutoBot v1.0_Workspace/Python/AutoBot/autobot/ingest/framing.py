@@ -0,0 +1,201 @@
+# autobot/ingest/framing.py
+"""
+Newline framing for the STM32 telemetry stream.
+Raw serial bytes go into one reusable bytearray; complete lines are handed to the
+caller as memoryview slices (no str decode, no re-copy of the remaining buffer).
+A frame that never sees its newline is dropped once it exceeds max_frame bytes.
+A chunk without a delimiter costs one int membership test (memchr) and an
+append; benchmarks/bench_framing.py compares it with the legacy str split loop.
+"""
+
+MAX_FRAME_BYTES = 4096
+_TRIM = b" \t\r"
+
+
+def _trim(buf, start, end):
+    while start < end and buf[start] in _TRIM:
+        start += 1
+    while end > start and buf[end - 1] in _TRIM:
+        end -= 1
+    return start, end
+
+
+class LineFramer:
+    def __init__(self, max_frame=MAX_FRAME_BYTES, delimiter=b"\n"):
+        if len(delimiter) != 1:
+            raise ValueError("delimiter must be a single byte")
+        self.max_frame = max_frame
+        self.delimiter = delimiter
+        self.frames = 0
+        self.overflows = 0
+        self._byte = delimiter[0]  # int: `int in bytes` is a memchr, `bytes in bytes` is not
+        self._buf = bytearray()
+        self._discarding = False   # True while skipping the tail of an oversized frame
+
+    def __len__(self):
+        return len(self._buf)
+
+    def reset(self):
+        self._buf.clear()
+        self._discarding = False
+
+    def feed(self, data, on_frame):
+        """
+        Append raw bytes and call on_frame(view) for every complete line.
+        The view is only valid inside the callback (it is released afterwards);
+        use bytes(view) to keep a copy.
+        """
+        buf = self._buf
+        buf += data
+        if self._byte not in data:
+            # common case at low baud: no complete line yet
+            if len(buf) > self.max_frame:
+                self._overflow()
+            return
+
+        delim = self.delimiter
+        find = buf.find
+        nl = find(delim, len(buf) - len(data))
+        start = 0
+        if self._discarding:
+            # tail of an overflowed frame: resync on this delimiter
+            self._discarding = False
+            start = nl + 1
+            nl = find(delim, start)
+        frames = 0
+        mv = memoryview(buf)
+        try:
+            while nl >= 0:
+                end = nl
+                if buf[start] in _TRIM or buf[end - 1] in _TRIM:
+                    start, end = _trim(buf, start, end)
+                if end > start:
+                    frames += 1
+                    frame = mv[start:end]
+                    try:
+                        on_frame(frame)
+                    finally:
+                        frame.release()
+                start = nl + 1
+                nl = find(delim, start)
+        finally:
+            mv.release()
+            self.frames += frames
+
+        # compact once per feed; deleting from the front of a bytearray is cheap
+        del buf[:start]
+        if len(buf) > self.max_frame:
+            self._overflow()
+
+    def _overflow(self):
+        self.overflows += 1
+        self._discarding = True
+        self._buf.clear()
+
+
+_JSON_START = 0x7B   # '{'
+_NEWLINE = 0x0A
+_ZERO = 0x00
+_WHITESPACE = b" \t\r\n"
+
+
+class TelemetryFramer(LineFramer):
+    """
+    Frames a stream that mixes JSON lines and 0x00-delimited COBS frames
+    (see autobot.ingest.binary). A frame starting with '{' runs to the next newline;
+    anything that follows a 0x00 delimiter runs to the next 0x00. COBS data never
+    contains 0x00, JSON text never contains 0x00, so one byte decides the format.
+    JSON views are whitespace-trimmed, binary views are passed through untouched.
+    A port (re)opened mid-stream usually starts inside a frame, and the links
+    call reset() on every open: after it, unless the first byte past leading
+    whitespace is '{' or 0x00, everything up to the first delimiter is skipped,
+    so a partial line never reaches a decoder. An overflow resyncs the same way.
+    """
+
+    def __init__(self, max_frame=MAX_FRAME_BYTES):
+        super().__init__(max_frame)
+        self._scan = 0             # buffer offset already searched for a delimiter
+        self._after_zero = False   # last consumed delimiter was 0x00
+        self._syncing = False      # reset() since the last frame boundary
+
+    def reset(self):
+        super().reset()
+        self._scan = 0
+        self._after_zero = False
+        self._syncing = True
+
+    def _overflow(self):
+        super()._overflow()
+        self._scan = 0
+
+    def feed(self, data, on_frame):
+        buf = self._buf
+        buf += data
+        if _NEWLINE not in data and _ZERO not in data:
+            # no delimiter of either kind, so no frame can have ended
+            if len(buf) > self.max_frame:
+                self._overflow()
+            return
+        n = len(buf)
+        start = 0
+        with memoryview(buf) as mv:
+            while start < n:
+                if self._discarding:
+                    nl = buf.find(b"\n", self._scan)
+                    zero = buf.find(b"\x00", self._scan)
+                    end = nl if zero < 0 or 0 <= nl < zero else zero
+                    if end < 0:
+                        start = n
+                        break
+                    self._discarding = False
+                    self._after_zero = end == zero
+                    start = end + 1
+                    self._scan = start
+                    continue
+
+                b = buf[start]
+                if self._syncing:
+                    if b in _WHITESPACE:
+                        # a newline is a boundary; other whitespace does not decide anything yet
+                        self._syncing = b != _NEWLINE
+                        start += 1
+                        continue
+                    self._syncing = False
+                    if b != _JSON_START and b != _ZERO:
+                        self._discarding = True
+                        self._scan = start
+                        continue
+
+                # skip inter-frame filler
+                if b == _ZERO:
+                    self._after_zero = True
+                    start += 1
+                    continue
+                if not self._after_zero and b in _WHITESPACE:
+                    start += 1
+                    continue
+
+                binary = b != _JSON_START and self._after_zero
+                end = buf.find(b"\x00" if binary else b"\n", max(start, self._scan))
+                if end < 0:
+                    break
+
+                frame_end = end
+                if not binary:
+                    while frame_end > start and buf[frame_end - 1] in _TRIM:
+                        frame_end -= 1
+                    self._after_zero = False
+                if frame_end > start:
+                    self.frames += 1
+                    frame = mv[start:frame_end]
+                    try:
+                        on_frame(frame)
+                    finally:
+                        frame.release()
+                start = end + 1
+                self._scan = start
+
+        del buf[:start]
+        self._scan = len(buf)
+        if self._scan > self.max_frame:
+            self._overflow()
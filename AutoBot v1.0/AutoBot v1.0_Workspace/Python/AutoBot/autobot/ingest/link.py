@@ -0,0 +1,87 @@
+# autobot/ingest/link.py
+"""
+SerialLink: one serial port, one reader thread, one IngestCore.
+Used by the GUI's Connect/Disconnect buttons and by headless runs alike; the
+caller subscribes sinks to link.core and watches link.connected.
+"""
+
+import threading
+
+from autobot.ingest.core import IngestCore
+from autobot.ingest.framing import MAX_FRAME_BYTES
+from autobot.ingest.reader import READ_TIMEOUT
+
+
+def open_serial(port_name, baud, timeout=READ_TIMEOUT):
+    import serial
+    return serial.Serial(port_name, baud, timeout=timeout)
+
+
+def open_raw(port_name, baud=None, timeout=None):
+    """Plain unbuffered file for a pty or FIFO (simulator, socat); baud / timeout unused."""
+    return open(port_name, "rb", buffering=0)
+
+
+def list_serial_ports():
+    import serial.tools.list_ports
+    return [p.device for p in serial.tools.list_ports.comports()]
+
+
+class SerialLink:
+    def __init__(self, max_frame=MAX_FRAME_BYTES, read_timeout=READ_TIMEOUT, on_status=None, opener=open_serial):
+        self.core = IngestCore(max_frame)
+        self.read_timeout = read_timeout
+        self.on_status = on_status      # fn(text), called from the reader thread
+        self.opener = opener            # fn(port_name, baud, timeout) -> port
+        self.connected = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.port = None
+        self._lock = threading.Lock()   # guards opening/closing self.port
+
+    def start(self, port_name, baud):
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._run, args=(port_name, baud), name="serial-reader", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        """Ask the reader to exit; it notices within read_timeout. Joins if timeout is given."""
+        self.stop_event.set()
+        if timeout is not None and self.thread is not None:
+            self.thread.join(timeout)
+
+    def _status(self, text):
+        if self.on_status is not None:
+            try:
+                self.on_status(text)
+            except Exception:
+                pass
+
+    def _run(self, port_name, baud):
+        try:
+            with self._lock:
+                self.port = self.opener(port_name, baud, self.read_timeout)
+            self.connected.set()
+            self._status("Connected")
+            print(f"[Serial] Opened {port_name} @ {baud}")
+        except Exception as e:
+            self.connected.clear()
+            self._status("Disconnected")
+            print("[Serial] Open failed:", e)
+            return
+
+        self.core.framer.reset()
+        # this thread owns the port; _lock only guards opening/closing it
+        self.core.run(self.port, self.stop_event, self.read_timeout)
+
+        with self._lock:
+            try:
+                if self.port is not None:
+                    self.port.close()
+            except Exception:
+                pass
+            self.port = None
+        self.connected.clear()
+        self._status("Disconnected")
+        print("[Serial] Reader exiting")
@@ -0,0 +1,76 @@
+# autobot/ingest/reader.py
+"""
+Event-driven serial reads for the telemetry reader thread.
+ChunkReader.read() blocks until bytes arrive (or the timeout expires) and then
+returns everything available in one chunk, so the reader thread sleeps in the
+kernel while the robot is quiet instead of polling every millisecond.
+  - POSIX (pyserial PosixSerial, pty, any object with a real fileno()):
+    selectors + one os.read() per wake-up (select() for regular files)
+  - otherwise (Windows COM ports): pyserial blocking read(1) with the port
+    timeout, then read(in_waiting) for the rest of the burst
+A readable fd that returns no bytes is end of file (USB unplugged, FIFO / pipe
+writer gone): read() raises PortClosed instead of reporting a quiet port, so
+the reader loop ends and the link can be reopened.
+"""
+
+import io
+import os
+import selectors
+
+READ_TIMEOUT = 0.1      # s; also bounds how long a disconnect waits for the thread
+READ_CHUNK = 65536
+
+
+class PortClosed(EOFError):
+    """The port reached end of file; no more data will arrive on it."""
+
+
+class ChunkReader:
+    def __init__(self, port, timeout=READ_TIMEOUT, chunk=READ_CHUNK):
+        self.port = port
+        self.timeout = timeout
+        self.chunk = chunk
+        self._sel = None
+        self._fd = None
+        try:
+            fd = port.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            fd = None
+        if fd is not None and os.name == "posix":
+            self._fd = fd
+            self._sel = selectors.DefaultSelector()
+            try:
+                self._sel.register(fd, selectors.EVENT_READ)
+            except PermissionError:
+                # epoll refuses regular files (a replay capture); select() reports them readable
+                self._sel.close()
+                self._sel = selectors.SelectSelector()
+                self._sel.register(fd, selectors.EVENT_READ)
+        elif getattr(port, "timeout", timeout) != timeout:
+            port.timeout = timeout
+
+    @property
+    def event_driven(self):
+        return self._sel is not None
+
+    def read(self):
+        """Return the next chunk of bytes, or b"" if nothing arrived within timeout.
+        Raises PortClosed at end of file."""
+        if self._sel is not None:
+            if not self._sel.select(self.timeout):
+                return b""
+            data = os.read(self._fd, self.chunk)
+            if not data:
+                raise PortClosed("port closed")
+            return data
+        data = self.port.read(1)
+        if data:
+            waiting = self.port.in_waiting
+            if waiting:
+                data += self.port.read(min(waiting, self.chunk))
+        return data
+
+    def close(self):
+        if self._sel is not None:
+            self._sel.close()
+            self._sel = None
@@ -0,0 +1,303 @@
+# autobot/ingest/shm.py
+"""
+Process-isolated ingest: a child process reads + decodes the serial stream and
+writes fixed-width records into a multiprocessing.shared_memory ring backed by a
+NumPy structured array. GUI / logger processes attach by name and consume by
+sequence number; nothing is pickled on the data path, so a slow matplotlib
+redraw in the GUI can no longer hold the GIL the reader needs.
+
+Layout:  64-byte header (uint64 write_seq, capacity, record size,
+         int64 anchor wall_ns, anchor mono_ns) | records
+Each record carries its own seq and int64 monotonic receive time (rx_ns); the
+anchor in the header lets any attached process turn rx_ns into wall time. The
+single writer makes four separate stores: 0 into the slot's seq, the other
+fields, the slot's seq, then write_seq. Readers copy the slots, then read the
+slots' seq again: a record counts as lost unless its seq was the expected one
+both in the copy and afterwards, so a copy the writer overwrote halfway is
+dropped. (The stores are plain numpy writes, in program order on x86-64's
+total store order; there is no explicit fence.)
+
+The child reads its port with an IngestEngine (autobot/ingest/engine.py) and
+ends when the port closes. ProcessLink puts SerialLink's interface
+(core.subscribe, connected, start, stop) over an IngestProcess; the GUI uses
+it, so its redraws cannot starve the reader.
+"""
+
+import asyncio
+import multiprocessing as mp
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from autobot.ingest.clock import ANCHOR, WallAnchor
+from autobot.ingest.core import IngestCore
+from autobot.ingest.engine import IngestEngine
+from autobot.ingest.link import open_raw, open_serial
+from autobot.ingest.reader import READ_TIMEOUT
+from autobot.ingest.schema import TELEMETRY_FIELDS, TelemetryRecord
+
+HEADER_BYTES = 64
+DEFAULT_CAPACITY = 1 << 16     # ~11 MB, ~5 min of history at 200 Hz
+PUMP_INTERVAL = 0.02           # s between ProcessLink reads of the ring
+
+RECORD_DTYPE = np.dtype(
+    [("seq", "<u8"), ("rx_ns", "<i8")]
+    + [(name, "<i4" if kind is int else "<f8") for name, _, _, kind in TELEMETRY_FIELDS]
+)
+
+
+class ShmRing:
+    def __init__(self, name=None, capacity=DEFAULT_CAPACITY, create=True, untrack=False):
+        size = HEADER_BYTES + capacity * RECORD_DTYPE.itemsize
+        if create:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self._header = np.ndarray((3,), dtype="<u8", buffer=self.shm.buf)
+            self._header[:] = (0, capacity, RECORD_DTYPE.itemsize)
+            self._anchor_words()[:] = (ANCHOR.wall_ns, ANCHOR.mono_ns)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            if untrack:
+                _untrack(self.shm)
+            self._header = np.ndarray((3,), dtype="<u8", buffer=self.shm.buf)
+            capacity = int(self._header[1])
+            if int(self._header[2]) != RECORD_DTYPE.itemsize:
+                raise ValueError("shared ring was created with a different record layout")
+        wall_ns, mono_ns = (int(v) for v in self._anchor_words())
+        self.anchor = WallAnchor(wall_ns, mono_ns)
+        self.owner = create
+        self.capacity = capacity
+        self.records = np.ndarray((capacity,), dtype=RECORD_DTYPE, buffer=self.shm.buf, offset=HEADER_BYTES)
+        self._seq_col = self.records["seq"]
+        self._body = self.records[list(RECORD_DTYPE.names[1:])]    # every field but seq (a view)
+
+    def _anchor_words(self):
+        return np.ndarray((2,), dtype="<i8", buffer=self.shm.buf, offset=24)
+
+    @classmethod
+    def attach(cls, name, untrack=False):
+        """
+        untrack=True for processes that were not started by the ring's owner
+        (children share the owner's resource tracker and must leave it alone).
+        """
+        return cls(name, create=False, untrack=untrack)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @property
+    def write_seq(self):
+        """Sequence number of the newest complete record (0 = nothing written yet)."""
+        return int(self._header[0])
+
+    # -------- writer (one process only) --------
+    def write(self, values, rx_ns):
+        seq = int(self._header[0]) + 1
+        slot = seq % self.capacity
+        seq_col = self._seq_col
+        seq_col[slot] = 0                       # readers drop the slot from here ...
+        self._body[slot] = (rx_ns, *values)
+        seq_col[slot] = seq                     # ... to here
+        self._header[0] = seq
+        return seq
+
+    # -------- readers --------
+    def latest(self):
+        """Copy of the newest record, or None."""
+        seq = self.write_seq
+        if not seq:
+            return None
+        slot = seq % self.capacity
+        rec = self.records[slot:slot + 1].copy()[0]
+        return rec if rec["seq"] == seq and self._seq_col[slot] == seq else None
+
+    def read_since(self, last_seq, max_records=None):
+        """
+        Records with seq > last_seq, oldest first, as a copied structured array.
+        Returns (records, new_last_seq, lost) where lost counts records that were
+        overwritten before this reader got to them.
+        """
+        head = self.write_seq
+        first = last_seq + 1
+        lost = 0
+        if head - first + 1 > self.capacity:
+            lost = head - self.capacity + 1 - first
+            first = head - self.capacity + 1
+        if max_records is not None:
+            head = min(head, first + max_records - 1)
+        if head < first:
+            return self.records[:0].copy(), last_seq, lost
+
+        start, end = first % self.capacity, head % self.capacity
+        seq_col = self._seq_col
+        if start <= end:
+            out = self.records[start:end + 1].copy()
+            after = seq_col[start:end + 1]
+        else:
+            out = np.concatenate((self.records[start:], self.records[:end + 1]))
+            after = np.concatenate((seq_col[start:], seq_col[:end + 1]))
+
+        # the writer may have lapped us while copying: it zeroes a slot's seq before touching the
+        # fields, so a slot whose seq is still the expected one after the copy was copied whole
+        expected = np.arange(first, head + 1, dtype=np.uint64)
+        ok = (out["seq"] == expected) & (after == expected)
+        if not ok.all():
+            lost += int((~ok).sum())
+            out = out[ok]
+        return out, head, lost
+
+    def close(self):
+        self._header = self.records = self._seq_col = self._body = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _untrack(shm):
+    # unrelated attaching processes must not unlink the segment at exit (bpo-38119)
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
+
+
+# ---------------- Ingest process ----------------
+def ingest_process_main(port_name, baud, shm_name, stop_event, stats):
+    ring = ShmRing.attach(shm_name)
+    write = ring.write
+
+    def on_status(name, text):
+        if text == "Connected":
+            print(f"[Ingest] Reading {port_name} into shared ring {shm_name}")
+            stats[2] = 1
+        else:
+            stats[2] = 0
+            engine.stop()           # one port per process: closed or failed to open ends it
+
+    engine = IngestEngine(on_status=on_status)
+
+    @engine.subscribe
+    def to_ring(record, rx_ns):
+        stats[0] = write(record, rx_ns)
+        stats[1] = engine.errors
+
+    # no baud: a pty / FIFO / replay file
+    engine.add_port(port_name, open_serial if baud else open_raw, port_name, baud, READ_TIMEOUT)
+    done = threading.Event()
+
+    def watch():
+        # polled: a process that exits inside mp.Event.wait() leaves the parent's set() waiting for it
+        while not done.wait(READ_TIMEOUT):
+            if stop_event.is_set():
+                engine.stop()
+                return
+
+    watcher = threading.Thread(target=watch, name="ingest-stop", daemon=True)
+    watcher.start()
+    try:
+        asyncio.run(engine.run())
+    finally:
+        done.set()
+        watcher.join()
+        stats[1] = engine.errors
+        stats[2] = 0
+        ring.close()
+
+
+class IngestProcess:
+    """Owns the shared ring and the child process that fills it."""
+
+    def __init__(self, port_name, baud=None, capacity=DEFAULT_CAPACITY):
+        self.ring = ShmRing(capacity=capacity)
+        self.stop_event = mp.Event()
+        self.stats = mp.Array("q", 3, lock=False)   # [write_seq, decode errors, port open]
+        self.process = mp.Process(
+            target=ingest_process_main,
+            args=(port_name, baud, self.ring.name, self.stop_event, self.stats),
+            name="autobot-ingest",
+            daemon=True,
+        )
+
+    def start(self):
+        self.process.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        self.stop_event.set()
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.ring.close()
+
+
+class ProcessLink:
+    """
+    SerialLink's interface over an IngestProcess: a pump thread reads the ring by
+    seq every PUMP_INTERVAL and hands TelemetryRecords to core's subscribers.
+    core only holds the subscribers and counters here; framing and decoding
+    happen in the child process.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, on_status=None, interval=PUMP_INTERVAL):
+        self.core = IngestCore()
+        self.capacity = capacity
+        self.on_status = on_status      # fn(text), called from the pump thread
+        self.interval = interval
+        self.connected = threading.Event()
+        self.stop_event = threading.Event()
+        self.lost = 0                   # records overwritten before the pump read them
+        self.ingest = None
+        self.thread = None
+
+    def start(self, port_name, baud):
+        self.stop(timeout=1.0)
+        self.stop_event.clear()
+        self.ingest = IngestProcess(port_name, baud, self.capacity).start()
+        self.thread = threading.Thread(target=self._pump, args=(self.ingest,), name="ring-pump", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        """Stop the pump and the ingest process. Joins if timeout is given."""
+        self.stop_event.set()
+        if timeout is not None and self.thread is not None:
+            self.thread.join(timeout)
+
+    def _status(self, text):
+        if self.on_status is not None:
+            try:
+                self.on_status(text)
+            except Exception:
+                pass
+
+    def _pump(self, ingest):
+        core = self.core
+        stats = ingest.stats
+        make = TelemetryRecord._make
+        last = 0
+        try:
+            while not self.stop_event.wait(self.interval):
+                alive = ingest.process.is_alive()
+                if stats[2] and not self.connected.is_set():
+                    self.connected.set()
+                    self._status("Connected")
+                recs, last, lost = ingest.ring.read_since(last)
+                self.lost += lost
+                core.errors = stats[1]
+                for row in recs.tolist():
+                    core.frames += 1
+                    record = make(row[2:])
+                    rx_ns = row[1]
+                    for fn in core.subscribers:
+                        try:
+                            fn(record, rx_ns)
+                        except Exception as e:
+                            print("[Ingest] Subscriber failed:", e)
+                if not alive and not len(recs):
+                    break       # port closed or failed to open, ring drained
+        finally:
+            self.connected.clear()
+            self._status("Disconnected")
+            ingest.stop()
@@ -0,0 +1,69 @@
+# autobot/query.py
+"""
+Range queries over AUTOBOT CSV logs from the shell, through the sparse block
+index of autobot/sinks/index.py. Rows go to stdout as CSV, the summary (blocks
+read / total) to stderr.
+
+    autobot-query query Autobot_Log.csv --from "2025-11-27 16:51" --to "2025-11-27 16:55" --tag 3
+    autobot-query query /var/log/autobot/Autobot_Log.csv --tag 3 --tag 5 --columns Timestamp,ESP_X,ESP_Y
+    autobot-query query Autobot_Log.csv --from "2025-11-27 16:51" --count
+    python -m autobot.query build Autobot_Log.csv
+
+`build` indexes logs written before the index existed (or with index_rows=0);
+CsvLogger keeps the index of the logs it writes itself.
+"""
+
+import argparse
+import csv
+import sys
+import time
+
+from autobot.ingest.schema import CSV_HEADER
+from autobot.sinks.index import INDEX_BLOCK_ROWS, LogQuery, build_index
+from autobot.sinks.rotation import CODECS, log_segments
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="autobot-query", description="AUTOBOT CSV log index and range queries")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="index a log written without one (all plain segments)")
+    build.add_argument("log")
+    build.add_argument("--block-rows", type=int, default=INDEX_BLOCK_ROWS)
+    query = commands.add_parser("query", help="print the matching rows as CSV")
+    query.add_argument("log")
+    query.add_argument("--from", dest="start", default=None, help="local time, e.g. '2025-11-27 16:51' (inclusive)")
+    query.add_argument("--to", dest="end", default=None, help="local time (exclusive)")
+    query.add_argument("--tag", type=int, action="append", default=None, help="ESP_Tag_ID to match (repeatable)")
+    query.add_argument("--columns", default=None, help="comma-separated CSV columns to print")
+    query.add_argument("--count", action="store_true", help="print only the number of matching rows")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        for segment in log_segments(args.log):
+            if segment.endswith(tuple(CODECS.values())):
+                print(f"[Index] {segment}: compressed, skipped", file=sys.stderr)
+                continue
+            print(f"[Index] {segment}: {build_index(segment, args.block_rows)} blocks", file=sys.stderr)
+        return
+
+    columns = args.columns.split(",") if args.columns else CSV_HEADER
+    unknown = [c for c in columns if c not in CSV_HEADER]
+    if unknown:
+        parser.error(f"unknown column(s): {', '.join(unknown)}")
+    picks = [CSV_HEADER.index(c) for c in columns]
+    q = LogQuery(args.log, args.start, args.end, args.tag)
+    t0 = time.perf_counter()
+    if args.count:
+        print(sum(1 for _ in q))
+    else:
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(columns)
+        for row in q:
+            writer.writerow([row[i] for i in picks])
+    print(f"[Index] {q.rows_matched} rows, read {q.blocks_read}/{q.blocks_total} blocks "
+          f"({q.rows_scanned} rows scanned, {q.malformed} malformed, {q.unindexed} unindexed file(s)) in {time.perf_counter() - t0:.3f} s",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# autobot/simulator.py
+"""
+Pseudo-terminal robot simulator: emits the STM32 telemetry stream on a pty so the
+GUI / logger / benchmarks can run without hardware (Linux / macOS).
+
+    python -m autobot.simulator --format json|binary|mixed --rate 50 [--baud 115200]
+
+Prints the slave device path; use it as the COM port.
+"""
+
+import argparse
+import math
+import os
+import threading
+import time
+import tty
+
+from autobot.ingest.binary import encode_binary
+from autobot.ingest.schema import decode_packet
+
+# same layout and precision as the snprintf in STM32/AutoBot/Core/Src/main.c
+JSON_PACKET_FMT = (
+    '{{"enc":{{"L":{L},"R":{R},"left_deg":{ld:.2f},"right_deg":{rd:.2f}}},'
+    '"imu":{{"acc":[{ax:.2f},{ay:.2f},{az:.2f}],"gyro":[{gx:.2f},{gy:.2f},{gz:.2f}],'
+    '"euler":[{pitch:.2f},{roll:.2f},{yaw:.2f}]}},'
+    '"battery":{{"voltage":{volt:.2f},"percent":{pct}}},'
+    '"esp":{{"tag":{tag},"yaw":{eyaw:.2f},"pitch":{epitch:.2f},"roll":{eroll:.2f},'
+    '"pos":[{px:.2f},{py:.2f},{pz:.2f}]}}}}\n'
+)
+
+FORMATS = ("json", "binary", "mixed")
+
+
+def sample_values(i):
+    t = i * 0.01
+    return dict(
+        L=i * 3, R=-i * 3, ld=(i * 1.5) % 360, rd=(i * 1.5) % 360,
+        ax=math.sin(t) * 0.2, ay=math.cos(t) * 0.2, az=0.98,
+        gx=math.sin(t) * 12.0, gy=math.cos(t) * 8.0, gz=math.sin(t * 0.5) * 30.0,
+        pitch=math.sin(t) * 3.0, roll=math.cos(t) * 2.0, yaw=((i * 0.7) % 360) - 180,
+        volt=12.4 - (i % 1000) * 0.0005, pct=90 - (i // 5000) % 90,
+        tag=(i // 200) % 8, eyaw=math.sin(t) * 45.0, epitch=1.25, eroll=-0.5,
+        px=math.cos(t), py=math.sin(t), pz=0.35,
+    )
+
+
+def make_json_packet(i):
+    return JSON_PACKET_FMT.format(**sample_values(i)).encode("ascii")
+
+
+def make_binary_packet(i):
+    # go through the JSON text so both formats carry the same 2-decimal values
+    return encode_binary(decode_packet(make_json_packet(i).rstrip(b"\n")))
+
+
+def make_packet(i, fmt):
+    if fmt == "binary" or (fmt == "mixed" and i % 2):
+        return make_binary_packet(i)
+    return make_json_packet(i)
+
+
+class RobotSimulator:
+    def __init__(self, fmt="json", rate_hz=50.0, baud=None, count=None):
+        if fmt not in FORMATS:
+            raise ValueError(f"format must be one of {FORMATS}")
+        self.fmt = fmt
+        self.rate_hz = rate_hz        # 0 / None: as fast as the pty drains
+        self.baud = baud              # optional wire-speed throttle (8N1)
+        self.count = count
+        self.sent_packets = 0
+        self.sent_bytes = 0
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.slave_fd)     # no newline translation / line buffering
+        self.port = os.ttyname(self.slave_fd)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self
+
+    def run(self):
+        period = 1.0 / self.rate_hz if self.rate_hz else 0.0
+        next_t = time.perf_counter()
+        i = 0
+        while not self._stop.is_set() and (self.count is None or i < self.count):
+            pkt = make_packet(i, self.fmt)
+            try:
+                os.write(self.master_fd, pkt)
+            except OSError:
+                break
+            self.sent_packets += 1
+            self.sent_bytes += len(pkt)
+            i += 1
+
+            delay = 0.0
+            if period:
+                next_t += period
+                delay = next_t - time.perf_counter()
+            if self.baud:
+                delay = max(delay, len(pkt) * 10 / self.baud)
+            if delay > 0:
+                time.sleep(delay)
+
+    def wait(self, timeout=None):
+        if self._thread:
+            self._thread.join(timeout)
+
+    def stop(self):
+        self._stop.set()
+        self.wait(1.0)
+
+    def close(self):
+        self.stop()
+        for fd in (self.master_fd, self.slave_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AUTOBOT telemetry simulator on a pseudo-terminal")
+    parser.add_argument("--format", choices=FORMATS, default="json")
+    parser.add_argument("--rate", type=float, default=50.0, help="packets per second (0 = unthrottled)")
+    parser.add_argument("--baud", type=int, default=None, help="limit output to this wire speed")
+    args = parser.parse_args()
+
+    sim = RobotSimulator(args.format, args.rate, args.baud)
+    print(f"[Sim] {args.format} telemetry on {sim.port} (Ctrl+C to stop)")
+    sim.start()
+    try:
+        while True:
+            time.sleep(1.0)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim.close()
+        print(f"[Sim] sent {sim.sent_packets} packets, {sim.sent_bytes} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+# autobot/sinks/__init__.py
+"""
+Record consumers. asyncio sinks for IngestEngine live in autobot.sinks.aio, the
+numpy-based columnar log (ColumnLogger / ColumnLog) in autobot.sinks.columnar,
+the CSV log's block index and range queries (LogQuery) in autobot.sinks.index.
+"""
+
+from autobot.sinks.csv_log import CsvLogger, prepare_row_for_csv
@@ -0,0 +1,59 @@
+# autobot/sinks/aio.py
+"""
+Sinks for autobot.ingest.engine.IngestEngine. submit() is called on the event
+loop thread for every decoded record; run() is the sink's own task.
+"""
+
+import asyncio
+
+
+# ---------------- Sinks ----------------
+class Sink:
+    """
+    submit() runs on the loop thread and must not block; run() is the sink's task.
+    rx_ns is the frame's monotonic receive time (autobot.ingest.clock.now_ns()).
+    """
+
+    def submit(self, source, record, rx_ns):
+        raise NotImplementedError
+
+    async def run(self):
+        pass
+
+    async def close(self):
+        pass
+
+
+class LatestSink(Sink):
+    def __init__(self):
+        self.latest = {}
+        self.rx_ns = {}
+        self.version = 0
+
+    def submit(self, source, record, rx_ns):
+        self.latest[source] = record
+        self.rx_ns[source] = rx_ns
+        self.version += 1
+
+
+class LoggerSink(Sink):
+    """
+    A BatchLogger (CsvLogger, ColumnLogger, RecordLogger) as an engine sink.
+    submit() only puts the row into the logger's ring (while logger.enabled is
+    set); the logger's own thread group-commits, rotates and indexes, so no file
+    I/O runs on the loop. The logger starts with the engine, and close() waits
+    for its last commit on an executor thread.
+    """
+
+    def __init__(self, logger):
+        self.logger = logger
+        self.complete = None        # logger.close(): every row queued since start() is in the file
+
+    def submit(self, source, record, rx_ns):
+        self.logger.submit(record, rx_ns)
+
+    async def run(self):
+        self.logger.start()
+
+    async def close(self):
+        self.complete = await asyncio.get_running_loop().run_in_executor(None, self.logger.close)
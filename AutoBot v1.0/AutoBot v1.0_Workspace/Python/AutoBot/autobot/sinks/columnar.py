@@ -0,0 +1,170 @@
+# autobot/sinks/columnar.py
+"""
+Columnar binary session log, the analysis-friendly alternative to CsvLogger.
+
+A log is a directory:
+
+    session.acol/
+      meta.json                   format, column names and dtypes
+      rg000000-00001000.npz       row group 0, 1000 rows: one array per column
+      rg000001-00000998.npz       ...
+
+Columns are typed: time_ns int64 wall clock, counters int32, measurements
+float64. The firmware prints %.2f, and float64 holds every decoded value
+exactly; float32 would not (wheel angles accumulate past 131072, where its
+step is 0.0156). A row costs 168 bytes before compression, and the groups
+compress well. Row groups are written with np.savez_compressed to a temporary
+name and renamed into place, so readers never see a partial group; the row
+count is in the file name. Version 1 logs (float32 measurements) still read.
+
+ColumnLogger is a BatchLogger, like CsvLogger (submit / start / close,
+`enabled`, `rows`, flush()); each group commit (GROUP_ROWS rows or
+GROUP_INTERVAL seconds) turns the queued records into one row group. It has
+no rotation or block index. ColumnLog reads a log back: column() / read() decompress the groups,
+memmap() caches the columns once as plain .npy files in <log>/mmap/ and maps
+them, so later loads cost no parsing or decompression.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from autobot.ingest.clock import ANCHOR
+from autobot.ingest.schema import TELEMETRY_FIELDS
+from autobot.sinks.csv_log import MAX_LOG_ROWS, BatchLogger
+
+FORMAT = "autobot-columnar"
+FORMAT_VERSION = 2
+GROUP_INTERVAL = 10.0
+GROUP_ROWS = 1000
+COLUMNS = [("time_ns", "int64")] + [(name, "int32" if kind is int else "float64")
+                                    for name, _, _, kind in TELEMETRY_FIELDS]
+
+
+def _group_name(index, rows):
+    return f"rg{index:06d}-{rows:08d}.npz"
+
+
+def _group_rows(name):
+    return int(name[9:17])
+
+
+class _ColumnStore:
+    """Appends row groups to a log directory (logger thread only)."""
+
+    def __init__(self, path, compress=True):
+        self.path = path
+        self.compress = compress
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, "meta.json")
+        if not os.path.exists(meta_path):
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({"format": FORMAT, "version": FORMAT_VERSION, "columns": COLUMNS}, f)
+        else:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            if (meta.get("format"), meta.get("version"), [tuple(c) for c in meta.get("columns", ())]) != \
+                    (FORMAT, FORMAT_VERSION, COLUMNS):
+                raise ValueError(f"{path}: columnar log written with a different schema")
+        self.groups = len(_list_groups(path))
+        self._offset_ns = ANCHOR.wall_ns - ANCHOR.mono_ns
+
+    def append(self, rows):
+        # rows: [(rx_ns, record), ...]; the int fields are exact in float64 too
+        block = np.array([rec for _, rec in rows], dtype=np.float64)
+        columns = {"time_ns": np.fromiter((rx_ns for rx_ns, _ in rows), np.int64, len(rows)) + self._offset_ns}
+        for i, (name, dtype) in enumerate(COLUMNS[1:]):
+            columns[name] = block[:, i].astype(dtype)
+        name = _group_name(self.groups, len(rows))
+        tmp = os.path.join(self.path, name + ".tmp")
+        with open(tmp, "wb") as f:
+            (np.savez_compressed if self.compress else np.savez)(f, **columns)
+        os.replace(tmp, os.path.join(self.path, name))
+        self.groups += 1
+
+    def close(self):
+        pass
+
+
+class ColumnLogger(BatchLogger):
+    label = "Columnar"
+
+    def __init__(self, path, capacity=MAX_LOG_ROWS, batch_interval=GROUP_INTERVAL, batch_rows=GROUP_ROWS,
+                 compress=True):
+        super().__init__(path, capacity, batch_interval, batch_rows)
+        self.compress = compress
+
+    def _open(self):
+        return _ColumnStore(self.path, self.compress), None
+
+    def _write(self, store, _, rows):
+        store.append(rows)
+        self.rows += len(rows)
+
+
+# ---------------- reading ----------------
+def _list_groups(path):
+    return sorted(n for n in os.listdir(path) if n.startswith("rg") and n.endswith(".npz"))
+
+
+class ColumnLog:
+    def __init__(self, path):
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != FORMAT:
+            raise ValueError(f"{path}: not an AUTOBOT columnar log")
+        self.path = path
+        self.dtypes = {name: np.dtype(dtype) for name, dtype in meta["columns"]}
+        self.columns = list(self.dtypes)
+        self.refresh()
+
+    def refresh(self):
+        """Pick up row groups written since the log was opened."""
+        self.groups = _list_groups(self.path)
+        self.group_rows = [_group_rows(n) for n in self.groups]
+        return self
+
+    def __len__(self):
+        return sum(self.group_rows)
+
+    def column(self, name):
+        return self.read([name])[name]
+
+    def read(self, names=None):
+        """{name: array} for the given columns (default all), reading each group once."""
+        names = list(names or self.columns)
+        out = {name: np.empty(len(self), dtype=self.dtypes[name]) for name in names}
+        i = 0
+        for group, rows in zip(self.groups, self.group_rows):
+            with np.load(os.path.join(self.path, group)) as npz:
+                for name in names:
+                    out[name][i:i + rows] = npz[name]
+            i += rows
+        return out
+
+    def memmap(self, names=None):
+        """{name: read-only memory map}, cached as <log>/mmap/<name>.npy; stale or missing
+        caches are rebuilt together in one pass over the row groups."""
+        names = list(names or self.columns)
+        cache_dir = os.path.join(self.path, "mmap")
+        out = {}
+        missing = []
+        for name in names:
+            cache = os.path.join(cache_dir, name + ".npy")
+            if os.path.exists(cache):
+                mapped = np.load(cache, mmap_mode="r")
+                if len(mapped) == len(self):
+                    out[name] = mapped
+                    continue
+                del mapped
+            missing.append(name)
+        if missing:
+            os.makedirs(cache_dir, exist_ok=True)
+            for name, values in self.read(missing).items():
+                cache = os.path.join(cache_dir, name + ".npy")
+                with open(cache + ".tmp", "wb") as f:
+                    np.save(f, values)
+                os.replace(cache + ".tmp", cache)
+                out[name] = np.load(cache, mmap_mode="r")
+        return {name: out[name] for name in names}
@@ -0,0 +1,295 @@
+# autobot/sinks/csv_log.py
+"""
+Threaded CSV logger for the GUI / headless reader.
+submit() is an IngestCore subscriber: it only puts (rx_ns, record) into a
+RecordRing. The logger thread sleeps until rows arrive, then group-commits
+them (write + flush) once batch_rows are queued or batch_interval seconds after
+the first one, whichever comes first; timestamps are formatted at write time.
+submit() wakes the thread only for the first row of a batch and when the batch
+is full. flush() and close() are barriers: they return once every row queued
+before the call is in the file, and return False if a write failed (the rows
+of that batch are lost; `error` holds the exception).
+With max_bytes and/or rotate_interval the file is rotated into compressed
+segments (autobot/sinks/rotation.py). Unless index_rows is 0, a sparse block
+index (byte offsets, time range and tag IDs per index_rows rows) is kept next
+to each file for range queries (autobot/sinks/index.py).
+The queue, thread and group commit live in BatchLogger, which the columnar and
+record logs share; they only replace how a batch is stored.
+"""
+
+import csv
+import os
+import threading
+import time
+
+from autobot.ingest.buffers import RecordRing
+from autobot.ingest.clock import ANCHOR
+from autobot.ingest.schema import CSV_HEADER
+from autobot.sinks.index import INDEX_BLOCK_ROWS, INDEX_SCAN_BYTES, TAG_FIELD, BlockIndexer, index_path, unindexed_bytes
+from autobot.sinks.rotation import SegmentCompressor, SegmentManifest, segment_path
+
+CSV_BATCH_INTERVAL = 1.0
+CSV_BATCH_ROWS = 500
+MAX_LOG_ROWS = 5000
+FLUSH_CHECK_S = 0.5
+
+
+def prepare_row_for_csv(rx_ns, rec):
+    # rx_ns: monotonic receive time; only turned into text here, at export
+    return [ANCHOR.format(rx_ns), *rec]
+
+
+class BatchLogger:
+    """
+    Queue + logger thread + group commit. Subclasses store the batches:
+    _open() -> (f, writer), _write(f, writer, rows) with rows [(rx_ns, record), ...]
+    (it counts self.rows), _close(f); _rotation_due(f) / _rotate(f) only if they rotate.
+    """
+
+    label = "CSV"           # log line prefix and thread name
+
+    def __init__(self, path, capacity=MAX_LOG_ROWS, batch_interval=CSV_BATCH_INTERVAL, batch_rows=CSV_BATCH_ROWS):
+        self.path = path
+        self.batch_interval = batch_interval
+        self.batch_rows = min(batch_rows, capacity)
+        self.ring = RecordRing(capacity)
+        self.enabled = threading.Event()    # rows are only queued while set
+        self.rows = 0
+        self.commits = 0
+        self.committed = 0                  # ring items written and flushed
+        self.failed = 0                     # ring items lost to a write error
+        self.error = None                   # the last write error
+        self._failed_reported = 0           # self.failed when flush() last returned
+        self._wake = threading.Event()
+        self._done = threading.Condition()
+        self._flush_target = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    # -------- IngestCore subscriber (reader thread) --------
+    def submit(self, rec, rx_ns):
+        if self.enabled.is_set():
+            ring = self.ring
+            if ring.put((rx_ns, rec)):
+                n = len(ring)
+                if n == 1 or n == self.batch_rows:
+                    self._wake.set()
+
+    # -------- logger thread --------
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=f"{self.label.lower()}-logger", daemon=True)
+            self._thread.start()
+        return self
+
+    def flush(self, timeout=None):
+        """Commit every row queued so far; True once they are in the file, False on timeout or
+        if a write failed since the last flush(). timeout=0 only asks the logger thread to
+        commit now, without waiting."""
+        target = self.ring.written
+        with self._done:
+            self._flush_target = max(self._flush_target, target)
+        self._wake.set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._done:
+            # re-checked every FLUSH_CHECK_S in case the thread died without committing
+            while self.committed + self.failed < target and self.running:
+                remaining = FLUSH_CHECK_S if deadline is None else min(deadline - time.monotonic(), FLUSH_CHECK_S)
+                if remaining <= 0:
+                    break
+                self._done.wait(remaining)
+            failed, self._failed_reported = self.failed != self._failed_reported, self.failed
+            return self.committed + self.failed >= target and not failed
+
+    def close(self, timeout=2.0):
+        """Stop the thread after it has written everything already queued; True if every row
+        queued since start() is in the file."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.committed >= self.ring.written
+
+    # -------- storage (logger thread) --------
+    def _open(self):
+        raise NotImplementedError
+
+    def _write(self, f, writer, rows):
+        raise NotImplementedError
+
+    def _close(self, f):
+        f.close()
+
+    def _rotation_due(self, f):
+        return False
+
+    # -------- commit loop (logger thread) --------
+    def _run(self):
+        try:
+            f, writer = self._open()
+        except Exception as e:
+            print(f"[{self.label}] Cannot open log file:", e)
+            return
+
+        ring = self.ring
+        reported_overflows = ring.overflows
+        deadline = None             # commit time of the batch being collected
+        while True:
+            # rows stay in the ring until commit time; clearing before looking means a put()
+            # racing with this check still leaves the event set for the wait below
+            self._wake.clear()
+            stopping = self._stop.is_set()
+            pending = len(ring)
+            if ring.overflows != reported_overflows:
+                print(f"[{self.label}] Log buffer full, dropped {ring.overflows - reported_overflows} row(s)")
+                reported_overflows = ring.overflows
+            if not pending:
+                if stopping:
+                    break
+                deadline = None
+                self._wake.wait()
+                continue
+
+            now = time.monotonic()
+            if deadline is None:
+                deadline = now + self.batch_interval
+            if (stopping or pending >= self.batch_rows or now >= deadline
+                    or self._flush_target > self.committed + self.failed):
+                rows = ring.drain()
+                error = None
+                try:
+                    self._write(f, writer, rows)
+                except Exception as e:
+                    error = e
+                    print(f"[{self.label}] Write error, {len(rows)} row(s) lost:", e)
+                with self._done:
+                    if error is None:
+                        self.committed += len(rows)
+                        self.commits += 1
+                    else:
+                        self.failed += len(rows)
+                        self.error = error
+                    self._done.notify_all()
+                try:
+                    if self._rotation_due(f):
+                        f, writer = self._rotate(f)
+                except Exception as e:
+                    # the rows are in the closed file; later writes report the damage, if any
+                    print(f"[{self.label}] Rotation error:", e)
+                deadline = None
+                continue
+            self._wake.wait(deadline - now)
+
+        try:
+            self._close(f)
+        except Exception:
+            pass
+        with self._done:
+            self._done.notify_all()
+
+
+class CsvLogger(BatchLogger):
+    def __init__(self, path, capacity=MAX_LOG_ROWS, batch_interval=CSV_BATCH_INTERVAL, batch_rows=CSV_BATCH_ROWS,
+                 max_bytes=None, rotate_interval=None, codec="gzip", index_rows=INDEX_BLOCK_ROWS):
+        super().__init__(path, capacity, batch_interval, batch_rows)
+        self.max_bytes = max_bytes                  # rotate once the active file is this big
+        self.rotate_interval = rotate_interval      # ... or when a multiple of this many wall seconds passes
+        self.codec = codec
+        self.manifest = None
+        self.compressor = None
+        self.index_rows = index_rows
+        self.indexer = None
+        self._segment = None        # [opened wall s, rows, first rx_ns, last rx_ns] of the active file
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        if (self.max_bytes or self.rotate_interval) and self.manifest is None:
+            self.manifest = SegmentManifest(self.path)
+            self.compressor = SegmentCompressor(self.manifest, self.codec)
+        first_needed = not os.path.exists(self.path)
+        f = open(self.path, "a", newline="", encoding="utf-8")
+        writer = csv.writer(f)
+        if first_needed:
+            writer.writerow(CSV_HEADER)
+            f.flush()
+        self.indexer = None
+        if self.index_rows:
+            behind = unindexed_bytes(self.path, self.index_rows)
+            if behind <= INDEX_SCAN_BYTES:
+                self.indexer = BlockIndexer(self.path, self.index_rows)
+            else:
+                # a large legacy log: scanning it here would hold up the first batch; queries scan it instead
+                print(f"[CSV] {self.path}: {behind / 1e6:.0f} MB not indexed, logging to it without an index "
+                      f"(index it with `python -m autobot.query build` while nothing logs to it)")
+        self._segment = [time.time(), 0, None, None]
+        return f, writer
+
+    def _write(self, f, writer, rows):
+        indexer = self.indexer
+        if indexer is None:
+            writer.writerows([prepare_row_for_csv(*row) for row in rows])
+        else:
+            # split at block boundaries so each block's byte range is known
+            i = 0
+            while i < len(rows):
+                chunk = rows[i:i + indexer.room()]
+                offset = f.tell()
+                writer.writerows([prepare_row_for_csv(*row) for row in chunk])
+                times = [rx_ns for rx_ns, _ in chunk]
+                # whole microseconds, like the Timestamp text
+                indexer.add(offset, f.tell(), ANCHOR.to_wall_ns(min(times)) // 1000 * 1000,
+                            ANCHOR.to_wall_ns(max(times)) // 1000 * 1000, {rec[TAG_FIELD] for _, rec in chunk},
+                            len(chunk))
+                i += len(chunk)
+        f.flush()
+        if indexer is not None:
+            indexer.flush()
+        self.rows += len(rows)
+        segment = self._segment
+        segment[1] += len(rows)
+        if segment[2] is None:
+            segment[2] = rows[0][0]
+        segment[3] = rows[-1][0]
+
+    # -------- rotation (logger thread) --------
+    def _rotation_due(self, f):
+        if self.manifest is None:
+            return False
+        if self.max_bytes and f.tell() >= self.max_bytes:
+            return True
+        interval = self.rotate_interval
+        return bool(interval) and time.time() // interval != self._segment[0] // interval
+
+    def _rotate(self, f):
+        """Close the active file, rename it to the next segment, queue it for compression."""
+        f.close()
+        opened, rows, first, last = self._segment
+        closed = segment_path(self.path, len(self.manifest.segments), opened)
+        os.replace(self.path, closed)
+        if self.indexer is not None:
+            self.indexer.close()
+        if os.path.exists(index_path(self.path)):
+            os.replace(index_path(self.path), index_path(closed))
+        self.manifest.add({
+            "file": os.path.basename(closed), "rows": rows, "bytes": os.path.getsize(closed),
+            "first_ns": ANCHOR.to_wall_ns(first) if first is not None else None,
+            "last_ns": ANCHOR.to_wall_ns(last) if last is not None else None,
+        })
+        self.compressor.submit(closed)
+        return self._open()
+
+    def _close(self, f):
+        try:
+            f.close()
+            if self.indexer is not None:
+                self.indexer.close()
+        finally:
+            if self.compressor is not None:
+                self.compressor.close()
+            # a later start() reloads the manifest and starts a compressor of its own
+            self.manifest = self.compressor = self.indexer = None
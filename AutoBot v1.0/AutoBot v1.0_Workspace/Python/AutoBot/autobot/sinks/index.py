@@ -0,0 +1,365 @@
+# autobot/sinks/index.py
+"""
+Sparse block index for CSV logs and range queries over it: "every sample
+between 16:51 and 16:55 where ESP_Tag_ID == 3" reads only the blocks that can
+contain one instead of the whole log.
+
+Each CSV file (the active log and every rotated segment) gets a sidecar with
+one JSON line per block of INDEX_BLOCK_ROWS rows:
+
+    Autobot_Log.csv.idx
+      {"format": "autobot-csv-index", "version": 1, "block_rows": 1000}
+      {"offset": 216, "end": 151431, "rows": 1000, "t0": ..., "t1": ..., "tags": [0, 3]}
+      ...
+
+offset / end are byte positions of the block's rows in the plain file, t0 / t1
+the smallest and largest timestamp in it as wall-clock ns (whole microseconds,
+as written in the Timestamp column), tags the ESP_Tag_ID values seen.
+CsvLogger keeps the index with a BlockIndexer while it writes (index_rows=0
+turns it off): a block line is appended once the block is full and the CSV
+rows are flushed, the partial block when the file is closed or rotated, and
+the sidecar is renamed along with the segment. Rows past the last block (after
+a crash, or a log written without an index) are scanned when the indexer is
+opened again; `build` indexes existing logs such as Autobot_Log.csv that way.
+CsvLogger only does that for up to INDEX_SCAN_BYTES, so a large legacy log
+does not stall its thread at startup; it writes such a file unindexed.
+Malformed rows (blank, truncated, bad timestamp or tag) stay inside a block's
+byte range and row count so blocks remain contiguous, but add no time or tag.
+
+LogQuery seeks to the matching blocks of plain files; compressed segments are
+streamed, skipping the lines of blocks that cannot match without parsing them.
+Files without a sidecar are scanned in full. Malformed rows are skipped.
+
+The command line front end is autobot/query.py (autobot-query).
+"""
+
+import datetime
+import itertools
+import json
+import os
+import time
+
+from autobot.ingest.clock import NS_PER_S, format_wall_ns, parse_wall_text
+from autobot.ingest.schema import CSV_HEADER, TELEMETRY_FIELDS
+from autobot.sinks.rotation import CODECS, log_segments, open_segment
+
+FORMAT = "autobot-csv-index"
+FORMAT_VERSION = 1
+INDEX_BLOCK_ROWS = 1000
+INDEX_SCAN_BYTES = 4 * 1024 * 1024      # unindexed bytes CsvLogger scans when it opens a log (~0.1 s)
+TAG_FIELD = [f[0] for f in TELEMETRY_FIELDS].index("esp_tag")     # position in TelemetryRecord
+TAG_COLUMN = CSV_HEADER.index("ESP_Tag_ID")
+HEADER_LINE = ",".join(CSV_HEADER)
+TIME_FORMATS = ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+
+
+def index_path(path):
+    """Sidecar of a log file; a compressed segment keeps the index of its plain file."""
+    for ext in CODECS.values():
+        if path.endswith(ext):
+            path = path[:-len(ext)]
+            break
+    return path + ".idx"
+
+
+def read_index(path):
+    """(block_rows, blocks) from the sidecar of `path`, or None when it has none."""
+    try:
+        with open(index_path(path), encoding="utf-8") as f:
+            lines = f.read().split("\n")
+    except FileNotFoundError:
+        return None
+    try:
+        head = json.loads(lines[0])
+    except ValueError:
+        return None
+    if head.get("format") != FORMAT or head.get("version") != FORMAT_VERSION:
+        return None
+    blocks = []
+    for line in lines[1:]:
+        try:
+            blocks.append(json.loads(line))
+        except ValueError:
+            break           # empty or half-written last line
+    return head["block_rows"], blocks
+
+
+def _valid_blocks(csv_path, block_rows, size):
+    # the sidecar's blocks that still describe the file, in order and back to back
+    found = read_index(csv_path)
+    blocks = []
+    if found is not None and found[0] == block_rows:
+        for block in found[1]:
+            if block["end"] > size or (blocks and block["offset"] != blocks[-1]["end"]):
+                break
+            blocks.append(block)
+    return blocks
+
+
+def unindexed_bytes(csv_path, block_rows=INDEX_BLOCK_ROWS):
+    """Bytes of `csv_path` past its last valid block (header included) that a BlockIndexer would scan."""
+    size = os.path.getsize(csv_path)
+    blocks = _valid_blocks(csv_path, block_rows, size)
+    return size - blocks[-1]["end"] if blocks else size
+
+
+def parse_time(value):
+    """Query bound -> wall-clock ns: None, ns as int, or local time text ('2025-11-27 16:51')."""
+    if value is None or isinstance(value, int):
+        return value
+    for fmt in TIME_FORMATS:
+        try:
+            dt = datetime.datetime.strptime(value.strip(), fmt)
+        except ValueError:
+            continue
+        return int(time.mktime(dt.timetuple())) * NS_PER_S + dt.microsecond * 1000
+    raise ValueError(f"cannot parse time {value!r} (expected YYYY-mm-dd HH:MM[:SS[.ffffff]])")
+
+
+# ---------------- writing ----------------
+class BlockIndexer:
+    """Keeps the sidecar of one plain CSV file; used by the thread that appends to it."""
+
+    def __init__(self, csv_path, block_rows=INDEX_BLOCK_ROWS):
+        self.csv_path = csv_path
+        self.path = index_path(csv_path)
+        self.block_rows = block_rows
+        self.blocks = 0
+        self._block = None          # [offset, end, rows, t0, t1, tags] of the block being filled
+        self._skipped = None        # [offset, rows] of malformed rows waiting for the next block
+        self._lines = []            # finished blocks not yet in the sidecar
+        self._f = None
+        self._resume()
+
+    def _resume(self):
+        # keep the blocks that are still in the file, rewrite the sidecar atomically, scan the rest
+        blocks = _valid_blocks(self.csv_path, self.block_rows, os.path.getsize(self.csv_path))
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"format": FORMAT, "version": FORMAT_VERSION, "block_rows": self.block_rows}) + "\n")
+            f.writelines(json.dumps(block) + "\n" for block in blocks)
+        os.replace(tmp, self.path)
+        self._f = open(self.path, "a", encoding="utf-8")
+        self.blocks = len(blocks)
+        self._scan(blocks[-1]["end"] if blocks else None)
+
+    def _scan(self, start):
+        with open(self.csv_path, "rb") as f:
+            if start is None:
+                if not f.readline():
+                    return          # empty file, the header comes next
+                start = f.tell()
+            f.seek(start)
+            offset = start
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break           # torn last row
+                end = offset + len(line)
+                row = line.decode("utf-8", "replace").split(",")
+                try:
+                    if len(row) != len(CSV_HEADER):
+                        raise ValueError(f"{len(row)} columns")
+                    t = parse_wall_text(row[0])
+                    tag = int(row[TAG_COLUMN])
+                except ValueError:
+                    self._skip(offset, end)
+                else:
+                    self.add(offset, end, t, t, (tag,), 1)
+                offset = end
+        self.flush()
+
+    def room(self):
+        """Rows that still fit into the current block."""
+        if self._block is not None:
+            return self.block_rows - self._block[2]
+        return max(1, self.block_rows - (self._skipped[1] if self._skipped is not None else 0))
+
+    def add(self, offset, end, t0, t1, tags, rows):
+        """Rows appended at bytes [offset, end) with wall ns t0..t1; they must fit in room()."""
+        block = self._block
+        if block is None:
+            skipped, self._skipped = self._skipped, None
+            self._block = block = [offset, end, 0, t0, t1, set()]
+            if skipped is not None:
+                block[0], block[2] = skipped
+        else:
+            block[1] = end
+            block[3] = min(block[3], t0)
+            block[4] = max(block[4], t1)
+        block[2] += rows
+        block[5].update(tags)
+        if block[2] >= self.block_rows:
+            self._finish_block()
+
+    def _skip(self, offset, end):
+        # a malformed row: counted and covered by the block, no time or tag
+        block = self._block
+        if block is None:
+            if self._skipped is None:
+                self._skipped = [offset, 0]
+            self._skipped[1] += 1
+            return
+        block[1] = end
+        block[2] += 1
+        if block[2] >= self.block_rows:
+            self._finish_block()
+
+    def _finish_block(self):
+        offset, end, rows, t0, t1, tags = self._block
+        self._lines.append(json.dumps({"offset": offset, "end": end, "rows": rows, "t0": t0, "t1": t1,
+                                       "tags": sorted(tags)}) + "\n")
+        self._block = None
+        self.blocks += 1
+
+    def flush(self):
+        """Append finished blocks to the sidecar; call after the CSV rows are flushed."""
+        if self._lines:
+            self._f.writelines(self._lines)
+            self._f.flush()
+            self._lines = []
+
+    def close(self):
+        """Write the partial block too; the file must not grow any more under this indexer."""
+        if self._block is not None:
+            self._finish_block()
+        self.flush()
+        self._f.close()
+
+
+def build_index(path, block_rows=INDEX_BLOCK_ROWS):
+    """Index (or finish indexing) a plain CSV file that no logger is writing; returns the block count."""
+    indexer = BlockIndexer(path, block_rows)
+    indexer.close()
+    return indexer.blocks
+
+
+# ---------------- querying ----------------
+class LogQuery:
+    """
+    Rows (lists of str in CSV_HEADER order) of a CsvLogger log, all segments,
+    with start <= Timestamp < end and ESP_Tag_ID in tags; None means no bound.
+    start / end: wall-clock ns or local time text. The counters are filled in
+    while iterating.
+    """
+
+    def __init__(self, path, start=None, end=None, tags=None):
+        self.path = path
+        self.start = parse_time(start)
+        self.end = parse_time(end)
+        self.tags = frozenset(int(t) for t in tags) if tags is not None else None
+        # timestamps are fixed-width local time text in whole microseconds, so the per-row test
+        # compares strings; a bound between two microseconds rounds up to agree with t0 / t1
+        self._lo = format_wall_ns(-(-self.start // 1000) * 1000) if self.start is not None else None
+        self._hi = format_wall_ns(-(-self.end // 1000) * 1000) if self.end is not None else None
+        self.blocks_total = 0
+        self.blocks_read = 0
+        self.rows_scanned = 0
+        self.rows_matched = 0
+        self.unindexed = 0          # files scanned in full for lack of a sidecar
+        self.malformed = 0          # rows skipped because they do not parse
+
+    def __iter__(self):
+        segments = log_segments(self.path)
+        if not segments:
+            raise FileNotFoundError(self.path)
+        for segment in segments:
+            yield from self._file(segment)
+
+    def _overlaps(self, block):
+        return ((self.start is None or block["t1"] >= self.start)
+                and (self.end is None or block["t0"] < self.end)
+                and (self.tags is None or not self.tags.isdisjoint(block["tags"])))
+
+    def _inside(self, block):
+        return ((self.start is None or block["t0"] >= self.start)
+                and (self.end is None or block["t1"] < self.end)
+                and (self.tags is None or self.tags.issuperset(block["tags"])))
+
+    def _filter(self, lines, check=True):
+        lo, hi, tags = self._lo, self._hi, self.tags
+        columns = len(CSV_HEADER)
+        n = 0
+        for line in lines:
+            self.rows_scanned += 1
+            row = line.rstrip("\r\n").split(",")
+            if len(row) != columns:
+                self.malformed += 1
+                continue
+            if check:
+                ts = row[0] if len(row[0]) > 19 else row[0] + ".000000"
+                if (lo is not None and ts < lo) or (hi is not None and ts >= hi):
+                    continue
+                if tags is not None:
+                    try:
+                        if int(row[TAG_COLUMN]) not in tags:
+                            continue
+                    except ValueError:
+                        self.malformed += 1
+                        continue
+            n += 1
+            yield row
+        self.rows_matched += n
+
+    def _file(self, path):
+        found = read_index(path)
+        if found is None:
+            self.unindexed += 1
+            yield from self._scan_all(path)
+            return
+        blocks = found[1]
+        self.blocks_total += len(blocks)
+        if path.endswith(tuple(CODECS.values())):
+            yield from self._stream(path, blocks)
+            return
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            # compressed since log_segments() listed it
+            for ext in CODECS.values():
+                if os.path.exists(path + ext):
+                    yield from self._stream(path + ext, blocks)
+                    return
+            raise
+        with f:
+            if f.readline().decode("utf-8").rstrip("\r\n") != HEADER_LINE:
+                raise ValueError(f"{path}: not an AUTOBOT CSV log")
+            for block in blocks:
+                if self._overlaps(block):
+                    self.blocks_read += 1
+                    f.seek(block["offset"])
+                    data = f.read(block["end"] - block["offset"]).decode("utf-8")
+                    yield from self._filter(data.splitlines(), not self._inside(block))
+            # rows past the last block: the block being filled, or a crash the logger has not resumed from
+            if blocks:
+                f.seek(blocks[-1]["end"])
+            tail = itertools.takewhile(lambda line: line.endswith(b"\n"), f)
+            yield from self._filter(line.decode("utf-8") for line in tail)
+
+    def _stream(self, path, blocks):
+        # closed segments are fully indexed at rotation, so a segment with no matching block is skipped
+        hits = [self._overlaps(block) for block in blocks]
+        if not any(hits):
+            return
+        with open_segment(path) as f:
+            if f.readline().rstrip("\r\n") != HEADER_LINE:
+                raise ValueError(f"{path}: not an AUTOBOT CSV log")
+            for block, hit in zip(blocks, hits):
+                lines = itertools.islice(f, block["rows"])
+                if hit:
+                    self.blocks_read += 1
+                    yield from self._filter(lines, not self._inside(block))
+                else:
+                    for _ in lines:
+                        pass
+
+    def _scan_all(self, path):
+        with open_segment(path) if path.endswith(tuple(CODECS.values())) else open(path, newline="",
+                                                                                   encoding="utf-8") as f:
+            if f.readline().rstrip("\r\n") != HEADER_LINE:
+                raise ValueError(f"{path}: not an AUTOBOT CSV log")
+            yield from self._filter(f)
+
+
+def query_log(path, start=None, end=None, tags=None):
+    """Matching rows of the log at `path`; see LogQuery."""
+    return iter(LogQuery(path, start, end, tags))
@@ -0,0 +1,191 @@
+# autobot/sinks/recordlog.py
+"""
+Append-only fixed-record telemetry log for replay and scrubbing: sample N or
+the first sample at time T without scanning from the top.
+
+File layout (little-endian):
+  header, 64 bytes:
+    magic  b"ABRLOG1\\0" | version u16 | header size u16 | record size u32 |
+    field count u32 | schema crc32 u32 | anchor wall_ns i64 | anchor mono_ns i64 |
+    zero padding
+  records, 168 bytes each:
+    time_ns i64 (wall clock) | the 22 TELEMETRY_FIELDS (int -> i32, float -> f64)
+
+float64 holds every %.2f value the firmware sends exactly, so a record reads
+back as the number its CSV row shows; float32 would not past 131072, which
+the cumulative wheel angles reach. Version 1 files (f32) are rejected.
+
+The record count is (file size - header) // record size, so there is no header
+field to keep in sync; a partial record left by a crash is cut off when the
+log is reopened for writing.
+
+RecordLogger is a BatchLogger with CsvLogger's interface and thread, without
+rotation or a block index. RecordLog maps the file
+read-only: log[i] is one struct.unpack_from (O(1)), index_at(t) bisects the
+time column in place (times only go up while the wall clock does, also across
+runs appended to one file), and array() is a numpy structured view of the
+mapping (zero copy; numpy is imported only there). refresh() remaps after the
+file grew; arrays handed out earlier keep the old mapping alive.
+"""
+
+import bisect
+import mmap
+import os
+import struct
+import zlib
+
+from autobot.ingest.clock import ANCHOR
+from autobot.ingest.schema import TELEMETRY_FIELDS, TelemetryRecord
+from autobot.sinks.csv_log import BatchLogger
+
+MAGIC = b"ABRLOG1\0"
+VERSION = 2
+HEADER = struct.Struct("<8sHHIIIqq")
+HEADER_SIZE = 64
+RECORD = struct.Struct("<q" + "".join("i" if kind is int else "d" for _, _, _, kind in TELEMETRY_FIELDS))
+RECORD_SIZE = RECORD.size
+SCHEMA_CRC = zlib.crc32(",".join(f"{name}:{kind.__name__}" for name, _, _, kind in TELEMETRY_FIELDS).encode())
+FIELDS = ["time_ns"] + [f[0] for f in TELEMETRY_FIELDS]
+
+
+def _header():
+    head = HEADER.pack(MAGIC, VERSION, HEADER_SIZE, RECORD_SIZE, len(FIELDS), SCHEMA_CRC,
+                       ANCHOR.wall_ns, ANCHOR.mono_ns)
+    return head.ljust(HEADER_SIZE, b"\0")
+
+
+def _check_header(data, path):
+    magic, version, header_size, record_size, fields, crc, _, _ = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not an AUTOBOT record log")
+    if (version, header_size, record_size, fields, crc) != (VERSION, HEADER_SIZE, RECORD_SIZE, len(FIELDS),
+                                                            SCHEMA_CRC):
+        raise ValueError(f"{path}: record log written with a different schema")
+
+
+def numpy_dtype():
+    import numpy as np
+    return np.dtype([("time_ns", "<i8")] + [(name, "<i4" if kind is int else "<f8")
+                                            for name, _, _, kind in TELEMETRY_FIELDS])
+
+
+# ---------------- writing ----------------
+class _RecordFile:
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.f = open(path, "a+b")
+        self.f.seek(0, os.SEEK_END)
+        size = self.f.tell()
+        if size < HEADER_SIZE:
+            self.f.truncate(0)
+            self.f.write(_header())
+        else:
+            self.f.seek(0)
+            _check_header(self.f.read(HEADER_SIZE), path)
+            # drop a record torn by a crash
+            self.f.truncate(size - (size - HEADER_SIZE) % RECORD_SIZE)
+        self.f.flush()
+        self._offset_ns = ANCHOR.wall_ns - ANCHOR.mono_ns
+
+    def append(self, rows):
+        buf = bytearray(RECORD_SIZE * len(rows))
+        pack_into = RECORD.pack_into
+        offset_ns = self._offset_ns
+        for i, (rx_ns, rec) in enumerate(rows):
+            pack_into(buf, i * RECORD_SIZE, rx_ns + offset_ns, *rec)
+        self.f.write(buf)
+        self.f.flush()
+
+    def close(self):
+        self.f.close()
+
+
+class RecordLogger(BatchLogger):
+    label = "Records"
+
+    def _open(self):
+        return _RecordFile(self.path), None
+
+    def _write(self, store, _, rows):
+        store.append(rows)
+        self.rows += len(rows)
+
+
+# ---------------- reading ----------------
+class _TimeKeys:
+    """time_ns of each record as a sequence, for bisect."""
+
+    def __init__(self, log):
+        self.log = log
+
+    def __len__(self):
+        return len(self.log)
+
+    def __getitem__(self, i):
+        return self.log.time_ns(i)
+
+
+class RecordLog:
+    def __init__(self, path):
+        self.path = path
+        self._f = open(path, "rb")
+        self._mm = None
+        self._count = 0
+        self.refresh()
+        _check_header(self._mm, path)
+        self.anchor_wall_ns, self.anchor_mono_ns = HEADER.unpack_from(self._mm)[6:8]
+
+    def refresh(self):
+        """Remap to pick up records appended since the log was opened; returns the count."""
+        size = os.fstat(self._f.fileno()).st_size
+        if self._mm is None or size != len(self._mm):
+            if size < HEADER_SIZE:
+                raise ValueError(f"{self.path}: not an AUTOBOT record log")
+            self._mm = mmap.mmap(self._f.fileno(), size, access=mmap.ACCESS_READ)
+        self._count = (len(self._mm) - HEADER_SIZE) // RECORD_SIZE
+        return self._count
+
+    def close(self):
+        try:
+            self._mm.close()
+        except BufferError:
+            pass            # a numpy view from array() still uses it; freed with the view
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def _offset(self, i):
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("record index out of range")
+        return HEADER_SIZE + i * RECORD_SIZE
+
+    def __getitem__(self, i):
+        """(time_ns, TelemetryRecord) of record i."""
+        values = RECORD.unpack_from(self._mm, self._offset(i))
+        return values[0], TelemetryRecord(*values[1:])
+
+    def time_ns(self, i):
+        return struct.unpack_from("<q", self._mm, self._offset(i))[0]
+
+    def index_at(self, t_ns):
+        """Index of the first record with time_ns >= t_ns (len(self) if none); O(log n)."""
+        return bisect.bisect_left(_TimeKeys(self), t_ns)
+
+    def between(self, t0_ns, t1_ns):
+        """(i0, i1): the records with t0_ns <= time_ns < t1_ns are log[i0:i1]."""
+        keys = _TimeKeys(self)
+        return bisect.bisect_left(keys, t0_ns), bisect.bisect_left(keys, t1_ns)
+
+    def array(self):
+        """Read-only numpy structured array over the mapping, without copying."""
+        import numpy as np
+        return np.frombuffer(self._mm, dtype=numpy_dtype(), count=self._count, offset=HEADER_SIZE)
@@ -0,0 +1,202 @@
+# autobot/sinks/rotation.py
+"""
+Segmented CSV logs: CsvLogger(max_bytes=..., rotate_interval=...) closes the
+active file when it gets too big or a wall-clock interval boundary passes,
+renames it (atomically) to a numbered segment and starts a fresh file:
+
+    Autobot_Log.csv                              active segment
+    Autobot_Log.00000.20261018-101500.csv.gz     closed, compressed
+    Autobot_Log.00001.20261018-111500.csv        closed, compression pending
+    Autobot_Log.manifest.json                    segment list, oldest first
+
+The manifest records per segment: file, rows, bytes, first_ns / last_ns (wall
+clock ns of the first and last row). It is rewritten through a temp file and
+os.replace, so readers always see a complete list.
+
+SegmentCompressor gzips (or zstd, when the zstandard package is installed)
+closed segments on a thread of its own: the compressed file is written under a
+temp name, the manifest entry is switched to it, then the plain file is
+removed. zlib / zstd release the GIL while compressing, so the logger thread
+and the reader keep running. Segments left uncompressed by a crash are picked
+up on the next start.
+
+iter_log_rows(path) streams the rows of every segment and then of the active
+file, one segment open at a time, checking each file's header.
+"""
+
+import csv
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+
+from autobot.ingest.schema import CSV_HEADER
+
+try:
+    import zstandard  # optional: faster and smaller than gzip
+except ImportError:
+    zstandard = None
+
+CODECS = {"gzip": ".gz", "zstd": ".zst"}
+GZIP_LEVEL = 6
+COPY_CHUNK = 1 << 20
+
+
+def split_path(path):
+    stem, ext = os.path.splitext(path)
+    return stem, ext or ".csv"
+
+
+def manifest_path(path):
+    return split_path(path)[0] + ".manifest.json"
+
+
+def segment_path(path, index, opened):
+    stem, ext = split_path(path)
+    return f"{stem}.{index:05d}.{time.strftime('%Y%m%d-%H%M%S', time.localtime(opened))}{ext}"
+
+
+def open_segment(path):
+    """Text stream for a plain, .gz or .zst segment."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", newline="", encoding="utf-8")
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError(f"{path}: reading .zst segments needs the zstandard package")
+        return zstandard.open(path, "rt", newline="", encoding="utf-8")
+    return open(path, newline="", encoding="utf-8")
+
+
+class SegmentManifest:
+    """The segment list of one log; shared by the logger and compressor threads."""
+
+    def __init__(self, log_path):
+        self.log_path = log_path
+        self.path = manifest_path(log_path)
+        self.dir = os.path.dirname(log_path) or "."
+        self._lock = threading.Lock()
+        self.segments = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)["segments"]
+        except FileNotFoundError:
+            return []
+
+    def _save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"log": os.path.basename(self.log_path), "segments": self.segments}, f, indent=1)
+        os.replace(tmp, self.path)
+
+    def add(self, entry):
+        with self._lock:
+            self.segments.append(entry)
+            self._save()
+
+    def renamed(self, old, new, size):
+        with self._lock:
+            for entry in self.segments:
+                if entry["file"] == old:
+                    entry["file"] = new
+                    entry["compressed_bytes"] = size
+            self._save()
+
+    def files(self):
+        with self._lock:
+            return [os.path.join(self.dir, entry["file"]) for entry in self.segments]
+
+
+class SegmentCompressor:
+    def __init__(self, manifest, codec="gzip"):
+        if codec not in CODECS:
+            raise ValueError(f"codec must be one of {tuple(CODECS)}")
+        if codec == "zstd" and zstandard is None:
+            raise RuntimeError("zstd compression needs the zstandard package")
+        self.manifest = manifest
+        self.codec = codec
+        self.compressed = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="log-compressor", daemon=True)
+        self._thread.start()
+        for path in manifest.files():
+            if not path.endswith(tuple(CODECS.values())):
+                self.submit(path)
+
+    def submit(self, path):
+        self._queue.put(path)
+
+    def pending(self):
+        return self._queue.unfinished_tasks
+
+    def join(self):
+        """Wait until every submitted segment is compressed."""
+        self._queue.join()
+
+    def close(self):
+        """Stop after the segment in progress; the rest is resumed on the next start."""
+        self._queue.put(None)
+
+    def _run(self):
+        while True:
+            path = self._queue.get()
+            try:
+                if path is None:
+                    return
+                self._compress(path)
+            except Exception as e:
+                print("[CSV] Compression failed:", e)
+            finally:
+                self._queue.task_done()
+
+    def _compress(self, path):
+        out = path + CODECS[self.codec]
+        tmp = out + ".tmp"
+        with open(path, "rb") as src:
+            if self.codec == "zstd":
+                with zstandard.open(tmp, "wb") as dst:
+                    shutil.copyfileobj(src, dst, COPY_CHUNK)
+            else:
+                with gzip.open(tmp, "wb", compresslevel=GZIP_LEVEL) as dst:
+                    shutil.copyfileobj(src, dst, COPY_CHUNK)
+        os.replace(tmp, out)
+        self.manifest.renamed(os.path.basename(path), os.path.basename(out), os.path.getsize(out))
+        os.remove(path)
+        self.compressed += 1
+
+
+# ---------------- reading ----------------
+def log_segments(path):
+    """Files of a log in order: closed segments from the manifest, then the active file."""
+    files = SegmentManifest(path).files() if os.path.exists(manifest_path(path)) else []
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+
+def _open_moved(path):
+    # the compressor may have replaced the plain file since the manifest was read
+    try:
+        return open_segment(path)
+    except FileNotFoundError:
+        for ext in CODECS.values():
+            if os.path.exists(path + ext):
+                return open_segment(path + ext)
+        raise
+
+
+def iter_log_rows(path):
+    """Data rows of every segment of a CsvLogger log, oldest first."""
+    segments = log_segments(path)
+    if not segments:
+        raise FileNotFoundError(path)
+    for segment in segments:
+        with _open_moved(segment) as f:
+            reader = csv.reader(f)
+            if next(reader, None) != CSV_HEADER:
+                raise ValueError(f"{segment}: not an AUTOBOT CSV log")
+            yield from reader
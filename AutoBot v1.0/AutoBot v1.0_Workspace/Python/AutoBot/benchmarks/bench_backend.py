@@ -0,0 +1,94 @@
+# benchmarks/bench_backend.py
+"""
+Cloud throughput on MemoryBackend, no network or credentials, at fixed
+injected latencies:
+  - raw get / set / update cost per call
+  - publish: BatteryPusher(interval=0) fed a new percentage per record, in
+    bursts of BURST records, for PUBLISH_S; writes per second reaching the
+    backend and how many changes were coalesced
+  - dispatch: back-to-back PickUpBlock / DropBlock updates through
+    BlockListener; tasks per second until the last one is seen
+"""
+
+import sys
+import threading
+import time
+
+from autobot.cloud.firebase import BATTERY_PATH, ROOT_PATH, BatteryPusher, BlockListener
+from autobot.cloud.memory import MemoryBackend
+from autobot.ingest.binary import decode_frame
+from autobot.simulator import make_json_packet
+
+from benchmarks.common import best_of
+
+OPS = 2000
+BURST = 10
+PUBLISH_S = 1.0
+TASKS = 500
+LATENCIES = (0.0, 0.002)
+
+
+def raw_ops():
+    backend = MemoryBackend({"AUTOBOT": {"AUTOBOT": {"PickUpBlock": 0, "DropBlock": 0}}})
+    t_get = best_of(lambda: [backend.get(ROOT_PATH) for _ in range(OPS)], 3) / OPS
+    t_set = best_of(lambda: [backend.set(BATTERY_PATH, "80%") for _ in range(OPS)], 3) / OPS
+    t_update = best_of(lambda: [backend.update(ROOT_PATH, {"PickUpBlock": i}) for i in range(OPS)], 3) / OPS
+    print(f"raw ops (0 ms): get {t_get * 1e6:5.1f} us, set {t_set * 1e6:5.1f} us, update {t_update * 1e6:5.1f} us")
+
+
+def publish(latency, recs):
+    backend = MemoryBackend(latency=latency)
+    pusher = BatteryPusher(backend, interval=0.0).start()
+    t0 = time.perf_counter()
+    submitted = 0
+    while time.perf_counter() - t0 < PUBLISH_S:
+        for _ in range(BURST):
+            rec = recs[submitted % len(recs)]
+            pusher.submit(rec, 0)
+            submitted += 1
+        time.sleep(0)
+    expected = f"{rec.battery_pct}%"
+    while backend.get(BATTERY_PATH) != expected:
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - t0
+    pusher.stop(timeout=1.0)
+    print(f"publish  ({latency * 1e3:3.0f} ms): {submitted / elapsed:9.0f} records/s in, "
+          f"{pusher.changes} changes -> {pusher.writes} writes ({pusher.writes / elapsed:6.0f}/s)")
+    return backend.get(BATTERY_PATH) == expected
+
+
+def dispatch(latency):
+    backend = MemoryBackend({"AUTOBOT": {"AUTOBOT": {"PickUpBlock": 0, "DropBlock": 0}}}, latency=latency)
+    done = threading.Event()
+    changes = [0]
+
+    def on_change(pickup, drop):
+        changes[0] += 1
+        if pickup == TASKS and drop == TASKS:
+            done.set()
+
+    listener = BlockListener(backend, on_change).start()
+    t0 = time.perf_counter()
+    for task in range(1, TASKS + 1):
+        backend.update(ROOT_PATH, {"PickUpBlock": task, "DropBlock": task})
+    ok = done.wait(10.0)
+    elapsed = time.perf_counter() - t0
+    listener.stop()
+    print(f"dispatch ({latency * 1e3:3.0f} ms): {TASKS / elapsed:9.0f} tasks/s, "
+          f"{listener.events} events, {changes[0]} changes reported")
+    return ok and changes[0] == TASKS + 1      # + the initial (0, 0)
+
+
+def main():
+    base = decode_frame(make_json_packet(0).rstrip(b"\n"))
+    recs = [base._replace(battery_pct=pct) for pct in range(101)]
+    raw_ops()
+    ok = True
+    for latency in LATENCIES:
+        ok &= publish(latency, recs)
+        ok &= dispatch(latency)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
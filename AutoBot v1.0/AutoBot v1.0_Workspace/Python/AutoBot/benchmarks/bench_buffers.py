@@ -0,0 +1,169 @@
+# benchmarks/bench_buffers.py
+"""
+Reader -> consumer hand-off: the legacy drop-oldest queue.Queue pattern vs
+LatestSlot (GUI) and RecordRing (CSV logger).
+  - producer cost per record
+  - GUI tick cost when N records arrived since the last tick
+  - threaded producer/consumer throughput, and what happens when the consumer
+    falls behind (queue silently evicts, ring counts overflows)
+"""
+
+import queue
+import threading
+import time
+
+from autobot.ingest.buffers import LatestSlot, RecordRing
+
+from benchmarks.common import best_of
+
+N = 200000
+N_THREADED = 50000
+BURST = 50          # rows per serial chunk; the producer sleeps 1 ms between bursts
+ITEM = ("2025-01-01 00:00:00", 1, 2, 3.0)
+
+
+def legacy_put(q, data):
+    try:
+        q.put_nowait(data)
+    except queue.Full:
+        try:
+            _ = q.get_nowait()
+            q.put_nowait(data)
+        except:
+            pass
+
+
+def legacy_latest(q):
+    latest = None
+    while True:
+        try:
+            latest = q.get_nowait()
+        except queue.Empty:
+            break
+    return latest
+
+
+def bench_producer():
+    q = queue.Queue(maxsize=1200)
+    slot = LatestSlot()
+    ring = RecordRing(N)
+
+    def run_queue():
+        for _ in range(N):
+            legacy_put(q, ITEM)
+
+    def run_slot():
+        publish = slot.publish
+        for _ in range(N):
+            publish(ITEM)
+
+    def run_ring():
+        ring.drain()
+        put = ring.put
+        for _ in range(N):
+            put(ITEM)
+
+    print("producer cost per record")
+    for name, fn in (("queue.Queue drop-oldest", run_queue), ("LatestSlot.publish", run_slot), ("RecordRing.put", run_ring)):
+        t = best_of(fn, 3)
+        print(f"  {name:<24} {t / N * 1e9:8.0f} ns")
+
+
+def bench_gui_tick():
+    print("GUI tick: fetch newest of n records that arrived since the last tick")
+    for n in (1, 10, 100, 1200):
+        q = queue.Queue(maxsize=1200)
+        slot = LatestSlot()
+        reps = max(1, 20000 // n)
+
+        def run_queue():
+            for _ in range(reps):
+                for _ in range(n):
+                    q.put_nowait(ITEM)
+                legacy_latest(q)
+
+        def fill_only():
+            for _ in range(reps):
+                for _ in range(n):
+                    q.put_nowait(ITEM)
+                q.queue.clear()
+
+        def run_slot():
+            seen = 0
+            for _ in range(reps):
+                for _ in range(n):
+                    slot.publish(ITEM)
+                newer = slot.get_if_newer(seen)
+                if newer:
+                    seen = newer[0]
+
+        def publish_only():
+            for _ in range(reps):
+                for _ in range(n):
+                    slot.publish(ITEM)
+
+        tq = (best_of(run_queue, 3) - best_of(fill_only, 3)) / reps
+        ts = (best_of(run_slot, 3) - best_of(publish_only, 3)) / reps
+        print(f"  n={n:<5} queue drain {tq * 1e6:9.2f} us   LatestSlot {max(ts, 0) * 1e6:6.2f} us")
+
+
+def bench_threaded(consumer_sleep):
+    """Producer pushes N_THREADED rows in bursts; the consumer drains every consumer_sleep seconds."""
+    results = {}
+
+    q = queue.Queue(maxsize=5000)
+    got = [0]
+    done = threading.Event()
+
+    def consume_queue():
+        while not (done.is_set() and q.empty()):
+            try:
+                while True:
+                    q.get_nowait()
+                    got[0] += 1
+            except queue.Empty:
+                pass
+            time.sleep(consumer_sleep)
+
+    th = threading.Thread(target=consume_queue)
+    t0 = time.perf_counter()
+    th.start()
+    for i in range(N_THREADED):
+        legacy_put(q, ITEM)
+        if i % BURST == 0:
+            time.sleep(0.001)
+    done.set()
+    th.join()
+    results["queue.Queue"] = (time.perf_counter() - t0, got[0], "?")
+
+    ring = RecordRing(5000)
+    got = [0]
+    done = threading.Event()
+
+    def consume_ring():
+        while not (done.is_set() and not ring):
+            got[0] += len(ring.drain())
+            time.sleep(consumer_sleep)
+
+    th = threading.Thread(target=consume_ring)
+    t0 = time.perf_counter()
+    th.start()
+    put = ring.put
+    for i in range(N_THREADED):
+        put(ITEM)
+        if i % BURST == 0:
+            time.sleep(0.001)
+    done.set()
+    th.join()
+    results["RecordRing"] = (time.perf_counter() - t0, got[0], ring.overflows)
+
+    print(f"threaded, {N_THREADED} rows in bursts of {BURST}, consumer drains every {consumer_sleep * 1000:.0f} ms")
+    for name, (t, n, lost) in results.items():
+        print(f"  {name:<12} {t:5.2f} s  delivered {n:>6}  reported lost {lost}")
+
+
+if __name__ == "__main__":
+    bench_producer()
+    bench_gui_tick()
+    bench_threaded(0.005)
+    bench_threaded(0.5)
@@ -0,0 +1,75 @@
+# benchmarks/bench_cloud.py
+"""
+Battery upload against MemoryBackend (autobot/cloud/memory.py) with a slow link.
+Legacy: one blocking set() per 20 Hz GUI tick, timed on the calling thread.
+BatteryPusher: fed at 100 Hz from this thread, like the reader thread feeds it;
+reports the cost of submit(), the percent changes vs writes actually sent, and
+checks that the value stored at the end is the newest one.
+The battery percentage jitters by one around a slow discharge, as the ADC does.
+"""
+
+import sys
+import time
+
+from autobot.cloud.firebase import BATTERY_PATH, BatteryPusher
+from autobot.cloud.memory import MemoryBackend
+from autobot.ingest.binary import decode_frame
+from autobot.simulator import make_json_packet
+
+RATE = 100
+SECONDS = 6.0
+LATENCY = 0.15
+LEGACY_TICKS = 20
+
+
+def battery_pct(i):
+    return 80 - i // 150 + (1 if i % 37 < 9 else 0)
+
+
+def records(n):
+    base = decode_frame(make_json_packet(0).rstrip(b"\n"))
+    return [base._replace(battery_pct=battery_pct(i)) for i in range(n)]
+
+
+def legacy(recs):
+    backend = MemoryBackend(latency=LATENCY)
+    t0 = time.perf_counter()
+    for rec in recs[:LEGACY_TICKS * 5:5]:
+        backend.set(BATTERY_PATH, f"{rec.battery_pct}%")
+    return (time.perf_counter() - t0) / LEGACY_TICKS
+
+
+def pushed(recs):
+    backend = MemoryBackend(latency=LATENCY)
+    pusher = BatteryPusher(backend).start()
+    submit_s = 0.0
+    t_start = time.monotonic()
+    for i, rec in enumerate(recs):
+        delay = t_start + i / RATE - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        t0 = time.perf_counter()
+        pusher.submit(rec, 0)
+        submit_s += time.perf_counter() - t0
+    expected = f"{recs[-1].battery_pct}%"
+    deadline = time.monotonic() + 2 * (pusher.interval + LATENCY)
+    while backend.get(BATTERY_PATH) != expected and time.monotonic() < deadline:
+        time.sleep(0.05)
+    stored = backend.get(BATTERY_PATH)
+    pusher.stop(timeout=1.0)
+    return submit_s / len(recs), pusher, stored, expected
+
+
+def main():
+    recs = records(int(RATE * SECONDS))
+    t_legacy = legacy(recs)
+    print(f"legacy       : {t_legacy * 1e3:7.1f} ms blocked per GUI tick, "
+          f"{20 * SECONDS:.0f} writes in {SECONDS:.0f} s")
+    t_submit, pusher, stored, expected = pushed(recs)
+    print(f"BatteryPusher: {t_submit * 1e6:7.2f} us per submit(), {pusher.changes} changes -> "
+          f"{pusher.writes} writes, {pusher.failures} failures, stored {stored!r} (newest {expected!r})")
+    sys.exit(0 if stored == expected and pusher.writes <= SECONDS / pusher.interval + 2 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# benchmarks/bench_columnar.py
+"""
+CSV log vs columnar log (autobot/sinks/columnar.py) for a simulated session of
+ROWS records at 100 Hz: bytes per sample on disk, logger-thread CPU to write
+it (CsvLogger's 1 s batches vs 10 s row groups, through the loggers' own
+_open / _write) and the time to load every column back as numpy arrays:
+CSV parsed with csv.reader and parse_wall_text, columnar decompressed,
+columnar memory-mapped from its cache. Autobot_Log.csv is the reference for
+bytes per row of a real log.
+"""
+
+import csv
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.clock import parse_wall_text
+from autobot.ingest.schema import CSV_HEADER, TELEMETRY_FIELDS
+from autobot.simulator import make_json_packet
+from autobot.sinks.columnar import ColumnLog, ColumnLogger
+from autobot.sinks.csv_log import CsvLogger
+
+ROWS = 100_000
+RATE = 100
+REAL_LOG = "Autobot_Log.csv"
+
+
+def session(n):
+    t0 = time.monotonic_ns()
+    return [(t0 + i * 1_000_000_000 // RATE, decode_frame(make_json_packet(i).rstrip(b"\n"))) for i in range(n)]
+
+
+def write(logger, rows):
+    batch = int(logger.batch_interval * RATE)
+    cpu0 = time.process_time()
+    f, writer = logger._open()
+    for i in range(0, len(rows), batch):
+        logger._write(f, writer, rows[i:i + batch])
+    f.close()
+    return time.process_time() - cpu0
+
+
+def load_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        rows = list(reader)
+    out = {"time_ns": np.fromiter((parse_wall_text(row[0]) for row in rows), np.int64, len(rows))}
+    for i, (name, _, _, kind) in enumerate(TELEMETRY_FIELDS, start=1):
+        out[name] = np.array([row[i] for row in rows], dtype=np.int32 if kind is int else np.float64)
+    return out
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def size_of(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(path, n)) for n in os.listdir(path) if n.endswith((".npz", ".json")))
+
+
+def main():
+    rows = session(ROWS)
+    tmp = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(tmp, "log.csv")
+        col_path = os.path.join(tmp, "log.acol")
+        raw_path = os.path.join(tmp, "raw.acol")
+        cpu_csv = write(CsvLogger(csv_path), rows)
+        cpu_col = write(ColumnLogger(col_path), rows)
+        cpu_raw = write(ColumnLogger(raw_path, compress=False), rows)
+
+        if os.path.exists(REAL_LOG):
+            with open(REAL_LOG, encoding="utf-8") as f:
+                real = sum(1 for _ in f) - 1
+            print(f"{REAL_LOG}: {os.path.getsize(REAL_LOG) / real:6.1f} bytes/row ({real} rows)")
+        for name, path, cpu in (("CSV", csv_path, cpu_csv), ("columnar", col_path, cpu_col),
+                                ("columnar, uncompressed", raw_path, cpu_raw)):
+            print(f"{name:22s}: {size_of(path) / ROWS:6.1f} bytes/sample, write CPU {cpu * 1e6 / ROWS:5.1f} us/row")
+
+        t_csv, from_csv = timed(lambda: load_csv(csv_path))
+        log = ColumnLog(col_path)
+        t_col, from_col = timed(lambda: log.read())
+        t_first, _ = timed(lambda: log.memmap())
+        t_map, mapped = timed(lambda: ColumnLog(col_path).memmap())
+        t_sum, _ = timed(lambda: [float(mapped[name].sum()) for name in mapped])
+        print(f"load {ROWS} rows x {len(log.columns)} columns: CSV {t_csv * 1e3:7.1f} ms | columnar {t_col * 1e3:6.1f} ms | "
+              f"memmap {t_map * 1e3:5.2f} ms (cache built in {t_first * 1e3:.0f} ms, full scan {t_sum * 1e3:.1f} ms)")
+
+        same = all(np.array_equal(from_csv[name], from_col[name]) for name in log.columns if name != "time_ns")
+        # CSV timestamps are local wall-clock text at us resolution
+        same &= np.array_equal(from_col["time_ns"] // 1000 * 1000, from_csv["time_ns"])
+        same &= all(np.array_equal(mapped[name], from_col[name]) for name in log.columns)
+        print("columns identical to the CSV:", bool(same), "| header", CSV_HEADER[:3], "...")
+    finally:
+        shutil.rmtree(tmp)
+    sys.exit(0 if same else 1)
+
+
+if __name__ == "__main__":
+    main()
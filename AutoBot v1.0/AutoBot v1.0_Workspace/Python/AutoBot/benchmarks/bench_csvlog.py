@@ -0,0 +1,165 @@
+# benchmarks/bench_csvlog.py
+"""
+CSV logger worker: the legacy csv_logger_thread loop (get_nowait into a list,
+at most 600 rows per pass, time.sleep(0.05), flush every CSV_BATCH_INTERVAL,
+exit on three flags) vs CsvLogger's blocking group commit. Both write the
+same rows with the same csv.writer.
+  - burst throughput: BURST rows queued at once, time until all are in the file
+  - shutdown: 100 Hz for RUN_S, then shutdown as on_closing does (legacy: set
+    the flags and leave; CsvLogger: close()); rows in the file vs rows sent
+  - idle: logger thread CPU over IDLE_S with logging on and no data (Linux)
+"""
+
+import csv
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.schema import CSV_HEADER
+from autobot.simulator import make_json_packet
+from autobot.sinks.csv_log import CSV_BATCH_INTERVAL, CsvLogger, prepare_row_for_csv
+
+BURST = 50_000
+RATE = 100
+RUN_S = 2.5
+IDLE_S = 2.0
+
+
+class LegacyLogger:
+    """csv_logger_thread from logger_json_updated.py, on (rx_ns, record) rows."""
+
+    def __init__(self, path):
+        self.path = path
+        self.log_queue = queue.Queue()
+        self.serial_stop_event = threading.Event()
+        self.logging_enabled = threading.Event()
+        self.logging_enabled.set()
+        self.rows = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def submit(self, rec, rx_ns):
+        if self.logging_enabled.is_set():
+            self.log_queue.put((rx_ns, rec))
+
+    def on_closing(self):
+        self.serial_stop_event.set()
+        self.logging_enabled.clear()
+
+    def _run(self):
+        f = open(self.path, "a", newline="", encoding="utf-8")
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        buffer_rows = []
+        last_flush = time.time()
+        while not (self.serial_stop_event.is_set() and self.log_queue.empty() and not self.logging_enabled.is_set()):
+            try:
+                while True:
+                    buffer_rows.append(self.log_queue.get_nowait())
+                    if len(buffer_rows) >= 600:
+                        break
+            except queue.Empty:
+                pass
+            now = time.time()
+            if buffer_rows and (now - last_flush >= CSV_BATCH_INTERVAL):
+                writer.writerows([prepare_row_for_csv(*row) for row in buffer_rows])
+                f.flush()
+                self.rows += len(buffer_rows)
+                buffer_rows = []
+                last_flush = now
+            time.sleep(0.05)
+        if buffer_rows:
+            writer.writerows([prepare_row_for_csv(*row) for row in buffer_rows])
+            f.flush()
+            self.rows += len(buffer_rows)
+        f.close()
+
+
+def rows_in(path):
+    with open(path, encoding="utf-8") as f:
+        return sum(1 for _ in f) - 1
+
+
+def wait_rows(path, n, timeout=30.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if os.path.exists(path) and rows_in(path) >= n:
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def make_logger(kind, path, capacity=5000):
+    if kind == "legacy":
+        return LegacyLogger(path).start()
+    logger = CsvLogger(path, capacity=capacity).start()
+    logger.enabled.set()
+    return logger
+
+
+def burst(kind, path, rec):
+    logger = make_logger(kind, path, capacity=BURST)
+    t0 = time.perf_counter()
+    for i in range(BURST):
+        logger.submit(rec, i)
+    if kind == "legacy":
+        wait_rows(path, BURST)
+    else:
+        logger.flush()
+    elapsed = time.perf_counter() - t0
+    (logger.on_closing if kind == "legacy" else logger.close)()
+    return BURST / elapsed
+
+
+def shutdown(kind, path, rec):
+    logger = make_logger(kind, path)
+    sent = 0
+    t0 = time.monotonic()
+    while time.monotonic() - t0 < RUN_S:
+        logger.submit(rec, time.monotonic_ns())
+        sent += 1
+        time.sleep(1 / RATE)
+    t1 = time.perf_counter()
+    (logger.on_closing if kind == "legacy" else logger.close)()
+    t_close = time.perf_counter() - t1
+    return sent, rows_in(path), t_close       # what is on disk when the process exits
+
+
+def idle(kind, path):
+    logger = make_logger(kind, path)
+    time.sleep(0.2)
+    clock = time.pthread_getcpuclockid(logger._thread.ident)
+    cpu0 = time.clock_gettime(clock)
+    time.sleep(IDLE_S)
+    cpu = (time.clock_gettime(clock) - cpu0) / IDLE_S
+    (logger.on_closing if kind == "legacy" else logger.close)()
+    return cpu
+
+
+def main():
+    rec = decode_frame(make_json_packet(1).rstrip(b"\n"))
+    tmp = tempfile.mkdtemp()
+    lost = {}
+    try:
+        for kind in ("legacy", "CsvLogger"):
+            rate = burst(kind, os.path.join(tmp, kind + "_burst.csv"), rec)
+            sent, written, t_close = shutdown(kind, os.path.join(tmp, kind + "_shutdown.csv"), rec)
+            cpu = idle(kind, os.path.join(tmp, kind + "_idle.csv"))
+            lost[kind] = sent - written
+            print(f"{kind:9s}: burst {rate:8.0f} rows/s | shutdown: {written}/{sent} rows on disk "
+                  f"({sent - written} lost, close took {t_close * 1e3:.1f} ms) | idle thread CPU {cpu * 100:.3f} %")
+    finally:
+        shutil.rmtree(tmp)
+    sys.exit(0 if lost["CsvLogger"] == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
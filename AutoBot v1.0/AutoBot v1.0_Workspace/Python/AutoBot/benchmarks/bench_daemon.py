@@ -0,0 +1,118 @@
+# benchmarks/bench_daemon.py
+"""
+Headless daemon checks:
+  - importing autobot.daemon pulls in no tkinter / customtkinter / matplotlib / PIL
+  - startup: spawn `python -m autobot.daemon` until its "[Daemon] Ready" line
+    (target < 300 ms), next to a bare `python -c pass` for the interpreter floor
+  - idle CPU: utime + stime of the daemon over a few seconds on a silent pty
+  - live: the simulator at 100 Hz for 2 s, every frame ends up in the CSV
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+STARTUP_RUNS = 5
+IDLE_SECONDS = 5.0
+GUI_MODULES = ("tkinter", "_tkinter", "customtkinter", "matplotlib", "PIL", "firebase_admin")
+
+
+def gui_imports():
+    code = f"import sys, autobot.daemon; print(','.join(m for m in {GUI_MODULES!r} if m in sys.modules))"
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+def spawn_daemon(port, csv_path, *extra):
+    cmd = [sys.executable, "-m", "autobot.daemon", "--port", port, "--raw", "--no-cloud", "--csv", csv_path, *extra]
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+
+
+def wait_ready(p):
+    for line in p.stdout:
+        if line.startswith("[Daemon] Ready"):
+            return
+    raise RuntimeError("daemon exited before Ready")
+
+
+def stop_daemon(p):
+    p.terminate()
+    out = p.communicate(timeout=5)[0]
+    return out
+
+
+def cpu_seconds(pid):
+    # fields 14/15 of /proc/<pid>/stat: utime, stime in clock ticks
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def bench_startup(port, tmp):
+    t = []
+    for _ in range(STARTUP_RUNS):
+        t0 = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        t.append(time.perf_counter() - t0)
+    floor = sorted(t)[len(t) // 2]
+
+    t = []
+    for i in range(STARTUP_RUNS):
+        t0 = time.perf_counter()
+        p = spawn_daemon(port, os.path.join(tmp, f"startup{i}.csv"))
+        wait_ready(p)
+        t.append(time.perf_counter() - t0)
+        stop_daemon(p)
+    t.sort()
+    return floor, t[0], t[len(t) // 2]
+
+
+def bench_idle(port, tmp):
+    p = spawn_daemon(port, os.path.join(tmp, "idle.csv"))
+    wait_ready(p)
+    time.sleep(0.5)  # let startup work settle
+    c0, t0 = cpu_seconds(p.pid), time.perf_counter()
+    time.sleep(IDLE_SECONDS)
+    c1, t1 = cpu_seconds(p.pid), time.perf_counter()
+    stop_daemon(p)
+    return (c1 - c0) / (t1 - t0)
+
+
+def bench_live(tmp):
+    sim = subprocess.Popen([sys.executable, "-m", "autobot.simulator", "--rate", "100"],
+                           stdout=subprocess.PIPE, text=True)
+    port = sim.stdout.readline().split(" on ")[1].split()[0]
+    csv_path = os.path.join(tmp, "live.csv")
+    p = spawn_daemon(port, csv_path, "--seconds", "2.5")
+    out = p.communicate(timeout=10)[0]
+    sim.terminate()
+    sim.wait()
+    with open(csv_path) as f:
+        rows = sum(1 for _ in f) - 1
+    return out.strip().splitlines()[-1], rows
+
+
+def main():
+    loaded = gui_imports()
+    print(f"GUI / cloud modules after import autobot.daemon: {loaded or 'none'}")
+
+    master, slave = os.openpty()  # nobody writes: a silent port
+    port = os.ttyname(slave)
+    with tempfile.TemporaryDirectory() as tmp:
+        floor, best, median = bench_startup(port, tmp)
+        print(f"startup: python -c pass {floor * 1e3:6.1f} ms | daemon Ready best {best * 1e3:6.1f} ms, "
+              f"median {median * 1e3:6.1f} ms")
+        idle = bench_idle(port, tmp)
+        print(f"idle CPU over {IDLE_SECONDS:.0f} s: {idle * 100:.2f} %")
+        status, rows = bench_live(tmp)
+        print(f"live 100 Hz: {status} | CSV rows {rows}")
+    os.close(master)
+    os.close(slave)
+
+    ok = not loaded and median < 0.3 and idle < 0.01 and rows > 0
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# benchmarks/bench_decode.py
+"""
+Per-packet decode cost: json.loads + prepare_row_for_csv (pad_list / safe_int /
+safe_float walk) vs the compiled telemetry schema decoder.
+The row timestamp is left out on both sides; only decoding is measured.
+orjson.loads is over half of the orjson path's cost; "json + extractor" is
+what decode_packet costs when orjson is not installed.
+"""
+
+import json
+
+from autobot.ingest import schema as telemetry_schema
+
+from benchmarks.common import best_of, make_json_packet
+
+N_PACKETS = 20000
+
+
+# ---- legacy path, as in autobot_gui_logger.py before the schema decoder ----
+def pad_list(arr, n=3):
+    if not isinstance(arr, list):
+        return [0.0] * n
+    out = arr[:n] + [0.0] * max(0, n - len(arr))
+    res = []
+    for x in out:
+        try:
+            res.append(float(x))
+        except:
+            res.append(0.0)
+    return res
+
+
+def safe_int(v, default=0):
+    try:
+        return int(v)
+    except:
+        try:
+            return int(float(v))
+        except:
+            return default
+
+
+def safe_float(v, default=0.0):
+    try:
+        return float(v)
+    except:
+        return default
+
+
+def legacy_row(data):
+    enc = data.get("enc", {}) or {}
+    imu = data.get("imu", {}) or {}
+    battery = data.get("battery", {}) or {}
+    esp = data.get("esp", {}) or {}
+    acc = pad_list(imu.get("acc", []), 3)
+    gyro = pad_list(imu.get("gyro", []), 3)
+    euler = pad_list(imu.get("euler", []), 3)
+    pos_raw = esp.get("pos", [0, 0, 0])
+    if not isinstance(pos_raw, list):
+        pos_raw = [0, 0, 0]
+    pos = (pos_raw[:3] + [0.0] * 3)[:3]
+    pos = [safe_float(x, 0.0) for x in pos]
+    return [
+        safe_int(enc.get("L", 0)), safe_int(enc.get("R", 0)),
+        safe_float(enc.get("left_deg", 0.0)), safe_float(enc.get("right_deg", 0.0)),
+        acc[0], acc[1], acc[2],
+        gyro[0], gyro[1], gyro[2],
+        euler[0], euler[1], euler[2],
+        safe_float(battery.get("voltage", 0.0)), safe_int(battery.get("percent", 0)),
+        safe_int(esp.get("tag", 0)),
+        safe_float(esp.get("yaw", 0.0)), safe_float(esp.get("pitch", 0.0)), safe_float(esp.get("roll", 0.0)),
+        pos[0], pos[1], pos[2]
+    ]
+
+
+def main():
+    frames = [make_json_packet(i).rstrip(b"\n") for i in range(N_PACKETS)]
+    for f in frames[:100]:
+        assert list(telemetry_schema.decode_packet(f)) == legacy_row(json.loads(f))
+        assert list(telemetry_schema.extract_fields(telemetry_schema._json_loads(f))) == legacy_row(json.loads(f))
+
+    def run_legacy():
+        for f in frames:
+            legacy_row(json.loads(f))
+
+    def run(decode):
+        def loop():
+            for f in frames:
+                decode(f)
+        return loop
+
+    def stdlib_json(buf, extract=telemetry_schema.extract_fields, loads=telemetry_schema._json_loads):
+        return extract(loads(buf))
+
+    cases = [
+        ("schema: json + extractor", stdlib_json),
+    ]
+    if telemetry_schema.orjson is not None:
+        cases.append(("schema: orjson + extractor", telemetry_schema.decode_values))
+    cases.append((f"decode_packet ({telemetry_schema.JSON_BACKEND})", telemetry_schema.decode_packet))
+
+    t_legacy = best_of(run_legacy)
+    print(f"{'json.loads + prepare_row_for_csv':36s} {t_legacy / N_PACKETS * 1e6:6.2f} us/packet")
+    for name, fn in cases:
+        t = best_of(run(fn))
+        print(f"{name:36s} {t / N_PACKETS * 1e6:6.2f} us/packet  ({t_legacy / t:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
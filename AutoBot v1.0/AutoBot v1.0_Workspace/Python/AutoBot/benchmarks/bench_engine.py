@@ -0,0 +1,144 @@
+# benchmarks/bench_engine.py
+"""
+Thread-per-source ingest (reader threads -> queue.Queue -> CSV thread, as in the
+GUI script) vs the asyncio IngestEngine, hosting 1..16 simulated robots.
+Simulators run in child processes; only this process's CPU time and context
+switches are counted.
+"""
+
+import csv
+import os
+import queue
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.engine import IngestEngine
+from autobot.ingest.framing import TelemetryFramer
+from autobot.ingest.reader import ChunkReader
+from autobot.sinks.aio import LatestSink, LoggerSink
+from autobot.sinks.csv_log import CsvLogger
+
+RATE_HZ = 200.0
+SECONDS = 3.0
+
+
+def start_simulators(n):
+    procs, ports = [], []
+    for _ in range(n):
+        p = subprocess.Popen([sys.executable, "-m", "autobot.simulator", "--rate", str(RATE_HZ)],
+                             stdout=subprocess.PIPE, text=True)
+        line = p.stdout.readline()
+        ports.append(line.split(" on ")[1].split()[0])
+        procs.append(p)
+    return procs, ports
+
+
+def open_port(path):
+    import termios
+    import tty
+    fd = os.open(path, os.O_RDONLY | os.O_NOCTTY)
+    tty.setraw(fd)
+    termios.tcflush(fd, termios.TCIFLUSH)
+    return open(fd, "rb", buffering=0)
+
+
+def usage():
+    r = resource.getrusage(resource.RUSAGE_SELF)
+    return r.ru_utime + r.ru_stime, r.ru_nvcsw + r.ru_nivcsw
+
+
+def run_threads(ports, path):
+    stop = threading.Event()
+    q = queue.Queue(maxsize=5000)
+    frames = [0]
+
+    def reader(port):
+        framer = TelemetryFramer()
+        chunk_reader = ChunkReader(port)
+
+        def on_frame(frame):
+            try:
+                rec = decode_frame(frame)
+            except ValueError:
+                return  # partial first line: the port was opened mid-stream
+            frames[0] += 1
+            q.put_nowait([time.strftime("%Y-%m-%d %H:%M:%S"), *rec])
+
+        while not stop.is_set():
+            chunk = chunk_reader.read()
+            if chunk:
+                framer.feed(chunk, on_frame)
+
+    def writer():
+        with open(path, "a", newline="") as f:
+            w = csv.writer(f)
+            rows = []
+            last = time.time()
+            while not stop.is_set():
+                try:
+                    while True:
+                        rows.append(q.get_nowait())
+                except queue.Empty:
+                    pass
+                if rows and time.time() - last >= 1.0:
+                    w.writerows(rows)
+                    f.flush()
+                    rows = []
+                    last = time.time()
+                time.sleep(0.05)
+
+    threads = [threading.Thread(target=reader, args=(p,), daemon=True) for p in ports]
+    threads.append(threading.Thread(target=writer, daemon=True))
+    for t in threads:
+        t.start()
+    time.sleep(SECONDS)
+    stop.set()
+    for t in threads:
+        t.join()
+    return frames[0]
+
+
+def run_engine(ports, path):
+    engine = IngestEngine()
+    engine.add_sink(LatestSink())
+    logger = CsvLogger(path, index_rows=0)
+    logger.enabled.set()
+    engine.add_sink(LoggerSink(logger))
+    for i, p in enumerate(ports):
+        engine.add_source(f"robot{i}", p)
+    engine.start_in_thread()
+    time.sleep(SECONDS)
+    engine.stop()
+    engine.join()
+    return engine.frames
+
+
+def main():
+    for n in (1, 4, 16):
+        procs, paths = start_simulators(n)
+        try:
+            for name, fn in (("threads", run_threads), ("asyncio", run_engine)):
+                ports = [open_port(p) for p in paths]
+                with tempfile.TemporaryDirectory() as tmp:
+                    cpu0, cs0 = usage()
+                    frames = fn(ports, os.path.join(tmp, "log.csv"))
+                    cpu1, cs1 = usage()
+                for p in ports:
+                    p.close()
+                print(f"{n:2d} robots {name:8s} {frames / SECONDS:7.0f} frames/s  "
+                      f"CPU {(cpu1 - cpu0) / SECONDS * 100:5.1f}%  "
+                      f"{(cpu1 - cpu0) / max(frames, 1) * 1e6:6.1f} us/frame  "
+                      f"{(cs1 - cs0) / SECONDS:7.0f} ctx switches/s")
+        finally:
+            for p in procs:
+                p.terminate()
+                p.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# benchmarks/bench_fanout.py
+"""
+Decode-once fan-out: the old image_processor.py reader loop (chunk appended to
+the buffer twice, nested split loop, up to three gui_queue puts and two
+prepare_row_for_csv calls per packet) vs IngestCore with GUI / CSV / cloud
+subscribers.
+
+Doubles as the decode-count regression check: exits non-zero unless
+IngestCore decodes every frame exactly once and every subscriber sees every
+record exactly once, for JSON, binary and mixed streams.
+"""
+
+import json
+import sys
+
+from autobot.ingest.buffers import LatestSlot, RecordRing
+from autobot.ingest.core import IngestCore
+
+from benchmarks.common import best_of, chunked, make_stream
+
+N_PACKETS = 5000
+CHUNK = 512
+
+
+class Counters:
+    def __init__(self):
+        self.decodes = 0
+        self.gui = 0
+        self.csv = 0
+
+
+def legacy_image_processor(chunks, counters):
+    # serial_reader_thread from image_processor.py before the rewrite, minus the serial port
+    def loads(s):
+        counters.decodes += 1
+        return json.loads(s)
+
+    buffer = ""
+    for raw in chunks:
+        chunk = raw.decode("utf-8", errors="ignore")
+        buffer += chunk
+        if chunk:
+            buffer += chunk
+        while "\n" in buffer:
+            line, buffer = buffer.split("\n", 1)
+            line = line.strip()
+            while "\n" in buffer:
+                packet, buffer = buffer.split("\n", 1)
+                packet = packet.strip()
+                if not packet:
+                    continue
+                try:
+                    data = loads(packet)
+                except json.JSONDecodeError:
+                    continue
+                counters.gui += 1
+            try:
+                data = loads(line)
+            except Exception:
+                continue
+            counters.gui += 2
+            counters.csv += 2
+
+
+def run_core(chunks):
+    core = IngestCore()
+    gui, cloud = LatestSlot(), LatestSlot()
+    ring = RecordRing(N_PACKETS)
+    core.subscribe(lambda rec, rx_ns: gui.publish(rec))
+    core.subscribe(lambda rec, rx_ns: ring.put((rx_ns, rec)))
+    core.subscribe(lambda rec, rx_ns: cloud.publish(rec))
+    for c in chunks:
+        core.feed(c)
+    return core, gui, ring, cloud
+
+
+def check_decode_once():
+    ok = True
+    for fmt in ("json", "binary", "mixed"):
+        chunks = chunked(make_stream(N_PACKETS, fmt), CHUNK)
+        core, gui, ring, cloud = run_core(chunks)
+        rows = ring.drain()
+        counts = (core.frames, core.decodes, gui.version, len(rows), cloud.version)
+        passed = core.errors == 0 and counts == (N_PACKETS,) * 5
+        ok &= passed
+        print(f"  {fmt:<6} frames {core.frames}  decodes {core.decodes}  gui {gui.version}  "
+              f"csv {len(rows)}  cloud {cloud.version}  errors {core.errors}  "
+              f"{'ok' if passed else 'FAIL'}")
+    return ok
+
+
+def main():
+    chunks = chunked(make_stream(N_PACKETS, "json"), CHUNK)
+
+    c = Counters()
+    legacy_image_processor(chunks, c)
+    print(f"legacy image_processor loop, {N_PACKETS} packets:")
+    print(f"  decodes {c.decodes} ({c.decodes / N_PACKETS:.2f}/packet)  "
+          f"gui puts {c.gui}  csv rows {c.csv}")
+
+    t_legacy = best_of(lambda: legacy_image_processor(chunks, Counters()))
+    t_core = best_of(lambda: run_core(chunks))
+    print(f"  legacy loop               {t_legacy / N_PACKETS * 1e6:6.2f} us/packet")
+    print(f"  IngestCore + 3 subscribers {t_core / N_PACKETS * 1e6:5.2f} us/packet")
+
+    print("IngestCore decode-once check:")
+    if not check_decode_once():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# benchmarks/bench_formats.py
+"""
+JSON lines vs COBS binary frames, end to end over a pty:
+simulator -> pty -> os.read -> TelemetryFramer -> decode_frame.
+Reports bytes/packet, host packets/s and the packet rate the wire allows.
+"""
+
+import os
+import select
+import time
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.framing import TelemetryFramer
+from autobot.simulator import RobotSimulator, make_packet
+
+N_PACKETS = 20000
+
+
+def run_pty(fmt, n=N_PACKETS):
+    sim = RobotSimulator(fmt, rate_hz=0, count=n)
+    framer = TelemetryFramer()
+    got = [0]
+
+    def on_frame(frame):
+        decode_frame(frame)
+        got[0] += 1
+
+    t0 = time.perf_counter()
+    sim.start()
+    try:
+        while got[0] < n:
+            if not select.select([sim.slave_fd], [], [], 2.0)[0]:
+                break
+            framer.feed(os.read(sim.slave_fd, 65536), on_frame)
+        elapsed = time.perf_counter() - t0
+    finally:
+        sim.close()
+    return got[0], elapsed
+
+
+def decode_only(fmt, n=N_PACKETS):
+    stream = b"".join(make_packet(i, fmt) for i in range(n))
+    framer = TelemetryFramer()
+    t0 = time.perf_counter()
+    framer.feed(stream, lambda frame: decode_frame(frame))
+    return time.perf_counter() - t0
+
+
+def main():
+    for fmt in ("json", "binary", "mixed"):
+        size = sum(len(make_packet(i, fmt)) for i in range(1000)) / 1000
+        got, elapsed = run_pty(fmt)
+        t_dec = decode_only(fmt)
+        print(f"{fmt:7s} {size:6.1f} B/packet | pty: {got / elapsed:8.0f} packets/s ({got} received) "
+              f"| framing+decode: {N_PACKETS / t_dec:8.0f} packets/s "
+              f"| wire limit: {115200 / 10 / size:6.0f} @115200, {921600 / 10 / size:6.0f} @921600")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/bench_framing.py
+"""
+Line framing throughput: legacy str split loop vs LineFramer.
+Chunk sizes model what one 1 ms poll returns at 115200 / 921600 baud, plus a
+4 KB burst (full OS buffer after a stalled GUI tick). Small chunks without a
+newline cost the same in both; each frame costs LineFramer a memoryview slice,
+so it trails the str split up to 4 KB chunks and wins on large bursts.
+Last run: 1.1x at 115200 baud, 0.6-0.9x from 92 B (921600 baud) to 4 KB
+chunks, still over 1000 times the port's line rate; about 2x at 64 KB and 20x
+at 1 MB, where the legacy loop re-copies the rest of the buffer for every line.
+"""
+
+from autobot.ingest.framing import LineFramer
+
+from benchmarks.common import best_of, bytes_per_ms, chunked, make_stream
+
+N_PACKETS = 20000
+
+
+def legacy_split(chunks):
+    count = [0]
+
+    def on_line(line):
+        count[0] += 1
+
+    buffer = ""
+    for raw in chunks:
+        buffer += raw.decode("utf-8", errors="ignore")
+        while "\n" in buffer:
+            line, buffer = buffer.split("\n", 1)
+            line = line.strip()
+            if line:
+                on_line(line)
+    return count[0]
+
+
+def framer_feed(chunks):
+    count = [0]
+
+    def on_frame(frame):
+        count[0] += 1
+
+    framer = LineFramer()
+    for raw in chunks:
+        framer.feed(raw, on_frame)
+    return count[0]
+
+
+def main():
+    stream = make_stream(N_PACKETS)
+    pkt_len = len(stream) / N_PACKETS
+    print(f"{N_PACKETS} packets, {pkt_len:.0f} bytes/packet")
+    cases = [
+        ("115200 baud, 1 ms poll", bytes_per_ms(115200)),
+        ("921600 baud, 1 ms poll", bytes_per_ms(921600)),
+        ("4 KB burst", 4096),
+        ("64 KB burst", 65536),
+        ("1 MB burst", 1 << 20),
+    ]
+    for name, size in cases:
+        chunks = chunked(stream, size)
+        assert legacy_split(chunks) == framer_feed(chunks) == N_PACKETS
+        t_old = best_of(lambda: legacy_split(chunks))
+        t_new = best_of(lambda: framer_feed(chunks))
+        print(f"{name:24s} chunk={size:6d}B  "
+              f"split: {N_PACKETS / t_old:10.0f} lines/s  "
+              f"LineFramer: {N_PACKETS / t_new:10.0f} lines/s  "
+              f"({t_old / t_new:.1f}x)")
+    for baud in (115200, 921600):
+        print(f"line rate needed at {baud} baud: {baud / 10 / pkt_len:.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# benchmarks/bench_governor.py
+"""
+GUI poll loop: fixed after(50) vs FrameGovernor, without Tk.
+The "GUI" runs in the main thread next to an in-process SerialLink reading the
+simulator (100 Hz), like autobot/gui/app.py. A render is one C call that holds
+the GIL (sum(range(n)), as in bench_shm), done only when a new record arrived.
+Per scenario: GUI ticks and renders per second, GUI thread CPU, and for ingest
+the frames received vs sent by the simulator and the longest gap between two
+received frames.
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+
+from autobot.gui.governor import FrameGovernor
+from autobot.ingest.buffers import LatestSlot
+from autobot.ingest.link import SerialLink, open_raw
+
+SECONDS = 4.0
+RATE = 100
+FIXED_POLL_S = 0.050
+
+
+def calibrate_render(ms):
+    n = 100000
+    t0 = time.perf_counter()
+    sum(range(n))
+    return max(1, int(n * ms / 1000 / (time.perf_counter() - t0)))
+
+
+class Feed:
+    """SerialLink + the GUI's LatestSlot, with receive-gap bookkeeping."""
+
+    def __init__(self, port):
+        self.slot = LatestSlot()
+        self.frames = 0
+        self.max_gap_ns = 0
+        self._last = None
+        self.link = SerialLink(opener=open_raw)
+        self.link.core.subscribe(self.on_frame)
+        self.link.start(port, None)
+
+    def on_frame(self, rec, rx_ns):
+        if self._last is not None:
+            self.max_gap_ns = max(self.max_gap_ns, rx_ns - self._last)
+        self._last = rx_ns
+        self.frames += 1
+        self.slot.publish(rec)
+
+    def close(self):
+        self.link.stop(timeout=1.0)
+
+
+def gui_loop(feed, render_n, governor, visible=True):
+    seen = 0
+    frames_seen = 0
+    ticks = renders = 0
+    cpu0 = time.thread_time()
+    end = time.monotonic() + SECONDS
+    while time.monotonic() < end:
+        t0 = time.perf_counter()
+        frames = feed.frames - frames_seen
+        frames_seen += frames
+        rendered = False
+        if visible:
+            newer = feed.slot.get_if_newer(seen)
+            if newer:
+                seen = newer[0]
+                sum(range(render_n))
+                rendered = True
+        ticks += 1
+        renders += rendered
+        tick_s = time.perf_counter() - t0
+        if governor is None:
+            time.sleep(FIXED_POLL_S)        # after(50) is scheduled after the tick's work
+        else:
+            governor.frame_done(tick_s, frames, rendered, visible)
+            time.sleep(governor.delay_ms(tick_s) / 1000)
+    return ticks / SECONDS, renders / SECONDS, (time.thread_time() - cpu0) / SECONDS
+
+
+def scenario(name, render_n, governed, visible=True, data=True):
+    if data:
+        sim, port = start_simulator()
+    else:
+        master, slave = os.openpty()    # nobody writes: a silent port
+        port = os.ttyname(slave)
+    feed = Feed(port)
+    ticks, renders, cpu = gui_loop(feed, render_n, FrameGovernor() if governed else None, visible)
+    sent = 0
+    if data:
+        sim.send_signal(signal.SIGINT)
+        sent = int(sim.communicate(timeout=5)[0].split("sent ")[1].split()[0])
+        time.sleep(0.2)     # let the reader drain the pty
+    feed.close()
+    if not data:
+        os.close(master)
+        os.close(slave)
+    print(f"{name:34s} {'governor' if governed else 'fixed 50'}: {ticks:5.1f} ticks/s, {renders:5.1f} renders/s, "
+          f"GUI CPU {cpu * 100:5.1f} % | ingest {feed.frames:4d}/{sent:4d} frames, "
+          f"max gap {feed.max_gap_ns / 1e6:5.1f} ms")
+    return cpu, feed.frames, sent
+
+
+def start_simulator():
+    p = subprocess.Popen([sys.executable, "-m", "autobot.simulator", "--rate", str(RATE)],
+                         stdout=subprocess.PIPE, text=True)
+    return p, p.stdout.readline().split(" on ")[1].split()[0]
+
+
+def main():
+    render_n = {ms: calibrate_render(ms) for ms in (10, 60)}
+    results = {}
+    for name, render_ms, visible, data in (
+        ("100 Hz, 10 ms render", 10, True, True),
+        ("100 Hz, 60 ms render (overloaded)", 60, True, True),
+        ("100 Hz, minimized", 10, False, True),
+        ("no data", 10, True, False),
+    ):
+        for governed in (False, True):
+            results[name, governed] = scenario(name, render_n[render_ms], governed, visible, data)
+    overloaded = "100 Hz, 60 ms render (overloaded)"
+    lossless = all(received == sent for _, received, sent in results.values())
+    sys.exit(0 if lossless and results[overloaded, True][0] < results[overloaded, False][0] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# benchmarks/bench_index.py
+"""
+Range queries over a CSV log with and without the sparse block index
+(autobot/sinks/index.py). A simulated session of ROWS records at 100 Hz, the
+robot passing a new ESP tag (1..TAGS) every TAG_ROWS rows, is written through
+CsvLogger's _open / _write in 1 s batches, once as one file and once rotated
+into gzip segments.
+  - write: CPU per row with and without the index, sidecar size
+  - query "4 minutes where ESP_Tag_ID == 3": full scan with csv.reader vs
+    LogQuery (time, blocks read / total), one file and segmented
+  - query a 4 minute window, any tag
+Every LogQuery answer is checked against the full scan.
+"""
+
+import csv
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.schema import CSV_HEADER
+from autobot.simulator import make_json_packet
+from autobot.sinks.csv_log import CsvLogger
+from autobot.sinks.index import LogQuery, index_path
+from autobot.sinks.rotation import iter_log_rows, log_segments
+
+ROWS = 300_000
+RATE = 100
+TAGS = 8
+TAG_ROWS = 1500
+SEGMENT_BYTES = 8_000_000
+TAG = CSV_HEADER.index("ESP_Tag_ID")
+
+
+def session(n):
+    t0 = time.monotonic_ns()
+    return [(t0 + i * 1_000_000_000 // RATE,
+             decode_frame(make_json_packet(i).rstrip(b"\n"))._replace(esp_tag=1 + (i // TAG_ROWS) % TAGS))
+            for i in range(n)]
+
+
+def write(logger, rows):
+    cpu0 = time.process_time()
+    f, writer = logger._open()
+    for i in range(0, len(rows), RATE):
+        logger._write(f, writer, rows[i:i + RATE])
+        if logger._rotation_due(f):
+            f, writer = logger._rotate(f)
+    f.close()
+    if logger.indexer is not None:
+        logger.indexer.close()
+    if logger.compressor is not None:
+        logger.compressor.join()
+        logger.compressor.close()
+    return (time.process_time() - cpu0) / len(rows)
+
+
+def full_scan(path, lo, hi, tag):
+    # what a reader without the index does: every row of every segment
+    return [row for row in iter_log_rows(path)
+            if lo <= (row[0] if len(row[0]) > 19 else row[0] + ".000000") < hi and (tag is None or row[TAG] == tag)]
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def main():
+    rows = session(ROWS)
+    tmp = tempfile.mkdtemp()
+    ok = True
+    try:
+        plain = os.path.join(tmp, "plain", "Autobot_Log.csv")
+        cpu_plain = write(CsvLogger(plain, index_rows=0), rows)
+        one = os.path.join(tmp, "indexed", "Autobot_Log.csv")
+        cpu_one = write(CsvLogger(one), rows)
+        seg = os.path.join(tmp, "segments", "Autobot_Log.csv")
+        write(CsvLogger(seg, max_bytes=SEGMENT_BYTES), rows)
+        print(f"write: {cpu_plain * 1e6:5.2f} us/row without index, {cpu_one * 1e6:5.2f} us/row with | "
+              f"log {os.path.getsize(one) / 1e6:.1f} MB, index {os.path.getsize(index_path(one)) / 1e3:.1f} kB | "
+              f"{len(log_segments(seg))} files when rotated")
+
+        with open(one, newline="", encoding="utf-8") as f:
+            texts = [row[0] for row in csv.reader(f)][1:]
+        i0 = ROWS * 3 // 5
+        lo, hi = texts[i0], texts[i0 + 240 * RATE]
+        for name, tag in (("tag 3, 4 min", "3"), ("any tag, 4 min", None)):
+            t_scan, expect = timed(lambda: full_scan(one, lo, hi, tag))
+            tags = [int(tag)] if tag is not None else None
+            for label, path in (("one file", one), ("segments", seg)):
+                q = LogQuery(path, lo, hi, tags)
+                t_query, got = timed(lambda: list(q))
+                ok &= got == expect
+                print(f"{name:15s} {label:8s}: full scan {t_scan * 1e3:7.1f} ms | indexed {t_query * 1e3:6.1f} ms, "
+                      f"{q.blocks_read}/{q.blocks_total} blocks, {q.rows_scanned} rows parsed -> {len(got)} rows")
+    finally:
+        shutil.rmtree(tmp)
+    print("answers match:", bool(ok))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
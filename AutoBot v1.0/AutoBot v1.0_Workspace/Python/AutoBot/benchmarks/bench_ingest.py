@@ -0,0 +1,114 @@
+# benchmarks/bench_ingest.py
+"""
+Reader loop cost: legacy non-blocking read + time.sleep(0.001) polling vs
+ChunkReader (selectors on the port fd). Measures the reader thread's CPU time
+while the robot is silent, and read-to-queue latency at 50 packets/s.
+"""
+
+import fcntl
+import os
+import queue
+import threading
+import time
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.framing import TelemetryFramer
+from autobot.ingest.reader import ChunkReader
+from autobot.simulator import RobotSimulator, make_packet
+
+IDLE_SECONDS = 2.0
+N_LATENCY = 100
+RATE_HZ = 50.0
+
+
+def legacy_loop(fd, stop, on_chunk):
+    # ser = serial.Serial(..., timeout=0); ser.read(ser.in_waiting or 1); sleep(1 ms)
+    fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+    while not stop.is_set():
+        try:
+            chunk = os.read(fd, 4096)
+        except BlockingIOError:
+            chunk = b""
+        if chunk:
+            on_chunk(chunk)
+        time.sleep(0.001)
+
+
+def event_loop(fd, stop, on_chunk):
+    port = open(fd, "rb", buffering=0, closefd=False)
+    reader = ChunkReader(port)
+    while not stop.is_set():
+        chunk = reader.read()
+        if chunk:
+            on_chunk(chunk)
+    reader.close()
+
+
+def run_reader(loop, sim, on_chunk, seconds=None, until=None):
+    stop = threading.Event()
+    cpu = [0.0]
+
+    def target():
+        t0 = time.thread_time()
+        loop(sim.slave_fd, stop, on_chunk)
+        cpu[0] = time.thread_time() - t0
+
+    th = threading.Thread(target=target, daemon=True)
+    th.start()
+    if seconds is not None:
+        time.sleep(seconds)
+    if until is not None:
+        until()
+    stop.set()
+    th.join()
+    return cpu[0]
+
+
+def idle_cpu(loop):
+    sim = RobotSimulator("json", rate_hz=RATE_HZ, count=0)
+    try:
+        cpu = run_reader(loop, sim, lambda chunk: None, seconds=IDLE_SECONDS)
+    finally:
+        sim.close()
+    return cpu / IDLE_SECONDS * 100
+
+
+def latency(loop):
+    sim = RobotSimulator("json", rate_hz=0, count=0)
+    framer = TelemetryFramer()
+    q = queue.Queue()
+    sent = []
+    lat = []
+
+    def on_frame(frame):
+        q.put(decode_frame(frame))
+        lat.append(time.perf_counter() - sent[len(lat)])
+
+    def writer():
+        period = 1.0 / RATE_HZ
+        for i in range(N_LATENCY):
+            sent.append(time.perf_counter())
+            os.write(sim.master_fd, make_packet(i, "json"))
+            time.sleep(period)
+        deadline = time.time() + 2.0
+        while len(lat) < N_LATENCY and time.time() < deadline:
+            time.sleep(0.01)
+
+    try:
+        run_reader(loop, sim, lambda chunk: framer.feed(chunk, on_frame), until=writer)
+    finally:
+        sim.close()
+    lat.sort()
+    return lat[len(lat) // 2] * 1e3, lat[int(len(lat) * 0.99) - 1] * 1e3, len(lat)
+
+
+def main():
+    for name, loop in (("legacy 1 ms poll", legacy_loop), ("ChunkReader", event_loop)):
+        cpu = idle_cpu(loop)
+        p50, p99, n = latency(loop)
+        print(f"{name:18s} idle CPU {cpu:5.2f}% of a core | read-to-queue latency "
+              f"p50 {p50:.3f} ms, p99 {p99:.3f} ms ({n} packets)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/bench_labels.py
+"""
+Dashboard label updates per GUI tick: every label set every tick (legacy) vs
+LabelViewModel, which formats once and only sets labels whose text changed.
+The labels are bound to real Tcl variables (tkinter.Tcl(), no display needed),
+so each set is a real Tcl round trip; Tk's re-layout comes on top of that in
+the GUI. The stream is the simulator at 100 Hz seen by a 50 ms GUI tick
+(every 5th frame), once as generated and once with the ESP idle (all zeros,
+as on the bench most of the time).
+"""
+
+import tkinter
+
+from autobot.gui.viewmodel import LabelViewModel
+from autobot.ingest.binary import decode_frame
+from autobot.simulator import make_json_packet
+
+from benchmarks.common import best_of
+
+TICKS = 2000
+EVERY = 5
+
+# (field, format) for the 25 labels show_record sets per record (battery colour included)
+LABELS = (
+    [("left", "{}"), ("right", "{}"), ("left_deg", "[{:.2f}°]"), ("right_deg", "[{:.2f}°]"),
+     ("left_deg", "{:.2f}°"), ("right_deg", "{:.2f}°")]
+    + [(f, "{:.2f}") for f in ("accel_x", "accel_y", "accel_z", "gyro_x", "gyro_y", "gyro_z", "pitch", "roll", "yaw")]
+    + [("esp_tag", "{}")]
+    + [(f, "{:.2f}") for f in ("esp_x", "esp_y", "esp_z", "esp_yaw", "esp_pitch", "esp_roll")]
+    + [("battery_pct", "{}%"), ("battery_pct", "colour"), ("battery_v", "Voltage: {:.2f} V")]
+)
+
+
+def colour(pct):
+    return "#22c55e" if pct >= 75 else "#eab308" if pct >= 50 else "#f97316" if pct >= 25 else "#ef4444"
+
+
+def formatter(field, fmt):
+    if fmt == "colour":
+        return lambda r: colour(getattr(r, field))
+    return lambda r: fmt.format(getattr(r, field))
+
+
+def records(esp_idle):
+    out = []
+    for i in range(0, TICKS * EVERY, EVERY):
+        rec = decode_frame(make_json_packet(i).rstrip(b"\n"))
+        if esp_idle:
+            rec = rec._replace(esp_tag=0, esp_yaw=0.0, esp_pitch=0.0, esp_roll=0.0, esp_x=0.0, esp_y=0.0, esp_z=0.0)
+        out.append(rec)
+    return out
+
+
+def main():
+    tcl = tkinter.Tcl()
+    variables = [tkinter.StringVar(master=tcl) for _ in LABELS]
+    formats = [formatter(f, fmt) for f, fmt in LABELS]
+
+    def legacy(recs):
+        for rec in recs:
+            for var, fmt in zip(variables, formats):
+                var.set(fmt(rec))
+
+    for esp_idle in (False, True):
+        recs = records(esp_idle)
+        view = LabelViewModel()
+        for var, fmt in zip(variables, formats):
+            view.bind(var.set, fmt)
+
+        def dirty():
+            view.invalidate()
+            for rec in recs:
+                view.render(rec)
+
+        t_legacy = best_of(lambda: legacy(recs), 3) / TICKS
+        t_dirty = best_of(dirty, 3) / TICKS
+        per_tick = view.total_updates / view.frames
+        print(f"{'ESP idle ' if esp_idle else 'simulator'}: legacy {len(LABELS)} sets/tick {t_legacy * 1e6:6.1f} us | "
+              f"view-model {per_tick:4.1f} sets/tick {t_dirty * 1e6:6.1f} us")
+
+
+if __name__ == "__main__":
+    main()
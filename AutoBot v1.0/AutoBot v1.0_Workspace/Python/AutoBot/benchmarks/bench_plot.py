@@ -0,0 +1,107 @@
+# benchmarks/bench_plot.py
+"""
+Yaw graph render cost per frame, offscreen on Agg (no Tk needed):
+  - legacy: ax.cla(), rebuild grid/title/ticks, ax.plot(history), canvas.draw()
+  - blit:   BlitPlot.update() - restore cached background, draw the line, blit
+Both run the same 90-point history and figure as autobot/gui/app.py, in manual
+(-180..180) and Auto scale; the blit run also reports how many full redraws
+the autoscale limits caused.
+"""
+
+import math
+import random
+import sys
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+
+from autobot.gui.plot import BlitPlot, autoscale_limits  # noqa: E402
+from autobot.gui.series import SeriesRing  # noqa: E402
+
+FRAMES = 300
+MAX_POINTS = 90
+YAW_SCALE_MARGIN = 10.0
+
+
+def make_axes():
+    fig = Figure(figsize=(4, 4), dpi=100)
+    fig.patch.set_facecolor("#111111")
+    ax = fig.add_subplot(111)
+    ax.set_facecolor("black")
+    ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.4)
+    ax.tick_params(colors="white")
+    ax.set_title("Yaw (recent)", color="white", fontsize=12)
+    ax.set_ylim(-180, 180)
+    fig.subplots_adjust(left=0.08, right=0.98, top=0.92, bottom=0.12)
+    return FigureCanvasAgg(fig), ax
+
+
+def yaw_samples(n):
+    rnd = random.Random(1)
+    return [60 * math.sin(i / 40) + rnd.uniform(-2, 2) for i in range(n)]
+
+
+def legacy_limits(history, auto):
+    if auto and history:
+        ymin = min(history) - YAW_SCALE_MARGIN
+        ymax = max(history) + YAW_SCALE_MARGIN
+        if abs(ymax - ymin) < 2:
+            ymin -= 10
+            ymax += 10
+        return ymin, ymax
+    return -180, 180
+
+
+def run_legacy(samples, auto):
+    canvas, ax = make_axes()
+    history = []
+    t0 = time.perf_counter()
+    for y in samples:
+        history.append(y)
+        if len(history) > MAX_POINTS:
+            history.pop(0)
+        ax.cla()
+        ax.set_facecolor("black")
+        ax.grid(True, linestyle="--", linewidth=0.5, alpha=0.4)
+        ax.plot(history, linewidth=2)
+        ax.tick_params(colors="white")
+        ax.set_title("Yaw (recent)", color="white", fontsize=12)
+        ax.set_ylim(*legacy_limits(history, auto))
+        ax.set_xlim(0, MAX_POINTS)
+        canvas.draw()
+    return (time.perf_counter() - t0) / len(samples), len(samples)
+
+
+def run_blit(samples, auto):
+    canvas, ax = make_axes()
+    plot = BlitPlot(canvas, ax, MAX_POINTS, linewidth=2)
+    history = SeriesRing(MAX_POINTS)
+    t0 = time.perf_counter()
+    for y in samples:
+        history.append(y)
+        if auto:
+            plot.set_ylim(*autoscale_limits(history.min(), history.max(), YAW_SCALE_MARGIN))
+        plot.update(history.values())
+    return (time.perf_counter() - t0) / len(samples), plot.full_draws
+
+
+def main():
+    samples = yaw_samples(FRAMES)
+    worst = math.inf
+    for auto in (False, True):
+        legacy, _ = run_legacy(samples, auto)
+        blit, full = run_blit(samples, auto)
+        speedup = legacy / blit
+        worst = min(worst, speedup)
+        print(f"{'auto  ' if auto else 'manual'}: legacy {legacy * 1e3:6.2f} ms/frame | "
+              f"blit {blit * 1e3:6.3f} ms/frame ({full} full draws / {FRAMES}) | {speedup:5.1f}x")
+    sys.exit(0 if worst >= 10 else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# benchmarks/bench_recordlog.py
+"""
+Random access for replay: CSV log vs fixed-record log (autobot/sinks/recordlog.py)
+for a simulated session of ROWS records at 100 Hz (~50 min).
+  - write: logger-thread CPU per row through each logger's _open / _write
+  - seek to sample N (middle / last): CSV skips N lines from the top,
+    RecordLog indexes the mapping
+  - seek to time T: CSV parses timestamps until one is >= T, RecordLog bisects
+  - analytics: mean yaw over the whole session, CSV parsed vs the numpy view
+Every RecordLog answer is checked against the CSV one.
+"""
+
+import csv
+import itertools
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.schema import CSV_HEADER
+from autobot.simulator import make_json_packet
+from autobot.sinks.csv_log import CsvLogger
+from autobot.sinks.recordlog import RecordLog, RecordLogger
+
+ROWS = 300_000
+RATE = 100
+YAW = CSV_HEADER.index("Yaw")
+
+
+def session(n):
+    t0 = time.monotonic_ns()
+    return [(t0 + i * 1_000_000_000 // RATE, decode_frame(make_json_packet(i).rstrip(b"\n"))) for i in range(n)]
+
+
+def write(logger, rows):
+    cpu0 = time.process_time()
+    f, writer = logger._open()
+    for i in range(0, len(rows), RATE):
+        logger._write(f, writer, rows[i:i + RATE])
+    f.close()
+    return (time.process_time() - cpu0) / len(rows)
+
+
+def csv_row(path, n):
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(itertools.islice(csv.reader(f), n + 1, None))
+
+
+def csv_index_at(path, t_text):
+    # CSV timestamps are fixed-width local time text, so they compare as strings
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        for i, row in enumerate(reader):
+            if row[0] >= t_text:
+                return i
+    return None
+
+
+def csv_mean_yaw(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader)
+        return float(np.mean(np.array([row[YAW] for row in reader], dtype=np.float64)))
+
+
+def timed(fn, repeat=1):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    rows = session(ROWS)
+    tmp = tempfile.mkdtemp()
+    ok = True
+    try:
+        csv_path = os.path.join(tmp, "log.csv")
+        rec_path = os.path.join(tmp, "log.rlog")
+        cpu_csv = write(CsvLogger(csv_path), rows)
+        cpu_rec = write(RecordLogger(rec_path), rows)
+        print(f"write: CSV {cpu_csv * 1e6:5.2f} us/row, {os.path.getsize(csv_path) / ROWS:5.1f} B/row | "
+              f"record log {cpu_rec * 1e6:5.2f} us/row, {os.path.getsize(rec_path) / ROWS:5.1f} B/row")
+
+        log = RecordLog(rec_path)
+        for n in (ROWS // 2, ROWS - 1):
+            t_csv, row = timed(lambda: csv_row(csv_path, n))
+            t_rec, (_, rec) = timed(lambda: log[n], 1000)
+            ok &= int(row[1]) == rec.left
+            print(f"sample {n:6d}: CSV {t_csv * 1e3:7.1f} ms | record log {t_rec * 1e6:6.2f} us")
+
+        n = ROWS * 3 // 4
+        t_target = log.time_ns(n) - 1000
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            t_text = next(itertools.islice(csv.reader(f), n + 1, None))[0]
+        t_csv, i_csv = timed(lambda: csv_index_at(csv_path, t_text))
+        t_rec, i_rec = timed(lambda: log.index_at(t_target), 1000)
+        ok &= i_csv == i_rec == n
+        print(f"time -> sample {n}: CSV {t_csv * 1e3:7.1f} ms | record log {t_rec * 1e6:6.2f} us")
+
+        t_csv, yaw_csv = timed(lambda: csv_mean_yaw(csv_path))
+        t_rec, yaw_rec = timed(lambda: float(log.array()["yaw"].mean(dtype=np.float64)), 5)
+        ok &= abs(yaw_csv - yaw_rec) < 1e-6
+        print(f"mean yaw of {ROWS} samples: CSV {t_csv * 1e3:7.1f} ms | numpy view {t_rec * 1e3:6.2f} ms "
+              f"(view owns data: {log.array().flags.owndata})")
+        log.close()
+    finally:
+        shutil.rmtree(tmp)
+    print("answers match:", bool(ok))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_rotation.py
+"""
+CsvLogger rotation (autobot/sinks/rotation.py) on a simulated session of ROWS
+records, written in the logger thread's 1 s batches through _write /
+_rotation_due / _rotate:
+  - one file (no rotation)
+  - 4 MB segments, gzip on the background SegmentCompressor
+  - 4 MB segments, gzip inline (waiting for the compressor after each rotation,
+    i.e. what compressing on the write path would cost)
+Per mode: worst and 99th percentile time for one batch (write + rotation),
+segments and bytes on disk. Then iter_log_rows() streams the whole log back
+across segment boundaries and the row count is checked.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from autobot.ingest.binary import decode_frame
+from autobot.simulator import make_json_packet
+from autobot.sinks.csv_log import CsvLogger
+from autobot.sinks.rotation import iter_log_rows, log_segments
+
+ROWS = 200_000
+RATE = 100
+SEGMENT_BYTES = 4_000_000
+
+
+def session(n):
+    t0 = time.monotonic_ns()
+    return [(t0 + i * 1_000_000_000 // RATE, decode_frame(make_json_packet(i).rstrip(b"\n"))) for i in range(n)]
+
+
+def write(logger, rows, inline=False):
+    batch = int(logger.batch_interval * RATE)
+    f, writer = logger._open()
+    times = []
+    for i in range(0, len(rows), batch):
+        t0 = time.perf_counter()
+        logger._write(f, writer, rows[i:i + batch])
+        if logger._rotation_due(f):
+            f, writer = logger._rotate(f)
+            if inline:
+                logger.compressor.join()
+        times.append(time.perf_counter() - t0)
+    f.close()
+    if logger.compressor is not None:
+        logger.compressor.join()
+    times.sort()
+    return times[-1], times[int(len(times) * 0.99)]
+
+
+def disk_bytes(path):
+    return sum(os.path.getsize(p) for p in log_segments(path))
+
+
+def main():
+    rows = session(ROWS)
+    tmp = tempfile.mkdtemp()
+    ok = True
+    try:
+        for name, kwargs, inline in (("one file", {}, False),
+                                     ("rotate, background gzip", {"max_bytes": SEGMENT_BYTES}, False),
+                                     ("rotate, inline gzip", {"max_bytes": SEGMENT_BYTES}, True)):
+            path = os.path.join(tmp, name.replace(" ", "_").replace(",", ""), "Autobot_Log.csv")
+            logger = CsvLogger(path, **kwargs)
+            worst, p99 = write(logger, rows, inline)
+            segments = len(log_segments(path))
+            t0 = time.perf_counter()
+            count = sum(1 for _ in iter_log_rows(path))
+            t_read = time.perf_counter() - t0
+            ok &= count == ROWS
+            print(f"{name:24s}: batch write worst {worst * 1e3:6.1f} ms, p99 {p99 * 1e3:5.1f} ms | "
+                  f"{segments:2d} segment(s), {disk_bytes(path) / 1e6:5.1f} MB on disk | "
+                  f"read back {count} rows in {t_read:.2f} s")
+            if logger.compressor is not None:
+                logger.compressor.close()
+    finally:
+        shutil.rmtree(tmp)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_series.py
+"""
+Per-frame cost of keeping a live series and its autoscale range as the window
+grows from the GUI's 90 points to tens of thousands:
+  - legacy: list.append + pop(0) + min() + max()
+  - SeriesRing: append + min() + max() + values()
+both starting from a full window, as in a long session.
+Also checks SeriesRing's window and running extremes against NumPy.
+"""
+
+import random
+import sys
+import time
+
+import numpy as np
+
+from autobot.gui.series import SeriesRing
+
+SAMPLES = 5000
+CAPACITIES = (90, 1000, 10000, 50000)
+
+
+def check(capacity, samples):
+    ring = SeriesRing(capacity)
+    for i, v in enumerate(samples):
+        ring.append(v)
+        window = np.asarray(samples[max(0, i + 1 - capacity):i + 1])
+        if not (np.array_equal(ring.values(), window) and ring.min() == window.min() and ring.max() == window.max()):
+            return False
+    return True
+
+
+def run_legacy(capacity, samples):
+    history = [0.0] * capacity      # already full, as in a long session
+    t0 = time.perf_counter()
+    for v in samples:
+        history.append(v)
+        if len(history) > capacity:
+            history.pop(0)
+        min(history)
+        max(history)
+    return (time.perf_counter() - t0) / len(samples)
+
+
+def run_ring(capacity, samples):
+    ring = SeriesRing(capacity)
+    ring.extend([0.0] * capacity)
+    t0 = time.perf_counter()
+    for v in samples:
+        ring.append(v)
+        ring.min()
+        ring.max()
+        ring.values()
+    return (time.perf_counter() - t0) / len(samples)
+
+
+def main():
+    rnd = random.Random(1)
+    samples = [rnd.uniform(-180, 180) for _ in range(SAMPLES)]
+    ok = all(check(cap, samples[:600]) for cap in (1, 7, 90))
+    print(f"SeriesRing matches NumPy window/min/max: {ok}")
+
+    for cap in CAPACITIES:
+        legacy = min(run_legacy(cap, samples) for _ in range(3))
+        ring = min(run_ring(cap, samples) for _ in range(3))
+        print(f"capacity {cap:6d}: legacy {legacy * 1e6:9.2f} us/frame | SeriesRing {ring * 1e6:6.2f} us/frame")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
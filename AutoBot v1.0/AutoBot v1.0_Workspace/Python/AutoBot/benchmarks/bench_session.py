@@ -0,0 +1,133 @@
+# benchmarks/bench_session.py
+"""
+Whole-session yaw graph: a 2 h run at 100 Hz (720k samples), offscreen on Agg.
+  - live feed: ChannelHistory.pull() cost per 50 ms tick with the session pyramid
+  - load: load_csv_session() on a CsvLogger-format file of the same run
+  - view change: SessionPlot fit / zoom / pan (pyramid query + full redraw)
+    and the pyramid query alone
+  - naive: ax.plot() of every sample + draw, and a draw after set_xlim on it
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+
+from autobot.gui.channels import ChannelHistory  # noqa: E402
+from autobot.gui.plot import SessionPlot  # noqa: E402
+from autobot.gui.pyramid import SessionSeries, load_csv_session  # noqa: E402
+from autobot.ingest.clock import ANCHOR  # noqa: E402
+from autobot.ingest.schema import CSV_HEADER, EMPTY_RECORD  # noqa: E402
+
+RATE = 100
+SECONDS = 2 * 3600
+N = RATE * SECONDS
+PERIOD_NS = 1_000_000_000 // RATE
+PER_TICK = 5
+
+
+def yaw_signal(n):
+    i = np.arange(n)
+    return (((i * 0.05) % 360) - 180 + 20 * np.sin(i / 3000)).astype(np.float32)
+
+
+def make_axes():
+    fig = Figure(figsize=(10, 4.5), dpi=100)
+    ax = fig.add_subplot(111)
+    return FigureCanvasAgg(fig), ax
+
+
+def bench_live(yaw):
+    history = ChannelHistory()
+    records = [EMPTY_RECORD._replace(yaw=float(y)) for y in yaw[:20000]]
+    ticks = 2000
+    t = 0.0
+    for k in range(ticks):
+        for j in range(PER_TICK):
+            i = k * PER_TICK + j
+            history.submit(records[i % len(records)], i * PERIOD_NS)
+        t0 = time.perf_counter()
+        history.pull()
+        t += time.perf_counter() - t0
+    return t / ticks
+
+
+def write_csv(path, yaw):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        base = list(EMPTY_RECORD)
+        yaw_col = CSV_HEADER.index("Yaw") - 1
+        for i, y in enumerate(yaw):
+            base[yaw_col] = f"{y:.2f}"
+            writer.writerow([ANCHOR.format(i * PERIOD_NS), *base])
+
+
+def time_call(fn):
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main():
+    yaw = yaw_signal(N)
+    print(f"session: {SECONDS // 3600} h at {RATE} Hz = {N} samples")
+    print(f"live pull() with session pyramid: {bench_live(yaw) * 1e6:.1f} us per {PER_TICK}-frame tick")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "session.csv")
+        write_csv(path, yaw)
+        t0 = time.perf_counter()
+        loaded = load_csv_session(path)
+        print(f"load_csv_session: {time.perf_counter() - t0:.2f} s for {len(loaded)} rows")
+
+    session = SessionSeries(("yaw",))
+    t0 = time.perf_counter()
+    session.extend(np.arange(N, dtype=np.int64) * PERIOD_NS, {"yaw": yaw})
+    print(f"pyramid build from arrays: {(time.perf_counter() - t0) * 1e3:.1f} ms")
+
+    canvas, ax = make_axes()
+    plot = SessionPlot(canvas, ax, session, "yaw", linewidth=1)
+    views = [plot.fit]
+    x0, x1 = 0.0, SECONDS
+    for _ in range(12):     # zoom into the middle
+        c = (x0 + x1) / 2
+        x0, x1 = c - (c - x0) / 2, c + (x1 - c) / 2
+        views.append(lambda a=x0, b=x1: plot.set_view(a, b))
+    for k in range(5):      # pan at the deepest zoom
+        shift = (x1 - x0) / 3 * (k + 1)
+        views.append(lambda a=x0 + shift, b=x1 + shift: plot.set_view(a, b))
+    times, points = [], []
+    for fn in views:
+        times.append(time_call(fn))
+        points.append(len(plot.line.get_xdata()))
+    worst_view = max(times)
+    t0, t1 = session.span_ns()
+    query = min(time_call(lambda: session.query("yaw", t0, t1, 1000)) for _ in range(20))
+    print(f"SessionPlot view changes: median {sorted(times)[len(times) // 2] * 1e3:.1f} ms, "
+          f"worst {worst_view * 1e3:.1f} ms (<= {max(points)} points drawn); "
+          f"pyramid query for the whole session {query * 1e6:.0f} us")
+
+    canvas, ax = make_axes()
+    x = np.arange(N) / RATE
+    naive_first = time_call(lambda: (ax.plot(x, yaw, linewidth=1), canvas.draw()))
+    ax.set_xlim(SECONDS / 2 - 10, SECONDS / 2 + 10)
+    naive_zoom = time_call(canvas.draw)
+    ax.set_xlim(0, SECONDS)
+    naive_fit = time_call(canvas.draw)
+    print(f"naive: plot+draw {naive_first * 1e3:.0f} ms, redraw full view {naive_fit * 1e3:.0f} ms, "
+          f"redraw 20 s view {naive_zoom * 1e3:.0f} ms")
+    sys.exit(0 if worst_view < naive_fit else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# benchmarks/bench_shm.py
+"""
+GIL contention: a GUI-like consumer that spends 40 ms of every 50 ms tick inside
+one C call that holds the GIL (like a slow Agg yaw_canvas.draw()) next to
+  - an in-process reader thread (as in autobot_gui_logger.py), vs
+  - the IngestProcess + shared-memory ring.
+The simulator runs at 921600 baud in a child process; the pty holds only ~4 KB,
+so a starved reader shows up as backpressure (fewer packets delivered) and as
+long gaps between reads.
+"""
+
+import subprocess
+import sys
+import threading
+import time
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.clock import now_ns
+from autobot.ingest.framing import TelemetryFramer
+from autobot.ingest.reader import ChunkReader
+from autobot.ingest.shm import IngestProcess
+
+SECONDS = 4.0
+BAUD = 921600
+
+
+def calibrate_render(ms):
+    # sum(range(n)) is a single C call: no GIL switch until it returns
+    n = 100000
+    t0 = time.perf_counter()
+    sum(range(n))
+    return max(1, int(n * ms / 1000 / (time.perf_counter() - t0)))
+
+
+RENDER_N = calibrate_render(40)
+
+
+def gui_loop(stop, poll):
+    while not stop.is_set():
+        sum(range(RENDER_N))  # render
+        poll()
+        time.sleep(0.01)  # idle part of the 50 ms tick
+
+
+def start_simulator():
+    p = subprocess.Popen([sys.executable, "-m", "autobot.simulator", "--rate", "0", "--baud", str(BAUD)],
+                         stdout=subprocess.PIPE, text=True)
+    return p, p.stdout.readline().split(" on ")[1].split()[0]
+
+
+def run_thread(path):
+    stop = threading.Event()
+    got = [0]
+    gaps = []
+
+    def reader():
+        port = open(path, "rb", buffering=0)
+        chunk_reader = ChunkReader(port)
+        framer = TelemetryFramer()
+        last = time.perf_counter()
+
+        def on_frame(frame):
+            try:
+                decode_frame(frame)
+                got[0] += 1
+            except ValueError:
+                pass
+
+        while not stop.is_set():
+            chunk = chunk_reader.read()
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+            if chunk:
+                framer.feed(chunk, on_frame)
+        port.close()
+
+    th = threading.Thread(target=reader, daemon=True)
+    th.start()
+    t = threading.Thread(target=gui_loop, args=(stop, lambda: None), daemon=True)
+    t.start()
+    time.sleep(SECONDS)
+    stop.set()
+    th.join()
+    t.join()
+    return got[0], max(gaps) * 1e3
+
+
+def run_process(path):
+    ingest = IngestProcess(path).start()
+    stop = threading.Event()
+    consumed = [0, 0]
+    last = [0]
+    ages = []
+
+    def poll():
+        recs, last[0], lost = ingest.ring.read_since(last[0])
+        consumed[0] += len(recs)
+        consumed[1] += lost
+        if len(recs):
+            ages.extend((now_ns() - recs["rx_ns"]).tolist())
+
+    time.sleep(0.3)
+    first = ingest.ring.write_seq
+    last[0] = first
+    t = threading.Thread(target=gui_loop, args=(stop, poll), daemon=True)
+    t.start()
+    time.sleep(SECONDS)
+    stop.set()
+    t.join()
+    produced = ingest.ring.write_seq - first
+    ingest.stop()
+    ages.sort()
+    age_ms = (ages[len(ages) // 2] / 1e6, ages[-1] / 1e6) if ages else (0.0, 0.0)
+    return produced, consumed[0], consumed[1], age_ms
+
+
+def main():
+    sim, path = start_simulator()
+    try:
+        got, gap = run_thread(path)
+        print(f"reader thread + busy GUI : {got / SECONDS:7.0f} packets/s, longest read gap {gap:6.1f} ms")
+        produced, consumed, lost, (age_p50, age_max) = run_process(path)
+        print(f"ingest process + shm ring: {produced / SECONDS:7.0f} packets/s, "
+              f"GUI consumed {consumed} by seq, lost {lost}")
+        print(f"  receive -> GUI age (rx_ns): p50 {age_p50:.1f} ms, max {age_max:.1f} ms")
+        print(f"wire limit at {BAUD} baud: {BAUD / 10 / 270:.0f} packets/s")
+    finally:
+        sim.terminate()
+        sim.wait()
+
+
+if __name__ == "__main__":
+    main()
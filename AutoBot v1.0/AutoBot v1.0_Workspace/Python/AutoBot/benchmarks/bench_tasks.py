@@ -0,0 +1,121 @@
+# benchmarks/bench_tasks.py
+"""
+End-to-end task dispatch latency against MemoryBackend (autobot/cloud/memory.py):
+time from the dispatcher's PickUpBlock / DropBlock write to the value reaching
+the "Tk thread", which takes it from a LatestSlot every 50 ms as
+AutobotGui.update_blocks does.
+Legacy: get() of the whole /AUTOBOT/AUTOBOT node every 0.5 s.
+Streaming: BlockListener on listen().
+Meanwhile the battery is written at 2 Hz and the node carries a task log, so
+the subtree is not just the two keys. Also reports the JSON bytes received.
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+
+from autobot.cloud.firebase import BATTERY_PATH, ROOT_PATH, BlockListener
+from autobot.cloud.memory import MemoryBackend
+from autobot.ingest.buffers import LatestSlot
+
+LATENCY = 0.04
+POLL_INTERVAL = 0.5
+GUI_POLL_S = 0.05
+TASKS = 20
+LOG_ENTRIES = 200
+
+
+def make_backend():
+    log = {f"t{i:04d}": {"pickup": i % 8, "drop": (i + 3) % 8, "done": True} for i in range(LOG_ENTRIES)}
+    return MemoryBackend({"AUTOBOT": {"AUTOBOT": {"PickUpBlock": 0, "DropBlock": 0, "Battery": "80%", "Log": log}}},
+                         latency=LATENCY)
+
+
+def legacy_listener(backend, on_change, stop, received):
+    prev = None
+    while not stop.is_set():
+        data = backend.get(ROOT_PATH) or {}
+        received[0] += len(json.dumps(data))
+        blocks = (data.get("PickUpBlock", "-"), data.get("DropBlock", "-"))
+        if blocks != prev:
+            prev = blocks
+            on_change(*blocks)
+        time.sleep(POLL_INTERVAL)
+
+
+def run(streaming):
+    backend = make_backend()
+    slot = LatestSlot()
+    stop = threading.Event()
+    received = [0]
+    if streaming:
+        listener = BlockListener(backend, lambda p, d: slot.publish((p, d)))
+        on_event = listener._on_event
+
+        def counted(event):
+            received[0] += len(json.dumps(event.data))
+            on_event(event)
+        listener._on_event = counted
+        listener.start()
+    else:
+        threading.Thread(target=legacy_listener, args=(backend, lambda p, d: slot.publish((p, d)), stop, received),
+                         daemon=True).start()
+
+    def battery():
+        pct = 80
+        while not stop.wait(0.5):
+            pct -= 1
+            backend.set(BATTERY_PATH, f"{pct}%")
+    threading.Thread(target=battery, daemon=True).start()
+
+    written = {}
+
+    def dispatcher():
+        rng = random.Random(1)
+        time.sleep(0.3)
+        for task in range(1, TASKS + 1):
+            written[task] = time.monotonic()
+            backend.update(ROOT_PATH, {"PickUpBlock": task, "DropBlock": task + 100})
+            time.sleep(rng.uniform(0.1, 0.6))
+    writer = threading.Thread(target=dispatcher, daemon=True)
+    writer.start()
+
+    latencies = []
+    seen = 0
+    deadline = None
+    while len(latencies) < TASKS:
+        if deadline is None and not writer.is_alive():
+            deadline = time.monotonic() + 2.0
+        if deadline is not None and time.monotonic() > deadline:
+            break
+        newer = slot.get_if_newer(seen)
+        if newer:
+            seen, (pickup, drop) = newer
+            if pickup in written and drop == pickup + 100:
+                latencies.append(time.monotonic() - written[pickup])
+        time.sleep(GUI_POLL_S)
+    stop.set()
+    if streaming:
+        listener.stop()
+    return sorted(latencies), received[0]
+
+
+def main():
+    results = {}
+    for streaming in (False, True):
+        lat, received = run(streaming)
+        results[streaming] = lat
+        name = "streaming listen()" if streaming else "legacy 0.5 s get()"
+        if lat:
+            print(f"{name}: {len(lat):2d}/{TASKS} tasks seen, latency median {lat[len(lat) // 2] * 1e3:5.0f} ms, "
+                  f"max {lat[-1] * 1e3:5.0f} ms, {received / 1024:7.1f} KiB received")
+        else:
+            print(f"{name}: no tasks seen")
+    ok = len(results[True]) == TASKS and results[True][-1] < results[False][len(results[False]) // 2]
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
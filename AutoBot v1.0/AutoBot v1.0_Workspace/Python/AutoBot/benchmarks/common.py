@@ -0,0 +1,32 @@
+# benchmarks/common.py
+"""
+Shared helpers for the telemetry benchmarks.
+Run any benchmark from the Python/AutoBot directory, e.g.
+    python -m benchmarks.bench_framing
+"""
+
+import time
+
+from autobot.simulator import make_json_packet, make_packet
+
+
+def make_stream(n, fmt="json"):
+    return b"".join(make_packet(i, fmt) for i in range(n))
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def bytes_per_ms(baud):
+    # 8N1: 10 bit times per byte
+    return max(1, baud // 10 // 1000)
+
+
+def best_of(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
@@ -0,0 +1,2 @@
+# conftest.py
+"""pytest configuration: run `python -m pytest tests` from the Python/AutoBot directory."""
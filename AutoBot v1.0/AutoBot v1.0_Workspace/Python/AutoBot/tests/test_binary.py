@@ -0,0 +1,67 @@
+# tests/test_binary.py
+"""COBS, CRC-16 and the binary telemetry frame round trip."""
+
+import struct
+from binascii import crc_hqx
+
+import pytest
+
+from autobot.ingest.binary import (BINARY_VERSION, PAYLOAD_SIZE, cobs_decode, cobs_encode, decode_binary,
+                                   decode_frame, encode_binary)
+from autobot.ingest.schema import decode_packet
+from autobot.simulator import make_json_packet
+
+
+@pytest.mark.parametrize("data", [
+    b"", b"\x00", b"\x00\x00", b"abc", b"a\x00b\x00", b"\x00abc",
+    bytes(range(1, 255)), bytes(range(1, 256)), bytes(600), bytes(range(256)) * 3,
+])
+def test_cobs_round_trip(data):
+    encoded = cobs_encode(data)
+    assert b"\x00" not in encoded
+    assert bytes(cobs_decode(encoded)) == data
+
+
+def test_cobs_rejects_zero_and_truncated_blocks():
+    with pytest.raises(ValueError, match="zero byte"):
+        cobs_decode(b"\x02a\x00b")
+    with pytest.raises(ValueError, match="truncated"):
+        cobs_decode(b"\x05ab")
+    with pytest.raises(ValueError, match="truncated"):
+        cobs_decode(b"\xff" + bytes(range(1, 100)))
+
+
+def test_binary_frame_round_trip_matches_json():
+    for i in range(0, 5000, 97):
+        rec = decode_packet(make_json_packet(i).rstrip(b"\n"))
+        wire = encode_binary(rec)
+        assert wire[0] == wire[-1] == 0 and b"\x00" not in wire[1:-1]
+        assert decode_binary(wire[1:-1]) == rec
+        assert decode_frame(wire[1:-1]) == rec
+
+
+def payload(frame):
+    return bytearray(cobs_decode(frame))
+
+
+def reencode(raw):
+    return cobs_encode(bytes(raw))
+
+
+def test_crc_detects_a_flipped_bit():
+    raw = payload(encode_binary(decode_packet(make_json_packet(3).rstrip(b"\n")))[1:-1])
+    assert len(raw) == PAYLOAD_SIZE
+    raw[5] ^= 0x10
+    with pytest.raises(ValueError, match="CRC"):
+        decode_binary(reencode(raw))
+
+
+def test_wrong_length_and_version_are_rejected():
+    raw = payload(encode_binary(decode_packet(make_json_packet(3).rstrip(b"\n")))[1:-1])
+    with pytest.raises(ValueError, match="expected"):
+        decode_binary(reencode(raw[:-1]))
+
+    body = bytearray(raw[:-2])
+    body[0] = BINARY_VERSION + 1
+    with pytest.raises(ValueError, match="version"):
+        decode_binary(reencode(body + struct.pack("<H", crc_hqx(bytes(body), 0xFFFF))))
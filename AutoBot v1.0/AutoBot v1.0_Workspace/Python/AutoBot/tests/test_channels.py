@@ -0,0 +1,53 @@
+# tests/test_channels.py
+"""ChannelHistory.pull(): every submitted frame lands in the time ring, the channels and the session."""
+
+from autobot.gui.channels import CHANNELS, ChannelHistory
+from autobot.ingest.schema import EMPTY_RECORD
+
+
+def record(i):
+    return EMPTY_RECORD._replace(left=10 * i, right=-i, yaw=float(i), battery_v=3.7)
+
+
+def test_pull_moves_every_frame():
+    history = ChannelHistory(capacity=100, pending=100)
+    assert history.pull() == 0 and len(history) == 0
+    for i in range(30):
+        history.submit(record(i), 1000 + i)
+    assert history.pull() == 30
+    assert len(history) == 30
+    assert history.time.values().tolist() == list(range(1000, 1030))
+    assert history.series["yaw"].values().tolist() == [float(i) for i in range(30)]
+    assert set(history.series) == set(CHANNELS)
+    assert all(len(history.series[name]) == 30 for name in CHANNELS)
+    assert len(history.session) == 30
+
+
+def test_encoder_deltas_continue_across_pulls():
+    history = ChannelHistory(capacity=100, pending=100)
+    for i in range(3):
+        history.submit(record(i), i)
+    history.pull()
+    history.submit(record(5), 5)
+    history.pull()
+    assert history.series["left_delta"].values().tolist() == [0, 10, 10, 30]
+    assert history.series["right_delta"].values().tolist() == [0, -1, -1, -3]
+
+
+def test_history_keeps_the_newest_capacity_frames():
+    history = ChannelHistory(capacity=10, pending=100)
+    for i in range(25):
+        history.submit(record(i), i)
+    history.pull()
+    assert len(history) == 10
+    assert history.time.values().tolist() == list(range(15, 25))
+    assert len(history.session) == 25
+
+
+def test_window_starts_at_the_first_sample_within_the_span():
+    history = ChannelHistory(capacity=100, pending=100)
+    for i in range(10):
+        history.submit(record(i), i * 1_000_000_000)
+    history.pull()
+    assert history.window(3.0) == (6, 9_000_000_000)
+    assert ChannelHistory().window(3.0) == (0, 0)
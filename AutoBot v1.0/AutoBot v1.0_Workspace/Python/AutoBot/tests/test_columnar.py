@@ -0,0 +1,76 @@
+# tests/test_columnar.py
+"""Columnar log round trips at CSV precision; ColumnLogger's options and schema checks."""
+
+import json
+import os
+import time
+
+import numpy as np
+import pytest
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.schema import EMPTY_RECORD, TELEMETRY_FIELDS
+from autobot.simulator import make_json_packet
+from autobot.sinks.columnar import FORMAT, ColumnLog, ColumnLogger
+from autobot.sinks.csv_log import prepare_row_for_csv
+
+FIELDS = [f[0] for f in TELEMETRY_FIELDS]
+
+
+def records(n):
+    t0 = time.monotonic_ns()
+    rows = [(t0 + i * 10_000_000, decode_frame(make_json_packet(i).rstrip(b"\n"))) for i in range(n)]
+    # cumulative wheel angles far past float32's 2-decimal range
+    rows += [(t0 + (n + i) * 10_000_000, EMPTY_RECORD._replace(left_deg=131072.37 + i * 1000.01,
+                                                               right_deg=-21474836.47 + i, yaw=-179.99))
+             for i in range(50)]
+    return rows
+
+
+def test_logger_round_trip_matches_the_csv_text(tmp_path):
+    path = str(tmp_path / "session.acol")
+    rows = records(500)
+    logger = ColumnLogger(path, batch_rows=128)
+    logger.enabled.set()
+    logger.start()
+    for rx_ns, rec in rows:
+        logger.submit(rec, rx_ns)
+    assert logger.close()
+    assert logger.rows == len(rows)
+
+    for columns in (ColumnLog(path).read(), ColumnLog(path).memmap()):
+        for i, (rx_ns, rec) in enumerate(rows):
+            text = prepare_row_for_csv(rx_ns, rec)
+            got = [columns[name][i] for name in FIELDS]
+            # every value reads back as the number the CSV log would hold
+            assert [float(v) for v in got] == [float(v) for v in text[1:]]
+
+
+def test_csv_only_options_are_rejected(tmp_path):
+    for option in ({"max_bytes": 1 << 20}, {"rotate_interval": 60}, {"index_rows": 1000}, {"codec": "gzip"}):
+        with pytest.raises(TypeError):
+            ColumnLogger(str(tmp_path / "x.acol"), **option)
+    logger = ColumnLogger(str(tmp_path / "x.acol"))
+    assert not hasattr(logger, "max_bytes") and not hasattr(logger, "index_rows")
+
+
+def write_v1_log(path):
+    os.makedirs(path)
+    columns = [("time_ns", "int64")] + [(name, "int32" if kind is int else "float32")
+                                        for name, _, _, kind in TELEMETRY_FIELDS]
+    with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"format": FORMAT, "version": 1, "columns": columns}, f)
+    arrays = {name: np.arange(3, dtype=dtype) for name, dtype in columns}
+    np.savez(os.path.join(path, "rg000000-00000003.npz"), **arrays)
+
+
+def test_version_1_logs_still_read_but_are_not_appended_to(tmp_path):
+    path = str(tmp_path / "old.acol")
+    write_v1_log(path)
+    log = ColumnLog(path)
+    assert len(log) == 3
+    assert log.dtypes["yaw"] == np.float32
+    assert log.column("yaw").tolist() == [0.0, 1.0, 2.0]
+    logger = ColumnLogger(path)
+    with pytest.raises(ValueError, match="different schema"):
+        logger._open()
@@ -0,0 +1,89 @@
+# tests/test_csv_log.py
+"""CsvLogger's group commit: close() drains the queue, flush() is a barrier, write errors surface."""
+
+import csv
+
+from autobot.ingest.schema import CSV_HEADER, EMPTY_RECORD
+from autobot.sinks.csv_log import CsvLogger
+
+
+def rows_in(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == CSV_HEADER
+    return rows[1:]
+
+
+def submit(logger, n, start=0):
+    for i in range(start, start + n):
+        logger.submit(EMPTY_RECORD._replace(left=i), 1_000_000 * i)
+
+
+def started(logger):
+    logger.enabled.set()
+    return logger.start()
+
+
+def test_close_writes_everything_still_queued(tmp_path):
+    path = str(tmp_path / "log.csv")
+    # nothing would be committed for a minute on its own
+    logger = started(CsvLogger(path, batch_interval=60.0, batch_rows=5000, index_rows=0))
+    submit(logger, 1234)
+    assert logger.close()
+    assert logger.committed == logger.rows == 1234
+    assert [int(row[1]) for row in rows_in(path)] == list(range(1234))
+    assert not logger.running
+
+
+def test_flush_is_a_barrier(tmp_path):
+    path = str(tmp_path / "log.csv")
+    logger = started(CsvLogger(path, batch_interval=60.0, index_rows=0))
+    try:
+        submit(logger, 10)
+        assert logger.flush(timeout=5.0)
+        assert len(rows_in(path)) == 10
+        submit(logger, 5, start=10)
+        assert logger.flush(timeout=5.0)
+        assert len(rows_in(path)) == 15
+    finally:
+        logger.close()
+
+
+class FlakyLogger(CsvLogger):
+    """Fails the write of every batch that holds a row with left == fail_on."""
+
+    fail_on = 3
+
+    def _write(self, f, writer, rows):
+        if any(rec.left == self.fail_on for _, rec in rows):
+            raise OSError(28, "No space left on device")
+        super()._write(f, writer, rows)
+
+
+def test_write_errors_are_reported_not_committed(tmp_path):
+    path = str(tmp_path / "log.csv")
+    logger = started(FlakyLogger(path, batch_interval=60.0, index_rows=0))
+    try:
+        submit(logger, 5)
+        assert not logger.flush(timeout=5.0)
+        assert (logger.committed, logger.failed) == (0, 5)
+        assert isinstance(logger.error, OSError)
+        assert rows_in(path) == []
+
+        # the logger keeps going; the next flush only reports new failures
+        submit(logger, 5, start=5)
+        assert logger.flush(timeout=5.0)
+        assert (logger.committed, logger.failed) == (5, 5)
+        assert [int(row[1]) for row in rows_in(path)] == list(range(5, 10))
+    finally:
+        # rows were lost in this session
+        assert not logger.close()
+
+
+def test_close_reports_a_failed_last_batch(tmp_path):
+    path = str(tmp_path / "log.csv")
+    logger = started(FlakyLogger(path, batch_interval=60.0, batch_rows=5000, index_rows=0))
+    submit(logger, 10)
+    assert not logger.close()
+    assert (logger.committed, logger.failed) == (0, 10)
+    assert logger.error is not None
@@ -0,0 +1,128 @@
+# tests/test_engine.py
+"""IngestEngine sources, subscribers, reconnects and status; LoggerSink shutdown; EngineLink."""
+
+import csv
+import os
+import time
+
+from autobot.ingest.engine import EngineLink, IngestEngine
+from autobot.ingest.link import open_raw
+from autobot.ingest.schema import CSV_HEADER
+from autobot.simulator import make_json_packet
+from autobot.sinks.aio import LatestSink, LoggerSink
+from autobot.sinks.csv_log import CsvLogger
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def csv_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == CSV_HEADER
+    return rows[1:]
+
+
+def test_every_frame_reaches_subscribers_and_sinks(tmp_path):
+    r, w = os.pipe()
+    got = []
+    engine = IngestEngine()
+    latest = engine.add_sink(LatestSink())
+    logger = CsvLogger(str(tmp_path / "log.csv"))
+    logger.enabled.set()
+    logged = engine.add_sink(LoggerSink(logger))
+    engine.subscribe(lambda record, rx_ns: got.append(record))
+    port = open(r, "rb", buffering=0)
+    engine.add_source("robot", port)
+    engine.start_in_thread()
+    try:
+        os.write(w, b"".join(make_json_packet(i) for i in range(50)))
+        wait_for(lambda: len(got) == 50)
+    finally:
+        engine.stop()
+        engine.join(2.0)
+        os.close(w)
+        port.close()
+    assert engine.frames == engine.cores["robot"].decodes == 50
+    assert engine.errors == 0
+    assert latest.latest["robot"] == got[-1]
+    # stopping the engine closed the logger after its last commit
+    assert logged.complete and not logger.running
+    assert len(csv_rows(tmp_path / "log.csv")) == 50
+
+
+def test_add_port_reopens_after_the_source_closes(tmp_path):
+    path = str(tmp_path / "fifo")
+    os.mkfifo(path)
+    got = []
+    status = []
+    engine = IngestEngine(reconnect=0.05, on_status=lambda name, text: status.append((name, text)))
+    engine.subscribe(lambda record, rx_ns: got.append(record))
+    engine.add_port("fifo", open_raw, path)
+    engine.start_in_thread()
+    try:
+        for n in (5, 10):
+            w = os.open(path, os.O_WRONLY)      # blocks until the engine has (re)opened the FIFO
+            os.write(w, b"".join(make_json_packet(i) for i in range(5)))
+            wait_for(lambda: len(got) == n)
+            os.close(w)
+            wait_for(lambda: "fifo" not in engine.sources)
+    finally:
+        engine.stop()
+        engine.join(2.0)
+    # stopped while the next open was still waiting for a writer
+    assert not engine._thread.is_alive()
+    assert engine.frames == 10
+    assert status == [("fifo", "Connected"), ("fifo", "Disconnected")] * 2
+
+
+def test_remove_port_closes_the_source(tmp_path):
+    r, w = os.pipe()
+    engine = IngestEngine(reconnect=0.05)
+    engine.add_port("pipe", lambda: open(r, "rb", buffering=0))
+    engine.start_in_thread()
+    try:
+        wait_for(lambda: "pipe" in engine.sources)
+        engine.remove_port("pipe")
+        wait_for(lambda: "pipe" not in engine.sources)
+        time.sleep(0.2)         # not reopened
+        assert "pipe" not in engine.sources
+        assert not engine._supervisors
+    finally:
+        engine.stop()
+        engine.join(2.0)
+        os.close(w)
+
+
+def test_engine_link_connects_reads_and_disconnects(tmp_path):
+    path = str(tmp_path / "fifo")
+    os.mkfifo(path)
+    got = []
+    status = []
+    link = EngineLink(opener=open_raw, on_status=status.append)
+    link.core.subscribe(lambda record, rx_ns: got.append(record))
+    try:
+        link.start(path, None)
+        w = os.open(path, os.O_WRONLY)
+        wait_for(link.connected.is_set)
+        os.write(w, b"".join(make_json_packet(i) for i in range(5)))
+        wait_for(lambda: len(got) == 5)
+        link.stop(timeout=2.0)
+        assert not link.connected.is_set()
+        os.close(w)
+        assert status == ["Connected", "Disconnected"]
+    finally:
+        link.close()
+    assert not link.engine.running
+
+
+def test_stop_before_the_loop_runs():
+    engine = IngestEngine()
+    engine.stop()
+    engine.start_in_thread()
+    engine.join(2.0)
+    assert not engine.running
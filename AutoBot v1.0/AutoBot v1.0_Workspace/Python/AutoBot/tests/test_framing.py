@@ -0,0 +1,115 @@
+# tests/test_framing.py
+"""LineFramer / TelemetryFramer: chunk boundaries, trimming, overflow and startup resync."""
+
+import pytest
+
+from autobot.ingest.framing import LineFramer, TelemetryFramer
+from autobot.simulator import make_binary_packet, make_json_packet
+
+
+def frames_of(framer, *chunks):
+    out = []
+    for chunk in chunks:
+        framer.feed(chunk, lambda view: out.append(bytes(view)))
+    return out
+
+
+def test_line_framer_joins_lines_split_across_chunks():
+    data = b"alpha\nbeta\ngamma\n"
+    for size in (1, 2, 5, len(data)):
+        chunks = [data[i:i + size] for i in range(0, len(data), size)]
+        assert frames_of(LineFramer(), *chunks) == [b"alpha", b"beta", b"gamma"]
+
+
+def test_line_framer_trims_and_skips_blank_lines():
+    framer = LineFramer()
+    assert frames_of(framer, b"  one\r\n\r\n\t\ntwo \n") == [b"one", b"two"]
+    assert framer.frames == 2
+
+
+def test_line_framer_keeps_the_partial_line():
+    framer = LineFramer()
+    assert frames_of(framer, b"one\ntw") == [b"one"]
+    assert len(framer) == 2
+    assert frames_of(framer, b"o\n") == [b"two"]
+
+
+def test_line_framer_custom_delimiter():
+    assert frames_of(LineFramer(delimiter=b";"), b"a;b;") == [b"a", b"b"]
+    with pytest.raises(ValueError):
+        LineFramer(delimiter=b"\r\n")
+
+
+def test_line_framer_drops_an_oversized_line_and_resyncs():
+    framer = LineFramer(max_frame=16)
+    assert frames_of(framer, b"x" * 10, b"x" * 10, b"xx\nok\n") == [b"ok"]
+    assert framer.overflows == 1
+
+
+def test_line_framer_reset_forgets_the_partial_line():
+    framer = LineFramer()
+    frames_of(framer, b"half")
+    framer.reset()
+    assert frames_of(framer, b"whole\n") == [b"whole"]
+
+
+def test_telemetry_framer_splits_mixed_json_and_binary():
+    packets = [make_json_packet(0), make_binary_packet(1), make_binary_packet(2), make_json_packet(3)]
+    data = b"".join(packets)
+    expected = [packets[0].rstrip(b"\n"), packets[1][1:-1], packets[2][1:-1], packets[3].rstrip(b"\n")]
+    for size in (1, 3, 64, len(data)):
+        chunks = [data[i:i + size] for i in range(0, len(data), size)]
+        assert frames_of(TelemetryFramer(), *chunks) == expected
+
+
+def test_telemetry_framer_skips_a_partial_line_after_reset():
+    packet = make_json_packet(7)
+    framer = TelemetryFramer()
+    framer.reset()
+    assert frames_of(framer, packet[40:], packet) == [packet.rstrip(b"\n")]
+    assert framer.frames == 1
+
+
+def test_telemetry_framer_skips_a_partial_binary_frame_after_reset():
+    packet = make_binary_packet(7)
+    framer = TelemetryFramer()
+    framer.reset()
+    # the tail's closing 0x00 is the resync point; the next frame follows immediately
+    assert frames_of(framer, packet[30:] + packet[1:]) == [packet[1:-1]]
+
+
+def test_telemetry_framer_keeps_the_first_frame_after_leading_whitespace():
+    packet = make_json_packet(7)
+    for lead in (b" ", b"\r\n", b"\t \n"):
+        fresh, reopened = TelemetryFramer(), TelemetryFramer()
+        reopened.reset()
+        assert frames_of(fresh, lead + packet) == frames_of(reopened, lead + packet) == [packet.rstrip(b"\n")]
+
+
+def test_telemetry_framer_only_resyncs_after_reset_or_overflow():
+    framer = TelemetryFramer()
+    # a fresh framer has seen no stream to be out of step with: the first line is passed on
+    assert frames_of(framer, b"abc\n{\"a\": 1}\n") == [b"abc", b"{\"a\": 1}"]
+    framer.reset()
+    assert frames_of(framer, b"abc\n{\"a\": 1}\n") == [b"{\"a\": 1}"]
+
+
+def test_telemetry_framer_resyncs_again_after_reset():
+    packet = make_json_packet(1)
+    framer = TelemetryFramer()
+    assert frames_of(framer, packet) == [packet.rstrip(b"\n")]
+    framer.reset()
+    assert frames_of(framer, packet[10:] + packet) == [packet.rstrip(b"\n")]
+
+
+def test_telemetry_framer_starting_on_a_frame_keeps_it():
+    for packet, frame in ((make_json_packet(2), make_json_packet(2).rstrip(b"\n")),
+                          (make_binary_packet(2), make_binary_packet(2)[1:-1])):
+        assert frames_of(TelemetryFramer(), packet) == [frame]
+
+
+def test_telemetry_framer_drops_an_oversized_frame_and_resyncs():
+    framer = TelemetryFramer(max_frame=64)
+    assert frames_of(framer, b"{" + b"x" * 100, b"x" * 10) == []
+    assert framer.overflows == 1
+    assert frames_of(framer, b"xx}\n{\"a\": 1}\n") == [b"{\"a\": 1}"]
@@ -0,0 +1,48 @@
+# tests/test_governor.py
+"""FrameGovernor: max_fps cap, render-cost stretching, idle backoff and the hidden interval."""
+
+import pytest
+
+from autobot.gui.governor import FrameGovernor
+
+
+def ticks(governor, n, tick_s, frames, rendered=True, visible=True, start=0.0):
+    now = start
+    for _ in range(n):
+        now += governor.interval
+        interval = governor.frame_done(tick_s, frames, rendered, visible, now=now)
+    return interval, now
+
+
+def test_never_faster_than_max_fps():
+    governor = FrameGovernor(max_fps=20.0)
+    interval, _ = ticks(governor, 50, 0.001, 100)
+    assert interval == pytest.approx(0.05)
+
+
+def test_slow_render_stretches_the_interval():
+    governor = FrameGovernor(max_fps=20.0, busy_fraction=0.25)
+    interval, _ = ticks(governor, 100, 0.04, 5)
+    # 40 ms renders may use a quarter of the thread
+    assert interval == pytest.approx(0.16, rel=0.01)
+    assert governor.skipped > 0
+
+
+def test_idle_backoff_doubles_up_to_idle_interval_and_snaps_back():
+    governor = FrameGovernor(max_fps=20.0, idle_interval=0.5)
+    _, now = ticks(governor, 10, 0.001, 5)
+    intervals = []
+    for _ in range(6):
+        now += governor.interval
+        intervals.append(governor.frame_done(0.0, 0, False, now=now))
+    assert intervals == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5, 0.5])
+    now += governor.interval
+    # data is back: no longer idle, but paced by the data rate the idle ticks pulled down
+    assert governor.frame_done(0.001, 5, True, now=now) < 0.5
+
+
+def test_hidden_window_uses_the_hidden_interval_and_counts_skipped_frames():
+    governor = FrameGovernor(hidden_interval=1.0)
+    assert governor.frame_done(0.0, 7, False, visible=False, now=1.0) == 1.0
+    assert governor.skipped == 7 and governor.rendered == 0
+    assert governor.delay_ms(0.2) == 800
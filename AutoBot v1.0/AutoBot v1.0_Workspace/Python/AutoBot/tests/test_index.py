@@ -0,0 +1,160 @@
+# tests/test_index.py
+"""Block index round trips: CsvLogger writes it, LogQuery and build_index read it back."""
+
+import json
+import os
+import time
+
+import pytest
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.clock import ANCHOR, parse_wall_text
+from autobot.ingest.schema import CSV_HEADER
+from autobot.simulator import make_json_packet
+from autobot.sinks import csv_log
+from autobot.sinks.csv_log import CsvLogger
+from autobot.sinks.index import BlockIndexer, LogQuery, build_index, index_path, read_index, unindexed_bytes
+from autobot.sinks.rotation import iter_log_rows, log_segments
+
+ROWS = 3000
+RATE = 100
+BLOCK_ROWS = 100
+TAG_ROWS = 250
+TAG = CSV_HEADER.index("ESP_Tag_ID")
+
+
+def session(n):
+    t0 = time.monotonic_ns()
+    return [(t0 + i * 1_000_000_000 // RATE,
+             decode_frame(make_json_packet(i).rstrip(b"\n"))._replace(esp_tag=1 + (i // TAG_ROWS) % 4))
+            for i in range(n)]
+
+
+def write(logger, rows, batch=37):
+    f, writer = logger._open()
+    for i in range(0, len(rows), batch):
+        logger._write(f, writer, rows[i:i + batch])
+        if logger._rotation_due(f):
+            f, writer = logger._rotate(f)
+    f.close()
+    if logger.indexer is not None:
+        logger.indexer.close()
+    if logger.compressor is not None:
+        logger.compressor.join()
+        logger.compressor.close()
+
+
+def full_scan(path, lo, hi, tags):
+    # what LogQuery must return: every row of every segment whose timestamp text is in [lo, hi)
+    return [row for row in iter_log_rows(path)
+            if len(row) == len(CSV_HEADER)
+            and lo <= parse_wall_text(row[0]) < hi and (tags is None or int(row[TAG]) in tags)]
+
+
+@pytest.fixture(scope="module")
+def rows():
+    return session(ROWS)
+
+
+def windows(rows):
+    wall = [ANCHOR.to_wall_ns(rx_ns) for rx_ns, _ in rows]
+    return [(wall[0], wall[-1] + 1, None), (wall[700], wall[1900], None), (wall[700], wall[1900], [2]),
+            (wall[1234], wall[1235], None), (wall[0], wall[-1] + 1, [3, 4])]
+
+
+def test_blocks_cover_the_file(tmp_path, rows):
+    path = str(tmp_path / "log.csv")
+    write(CsvLogger(path, index_rows=BLOCK_ROWS), rows)
+    block_rows, blocks = read_index(path)
+    assert block_rows == BLOCK_ROWS
+    assert [b["rows"] for b in blocks] == [BLOCK_ROWS] * (ROWS // BLOCK_ROWS)
+    with open(path, "rb") as f:
+        header = f.readline()
+    assert blocks[0]["offset"] == len(header)
+    assert all(a["end"] == b["offset"] for a, b in zip(blocks, blocks[1:]))
+    assert blocks[-1]["end"] == os.path.getsize(path)
+    assert all(b["t0"] <= b["t1"] for b in blocks)
+
+
+@pytest.mark.parametrize("max_bytes", [None, 200_000])
+def test_query_matches_a_full_scan(tmp_path, rows, max_bytes):
+    path = str(tmp_path / "log.csv")
+    write(CsvLogger(path, max_bytes=max_bytes, index_rows=BLOCK_ROWS), rows)
+    if max_bytes:
+        assert len(log_segments(path)) > 2
+    for lo, hi, tags in windows(rows):
+        q = LogQuery(path, lo, hi, tags)
+        assert list(q) == full_scan(path, lo, hi, tags)
+        assert q.unindexed == 0
+    q = LogQuery(path, *windows(rows)[2])
+    list(q)
+    assert q.blocks_read < q.blocks_total
+
+
+def test_build_index_matches_the_written_index(tmp_path, rows):
+    path = str(tmp_path / "log.csv")
+    write(CsvLogger(path, index_rows=BLOCK_ROWS), rows)
+    with open(index_path(path), encoding="utf-8") as f:
+        written = f.read()
+    os.remove(index_path(path))
+    assert LogQuery(path).unindexed == 0 and len(list(LogQuery(path))) == ROWS
+    assert build_index(path, BLOCK_ROWS) == ROWS // BLOCK_ROWS
+    with open(index_path(path), encoding="utf-8") as f:
+        rebuilt = f.read()
+    # rebuilt from timestamp text: microsecond resolution
+    before = [json.loads(line) for line in written.splitlines()[1:]]
+    assert [(b["offset"], b["end"], b["tags"]) for b in read_index(path)[1]] == \
+        [(b["offset"], b["end"], b["tags"]) for b in before]
+    assert rebuilt.splitlines()[0] == written.splitlines()[0]
+
+
+def test_indexer_resumes_after_a_torn_sidecar(tmp_path, rows):
+    path = str(tmp_path / "log.csv")
+    write(CsvLogger(path, index_rows=BLOCK_ROWS), rows)
+    _, blocks = read_index(path)
+    with open(index_path(path), "r+", encoding="utf-8") as f:
+        text = f.read()
+        f.seek(0)
+        f.truncate()
+        f.write(text[:len(text) * 2 // 3])     # crash halfway through a block line
+    BlockIndexer(path, BLOCK_ROWS).close()
+    resumed = read_index(path)[1]
+    assert [(b["offset"], b["end"]) for b in resumed] == [(b["offset"], b["end"]) for b in blocks]
+    lo, hi, tags = windows(rows)[2]
+    assert list(LogQuery(path, lo, hi, tags)) == full_scan(path, lo, hi, tags)
+
+
+BAD_ROWS = b"\n2025-11-27 16:55:01,1,2\n"
+
+
+def test_malformed_rows_are_skipped(tmp_path, rows):
+    path = str(tmp_path / "log.csv")
+    write(CsvLogger(path, index_rows=BLOCK_ROWS), rows[:1050])
+    with open(path, "ab") as f:
+        f.write(BAD_ROWS)                  # a blank line and a truncated row, as a crash or an editor leaves
+    os.remove(index_path(path))
+    logger = CsvLogger(path, index_rows=BLOCK_ROWS)
+    write(logger, rows[1050:])              # the logger opens, indexes around them and keeps logging
+    _, blocks = read_index(path)
+    assert sum(b["rows"] for b in blocks) == ROWS + 2
+    assert all(a["end"] == b["offset"] for a, b in zip(blocks, blocks[1:]))
+    for lo, hi, tags in windows(rows):
+        q = LogQuery(path, lo, hi, tags)
+        assert list(q) == full_scan(path, lo, hi, tags)
+    q = LogQuery(path)
+    assert len(list(q)) == ROWS and q.malformed == 2
+
+
+def test_large_unindexed_log_is_not_scanned_on_open(tmp_path, rows, monkeypatch):
+    path = str(tmp_path / "log.csv")
+    write(CsvLogger(path, index_rows=0), rows[:2000])
+    monkeypatch.setattr(csv_log, "INDEX_SCAN_BYTES", unindexed_bytes(path) - 1)
+    logger = CsvLogger(path, max_bytes=10 ** 9, index_rows=BLOCK_ROWS)
+    f, writer = logger._open()
+    assert logger.indexer is None and not os.path.exists(index_path(path))
+    logger._write(f, writer, rows[2000:])
+    f, writer = logger._rotate(f)           # the new file is small again and gets its index
+    assert logger.indexer is not None
+    logger._close(f)
+    q = LogQuery(path)
+    assert len(list(q)) == ROWS and q.unindexed == 1
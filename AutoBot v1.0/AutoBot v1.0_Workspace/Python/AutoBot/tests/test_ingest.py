@@ -0,0 +1,58 @@
+# tests/test_ingest.py
+"""IngestCore decodes every frame once and delivers every record to every subscriber once."""
+
+import pytest
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.buffers import LatestSlot, RecordRing
+from autobot.ingest.core import IngestCore
+from autobot.simulator import FORMATS, make_packet
+
+N_PACKETS = 2000
+
+
+def stream(n, fmt):
+    return b"".join(make_packet(i, fmt) for i in range(n))
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 93, 512, 65536])
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_frames_decodes_and_deliveries_match(fmt, chunk):
+    data = stream(N_PACKETS, fmt)
+    core = IngestCore()
+    gui, cloud = LatestSlot(), LatestSlot()
+    ring = RecordRing(N_PACKETS)
+    core.subscribe(lambda rec, rx_ns: gui.publish(rec))
+    core.subscribe(lambda rec, rx_ns: ring.put((rx_ns, rec)))
+    core.subscribe(lambda rec, rx_ns: cloud.publish(rec))
+    for i in range(0, len(data), chunk):
+        core.feed(data[i:i + chunk])
+    rows = ring.drain()
+    assert core.errors == 0
+    assert (core.frames, core.decodes, gui.version, len(rows), cloud.version) == (N_PACKETS,) * 5
+    assert [rec for _, rec in rows] == [decode_frame(make_packet(i, "json").rstrip(b"\n")) for i in range(N_PACKETS)]
+
+
+def test_a_failing_subscriber_does_not_starve_the_others():
+    core = IngestCore()
+    got = []
+
+    @core.subscribe
+    def broken(rec, rx_ns):
+        raise RuntimeError("boom")
+
+    core.subscribe(lambda rec, rx_ns: got.append(rx_ns))
+    core.feed(stream(10, "mixed"), rx_ns=42)
+    assert got == [42] * 10
+
+
+def test_bad_frames_are_counted_not_delivered():
+    core = IngestCore()
+    got = []
+    core.subscribe(lambda rec, rx_ns: got.append(rec))
+    core.feed(make_packet(0, "json") + b'{"L": oops}\n' + make_packet(1, "binary")[:-3] + b"\x00"
+              + make_packet(2, "json"))
+    assert core.frames == 4
+    assert core.decodes == 4
+    assert core.errors == 2
+    assert len(got) == 2
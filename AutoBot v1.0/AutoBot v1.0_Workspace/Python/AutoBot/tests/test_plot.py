@@ -0,0 +1,66 @@
+# tests/test_plot.py
+"""ColumnMinMax: incremental per-column min/max of a SeriesRing window matches a fresh reduction."""
+
+import numpy as np
+
+from autobot.gui.plot import ColumnMinMax
+from autobot.gui.series import SeriesRing
+
+BINS = 50
+
+
+def expected(ring, i0, per):
+    # every column of `per` samples (aligned to the absolute index) that starts at or after i0
+    values = ring.values()
+    base = ring.count - len(values)
+    starts = np.arange(-(-i0 // per) * per, ring.count, per)
+    chunks = [values[s - base:s - base + per] for s in starts]
+    return (starts, np.minimum(starts + per, ring.count) - 1,
+            np.array([c.min() for c in chunks]), np.array([c.max() for c in chunks]))
+
+
+def check(columns, ring, i0):
+    got = columns.update(ring, i0, BINS)
+    want = expected(ring, i0, columns.per)
+    for g, w in zip(got, want):
+        assert np.array_equal(g, w)
+    return got
+
+
+def test_sliding_window_matches_a_full_reduction():
+    rng = np.random.default_rng(1)
+    ring = SeriesRing(3000)
+    columns = ColumnMinMax()
+    window = 2000
+    for step in (7, 1, 300, 5, 2999, 64, 3):
+        for _ in range(10):
+            ring.extend(rng.normal(size=step))
+            i0 = max(ring.count - len(ring), ring.count - window)
+            first, last, mins, maxs = check(columns, ring, i0)
+            assert len(mins) <= BINS and columns.per * BINS >= ring.count - i0
+
+
+def test_only_new_samples_are_reduced():
+    ring = SeriesRing(10000)
+    ring.extend(np.arange(8000.0))
+    columns = ColumnMinMax()
+    columns.update(ring, 0, BINS)
+    per = columns.per
+    cached = columns.mins
+    ring.extend(np.full(3, -1.0))
+    check(columns, ring, 0)
+    assert columns.per == per
+    # every complete column was carried over; only the newest one changed
+    assert np.array_equal(columns.mins[:-1], cached[:len(columns.mins) - 1])
+    assert columns.mins[-1] == -1.0
+
+
+def test_window_growth_widens_the_columns():
+    ring = SeriesRing(100000)
+    columns = ColumnMinMax()
+    pers = []
+    for _ in range(20):
+        ring.extend(np.ones(5000))
+        check(columns, ring, 0)
+        pers.append(columns.per)
+    assert pers == sorted(pers) and len(set(pers)) < 6
@@ -0,0 +1,54 @@
+# tests/test_pyramid.py
+"""MinMaxPyramid queries and load_csv_session's time axis."""
+
+import time
+
+import numpy as np
+
+from autobot.gui.pyramid import MinMaxPyramid, load_csv_session
+from autobot.ingest.clock import ANCHOR
+from autobot.ingest.schema import EMPTY_RECORD
+from autobot.sinks.csv_log import CsvLogger
+
+
+def test_query_folds_min_and_max_of_every_group():
+    values = np.sin(np.arange(10_000) / 37.0).astype(np.float32)
+    pyramid = MinMaxPyramid()
+    for i in range(0, len(values), 999):     # extend() in uneven batches
+        pyramid.extend(values[i:i + 999])
+    index, value = pyramid.query(1234, 9876, 50)
+    assert len(index) <= 100
+    # whole blocks of the chosen level: the groups cover the range and may overhang it
+    i0, i1 = index[0], index[-1] + 1
+    assert i0 <= 1234 and i1 >= 9876
+    assert value.min() == values[i0:i1].min()
+    assert value.max() == values[i0:i1].max()
+    assert (np.diff(index) >= 0).all()
+
+
+def write_log(path, rows):
+    logger = CsvLogger(path, index_rows=0)
+    f, writer = logger._open()
+    logger._write(f, writer, rows)
+    f.close()
+
+
+def test_load_csv_session_reads_local_wall_time_in_batches(tmp_path):
+    path = str(tmp_path / "log.csv")
+    t0 = time.monotonic_ns()
+    rows = [(t0 + i * 10_000_000, EMPTY_RECORD._replace(yaw=i * 0.25)) for i in range(1000)]
+    write_log(path, rows)
+    # a second run appended to the same file starts earlier than the first one ended
+    write_log(path, [(t0 + 5_000_000_000 + i * 10_000_000, EMPTY_RECORD._replace(yaw=-1.0)) for i in range(300)])
+
+    session = load_csv_session(path, batch_rows=128)
+    assert len(session) == 1300
+    t = session.time.view()
+    # same clock as the Timestamp text and the log index: local time, whole microseconds
+    assert t[0] == ANCHOR.to_wall_ns(t0) // 1000 * 1000
+    assert t[999] - t[0] == 9_990_000_000
+    assert (np.diff(t) >= 0).all()
+    assert (t[1000:] == t[999]).all()
+    yaw = session.series["yaw"].raw.view()
+    assert yaw[:1000].tolist() == [i * 0.25 for i in range(1000)]
+    assert (yaw[1000:] == -1.0).all()
@@ -0,0 +1,52 @@
+# tests/test_reader.py
+"""ChunkReader / IngestCore.run at end of file (USB unplug, FIFO or pipe writer gone)."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from autobot.ingest.core import IngestCore
+from autobot.ingest.reader import ChunkReader, PortClosed
+from autobot.simulator import make_json_packet
+
+
+@pytest.fixture
+def pipe():
+    r, w = os.pipe()
+    port = open(r, "rb", buffering=0)
+    yield port, w
+    port.close()
+    try:
+        os.close(w)
+    except OSError:
+        pass
+
+
+def test_read_raises_at_eof(pipe):
+    port, w = pipe
+    reader = ChunkReader(port, timeout=0.05)
+    assert reader.event_driven
+    assert reader.read() == b""         # quiet port: timeout, not EOF
+    os.write(w, b"abc")
+    assert reader.read() == b"abc"
+    os.close(w)
+    with pytest.raises(PortClosed):
+        reader.read()
+    reader.close()
+
+
+def test_run_exits_when_the_writer_closes(pipe):
+    port, w = pipe
+    core = IngestCore()
+    got = []
+    core.subscribe(lambda rec, rx_ns: got.append(rec))
+    thread = threading.Thread(target=core.run, args=(port, threading.Event(), 0.05), daemon=True)
+    thread.start()
+    os.write(w, make_json_packet(1) + make_json_packet(2))
+    time.sleep(0.1)
+    os.close(w)
+    thread.join(2.0)
+    assert not thread.is_alive()
+    assert len(got) == 2 and core.errors == 0
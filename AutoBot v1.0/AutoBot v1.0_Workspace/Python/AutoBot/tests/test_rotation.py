@@ -0,0 +1,92 @@
+# tests/test_rotation.py
+"""CsvLogger rotation: segments, manifest, background compression, and a restart of the logger."""
+
+import csv
+import gzip
+import json
+import os
+
+from autobot.ingest.schema import CSV_HEADER, EMPTY_RECORD
+from autobot.sinks.csv_log import CsvLogger
+from autobot.sinks.index import LogQuery, index_path
+from autobot.sinks.rotation import SegmentManifest, iter_log_rows, log_segments, manifest_path
+
+MAX_BYTES = 20_000
+BATCH = 100
+
+
+def log(logger, n, start=0):
+    # one flush per batch: the logger checks for rotation after each commit
+    for i in range(start, start + n, BATCH):
+        for j in range(i, min(i + BATCH, start + n)):
+            logger.submit(EMPTY_RECORD._replace(left=j), 1_000_000 * j)
+        assert logger.flush(timeout=5.0)
+
+
+def rotating(path):
+    logger = CsvLogger(path, batch_interval=60.0, max_bytes=MAX_BYTES, index_rows=BATCH)
+    logger.enabled.set()
+    return logger.start()
+
+
+def logged(path):
+    return [int(row[1]) for row in iter_log_rows(path)]
+
+
+def test_rotated_segments_are_compressed_and_listed(tmp_path):
+    path = str(tmp_path / "log.csv")
+    logger = rotating(path)
+    log(logger, 2000)
+    logger.compressor.join()
+    assert logger.close()
+    with open(manifest_path(path), encoding="utf-8") as f:
+        segments = json.load(f)["segments"]
+    assert len(segments) > 2
+    for entry in segments:
+        segment = str(tmp_path / entry["file"])
+        assert segment.endswith(".csv.gz") and not os.path.exists(segment[:-len(".gz")])
+        assert os.path.exists(index_path(segment))
+        with gzip.open(segment, "rt", newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == CSV_HEADER and len(rows) - 1 == entry["rows"]
+        assert entry["first_ns"] <= entry["last_ns"]
+    assert logged(path) == list(range(2000))
+    q = LogQuery(path)
+    assert len(list(q)) == 2000 and q.unindexed == 0
+
+
+def test_rotation_after_close_and_start(tmp_path):
+    path = str(tmp_path / "log.csv")
+    logger = rotating(path)
+    log(logger, 1000)
+    assert logger.close()
+    assert logger.compressor is None
+    logger.start()
+    log(logger, 1000, start=1000)
+    logger.compressor.join()            # a new compressor, so this run's segments get compressed too
+    assert logger.close()
+    files = SegmentManifest(path).files()
+    assert len(files) > 4 and all(p.endswith(".gz") for p in files)
+    assert logged(path) == list(range(2000))
+
+
+def test_uncompressed_segments_are_resumed(tmp_path):
+    path = str(tmp_path / "log.csv")
+    logger = CsvLogger(path, max_bytes=MAX_BYTES, index_rows=0)
+    f, writer = logger._open()
+    logger.compressor.close()           # as if the process died before compressing anything
+    rows = [(1_000_000 * i, EMPTY_RECORD._replace(left=i)) for i in range(600)]
+    for i in range(0, len(rows), BATCH):
+        logger._write(f, writer, rows[i:i + BATCH])
+        if logger._rotation_due(f):
+            f, writer = logger._rotate(f)
+    f.close()
+    logger.compressor._thread.join()
+    closed = log_segments(path)[:-1]
+    assert closed and not any(p.endswith(".gz") for p in closed)
+    restarted = rotating(path)
+    log(restarted, 1, start=600)        # the logger thread has opened the log once this is in
+    restarted.compressor.join()
+    assert restarted.close()
+    assert all(p.endswith(".gz") for p in SegmentManifest(path).files())
+    assert logged(path) == list(range(601))
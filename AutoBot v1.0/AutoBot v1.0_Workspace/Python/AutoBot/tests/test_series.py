@@ -0,0 +1,47 @@
+# tests/test_series.py
+"""SeriesRing: values() is the newest `capacity` samples in order, min() / max() track that window."""
+
+import numpy as np
+import pytest
+
+from autobot.gui.series import SeriesRing
+
+
+def test_window_keeps_the_newest_samples_in_order():
+    ring = SeriesRing(5)
+    ring.extend([1.0, 2.0, 3.0])
+    assert len(ring) == 3 and ring.values().tolist() == [1.0, 2.0, 3.0]
+    ring.extend([4.0, 5.0, 6.0, 7.0])
+    assert len(ring) == 5 and ring.count == 7
+    assert ring.values().tolist() == [3.0, 4.0, 5.0, 6.0, 7.0]
+
+
+def test_min_max_match_the_window():
+    rng = np.random.default_rng(3)
+    ring = SeriesRing(50)
+    data = rng.normal(size=1000)
+    for i, value in enumerate(data):
+        ring.append(value)
+        window = data[max(0, i - 49):i + 1]
+        assert ring.min() == window.min() and ring.max() == window.max()
+
+
+def test_extremes_leave_the_window():
+    ring = SeriesRing(3)
+    ring.extend([100.0, 1.0, 2.0, 3.0])
+    assert ring.max() == 3.0 and ring.min() == 1.0
+
+
+def test_clear_and_int_dtype():
+    ring = SeriesRing(4, np.int64)
+    ring.extend([5, -2])
+    assert ring.values().dtype == np.int64 and ring.min() == -2
+    ring.clear()
+    assert len(ring) == 0
+    ring.append(9)
+    assert ring.values().tolist() == [9] and ring.min() == ring.max() == 9
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        SeriesRing(0)
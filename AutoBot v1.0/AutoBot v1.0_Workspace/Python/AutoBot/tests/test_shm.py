@@ -0,0 +1,149 @@
+# tests/test_shm.py
+"""ShmRing reads by sequence number, torn copies, ProcessLink delivery."""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+from autobot.ingest.binary import decode_frame
+from autobot.ingest.shm import ProcessLink, ShmRing
+from autobot.simulator import make_json_packet
+
+
+@pytest.fixture
+def ring():
+    ring = ShmRing(capacity=16)
+    yield ring
+    ring.close()
+
+
+def record(i):
+    return decode_frame(make_json_packet(i).rstrip(b"\n"))
+
+
+def test_read_since_returns_records_in_order(ring):
+    for i in range(10):
+        ring.write(record(i), 1000 + i)
+    recs, last, lost = ring.read_since(4)
+    assert (last, lost) == (10, 0)
+    assert recs["seq"].tolist() == list(range(5, 11))
+    assert recs["rx_ns"].tolist() == list(range(1004, 1010))
+    assert ring.latest()["seq"] == 10
+
+
+def test_read_since_counts_lapped_records_as_lost(ring):
+    for i in range(40):
+        ring.write(record(i), i)
+    recs, last, lost = ring.read_since(0)
+    assert last == 40
+    assert lost == 40 - len(recs)
+    assert recs["seq"].tolist() == list(range(40 - len(recs) + 1, 41))
+
+
+class TornRecords(np.ndarray):
+    """The writer starts overwriting slot `torn` right after a reader's copy."""
+
+    ring = None
+    torn = None
+
+    def copy(self, *args, **kwargs):
+        out = np.asarray(self).copy(*args, **kwargs)
+        TornRecords.ring._seq_col[TornRecords.torn] = 0
+        return out
+
+
+def test_slot_overwritten_during_the_copy_is_dropped(ring):
+    for i in range(10):
+        ring.write(record(i), i)
+    TornRecords.ring, TornRecords.torn = ring, 7
+    ring.records = ring.records.view(TornRecords)
+    recs, last, lost = ring.read_since(0)
+    assert (last, lost) == (10, 1)
+    assert 7 not in recs["seq"].tolist()
+    assert len(recs) == 9
+
+
+def test_latest_drops_a_torn_copy(ring):
+    for i in range(3):
+        ring.write(record(i), i)
+    TornRecords.ring, TornRecords.torn = ring, 3
+    ring.records = ring.records.view(TornRecords)
+    assert ring.latest() is None
+
+
+class WriteOrder:
+    """Stands in for ShmRing._body: records the slot's seq while the fields are stored."""
+
+    def __init__(self, ring):
+        self.ring, self.body, self.seq_during_write = ring, ring._body, []
+
+    def __setitem__(self, slot, values):
+        self.seq_during_write.append(int(self.ring._seq_col[slot]))
+        self.body[slot] = values
+
+
+def test_write_zeroes_seq_before_the_fields(ring):
+    ring.write(record(0), 0)
+    ring._body = order = WriteOrder(ring)
+    ring.write(record(1), 1)
+    assert order.seq_during_write == [0]
+    assert ring._seq_col[2] == 2 and ring.write_seq == 2
+    recs, _, _ = ring.read_since(0)
+    assert recs["seq"].tolist() == [1, 2]
+    assert recs["rx_ns"].tolist() == [0, 1]
+
+
+class TornWrite(WriteOrder):
+    """A reader copies the ring while the writer is between its seq and field stores."""
+
+    def __setitem__(self, slot, values):
+        self.copy = self.ring.read_since(0)
+        super().__setitem__(slot, values)
+
+
+def test_reader_during_a_write_drops_the_slot(ring):
+    for i in range(16):
+        ring.write(record(i), i)
+    ring._body = torn = TornWrite(ring)
+    ring.write(record(16), 16)              # laps seq 1's slot
+    recs, last, lost = torn.copy
+    # seq 1 is gone (its slot holds seq 0 mid-write), every other copy is whole
+    assert last == 16
+    assert recs["seq"].tolist() == list(range(2, 17))
+    assert lost == 1
+
+
+def test_process_link_delivers_every_record(tmp_path):
+    path = tmp_path / "capture.bin"
+    path.write_bytes(b"".join(make_json_packet(i) for i in range(200)))
+    got = []
+    link = ProcessLink(interval=0.005)
+    link.core.subscribe(lambda rec, rx_ns: got.append(rec))
+    link.start(str(path), None)         # no baud: a plain file, read to the end
+    link.thread.join(10.0)
+    assert not link.thread.is_alive()
+    assert link.core.frames == len(got) == 200
+    assert link.lost == link.core.errors == 0
+    assert got == [record(i) for i in range(200)]
+
+
+def test_process_link_stop_ends_an_idle_ingest_process(tmp_path):
+    path = str(tmp_path / "fifo")
+    os.mkfifo(path)
+    link = ProcessLink(interval=0.005)
+    link.start(path, None)
+    w = os.open(path, os.O_WRONLY)          # open, but the robot sends nothing
+    try:
+        deadline = time.monotonic() + 5.0
+        while not link.connected.is_set():
+            assert time.monotonic() < deadline, "timed out"
+            time.sleep(0.01)
+        process = link.ingest.process
+        link.stop(timeout=5.0)
+        assert not link.thread.is_alive()
+        assert not process.is_alive()
+        assert not link.connected.is_set()
+    finally:
+        os.close(w)
@@ -0,0 +1,42 @@
+# tests/test_viewmodel.py
+"""LabelViewModel: a setter runs only when its text changed, invalidate() forces every one."""
+
+from autobot.gui.viewmodel import LabelViewModel, text_setter
+from autobot.ingest.schema import EMPTY_RECORD
+
+
+class Label:
+    def __init__(self):
+        self.calls = []
+
+    def configure(self, text):
+        self.calls.append(text)
+
+
+def test_only_changed_labels_are_set():
+    left, right = Label(), Label()
+    labels = LabelViewModel()
+    labels.bind(text_setter(left), lambda r: str(r.left))
+    labels.bind(text_setter(right), lambda r: str(r.right))
+    assert len(labels) == 2
+
+    assert labels.render(EMPTY_RECORD._replace(left=1, right=2)) == 2
+    assert labels.render(EMPTY_RECORD._replace(left=1, right=2)) == 0
+    assert labels.render(EMPTY_RECORD._replace(left=1, right=3)) == 1
+    assert left.calls == ["1"] and right.calls == ["2", "3"]
+    assert labels.updates == 1
+    assert labels.frames == 3 and labels.mean_updates() == 1.0
+
+
+def test_invalidate_sets_every_label_again():
+    shown = []
+    labels = LabelViewModel()
+    labels.bind(shown.append, str)
+    labels.render("Connected")
+    labels.invalidate()
+    assert labels.render("Connected") == 1
+    assert shown == ["Connected", "Connected"]
+
+
+def test_mean_updates_before_any_render():
+    assert LabelViewModel().mean_updates() == 0.0